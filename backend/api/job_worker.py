@@ -0,0 +1,172 @@
+"""
+Background Job Workers
+Executes queued optimization, guidance and scoring jobs
+
+Runs in-process inside the API (JOB_WORKERS > 0) or standalone so workers
+scale separately from the API (from the backend directory):
+    python -m api.job_worker --workers 4
+"""
+
+import os
+import time
+import socket
+import logging
+import asyncio
+import argparse
+import threading
+from typing import Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables first: the modules below read their
+# configuration from the environment when they are imported
+load_dotenv()
+
+from services.job_store import JobStore
+from services.executors import llm_executor
+from api.operations import JOB_OPERATIONS, OperationError
+
+logger = logging.getLogger(__name__)
+
+# Worker Configuration
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 1.0))
+
+
+def execute_job(store: JobStore, job_id: str, kind: str, payload: dict, worker: Optional[str] = None):
+    """
+    Run one claimed job and record its outcome
+
+    Args:
+        store: Job store the job was claimed from
+        job_id: Job identifier
+        kind: Operation name from JOB_OPERATIONS
+        payload: Operation keyword arguments
+        worker: Claiming worker; the outcome is dropped if it no longer holds the job
+    """
+    try:
+        operation = JOB_OPERATIONS[kind]
+        store.complete(job_id, operation(**payload), worker)
+    except OperationError as e:
+        store.fail(job_id, {"status_code": e.status_code, "detail": str(e)}, worker)
+    except Exception as e:
+        store.fail(job_id, {"status_code": 500, "detail": f"Job failed: {str(e)}"}, worker)
+
+
+class InProcessWorkerPool:
+    """Asyncio-managed workers that run jobs on the LLM workload pool"""
+
+    def __init__(self, store: JobStore, workers: int = JOB_WORKERS, poll_interval: float = JOB_POLL_INTERVAL):
+        """
+        Initialize the worker pool
+
+        Args:
+            store: Shared job store
+            workers: Number of concurrent jobs
+            poll_interval: Idle wait between queue polls in seconds
+        """
+        self.store = store
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks = []
+
+    def start(self):
+        """Start worker tasks on the running event loop, requeueing jobs left running by this process"""
+        self._wakeup = asyncio.Event()
+        requeued = self.store.recover() + self.store.release(self.prefix)
+        self._tasks = [
+            asyncio.ensure_future(self._run(f"{self.prefix}:{index}"))
+            for index in range(self.workers)
+        ]
+        if self.workers:
+            logger.info("Started %d in-process job workers (%d jobs requeued)", self.workers, requeued)
+
+    async def stop(self):
+        """
+        Cancel worker tasks and requeue the jobs they were running
+
+        A requeued job's unfinished run can no longer record an outcome,
+        so the job runs again in full on the next worker that claims it.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        requeued = await asyncio.to_thread(self.store.release, self.prefix)
+        if requeued:
+            logger.info("Requeued %d running jobs of stopped job workers", requeued)
+
+    def notify(self):
+        """Wake idle workers after a job has been enqueued"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self, worker_name: str):
+        loop = asyncio.get_event_loop()
+        while True:
+            job = await loop.run_in_executor(None, self.store.claim, worker_name)
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # Workers are already bounded by their count, so wait for a slot
+            # instead of being shed like interactive requests
+            job_id, kind, payload = job
+            await llm_executor.run(
+                execute_job, self.store, job_id, kind, payload, worker_name, reject_when_full=False
+            )
+
+
+def run_standalone(workers: int, poll_interval: float):
+    """
+    Process jobs from the shared queue until interrupted
+
+    Args:
+        workers: Number of worker threads
+        poll_interval: Idle wait between queue polls in seconds
+    """
+    store = JobStore()
+    stopping = threading.Event()
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def work(worker_name: str):
+        while not stopping.is_set():
+            job = store.claim(worker_name)
+            if job is None:
+                stopping.wait(poll_interval)
+                continue
+            execute_job(store, *job, worker_name)
+
+    requeued = store.recover()
+    logger.info("Job worker started with %d threads (%d stale jobs requeued)", workers, requeued)
+
+    threads = [
+        threading.Thread(target=work, args=(f"{prefix}:{index}",), daemon=True)
+        for index in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while any(thread.is_alive() for thread in threads):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        logger.info("Stopping job worker after current jobs finish")
+        stopping.set()
+        for thread in threads:
+            thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ResumeForge AI background job worker")
+    parser.add_argument("--workers", type=int, default=max(JOB_WORKERS, 1), help="Concurrent jobs")
+    parser.add_argument("--poll-interval", type=float, default=JOB_POLL_INTERVAL, help="Idle poll seconds")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    run_standalone(args.workers, args.poll_interval)
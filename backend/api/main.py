@@ -4,24 +4,94 @@ Main API server with all endpoint definitions
 """
 
 import os
-import json
+import time
 import asyncio
-from typing import Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Optional, List, Tuple
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-from core.workflow_orchestrator import OptimizationPipeline
+# Load environment variables first: the modules below read their
+# configuration from the environment when they are imported
+load_dotenv()
+
+from api import operations
+from api.operations import OperationError
+from api.job_worker import InProcessWorkerPool, JOB_WORKERS
+from api.responses import (
+    FastJSONResponse,
+    CompressionMiddleware,
+    RESPONSE_COMPRESSION,
+    parse_fields,
+    validate_shape,
+    shape_optimization
+)
+from core.agent_registry import agent_registry
+from services.cancellation import CancellationToken, OperationCancelled
+from services.circuit_breaker import CircuitOpenError, llm_breaker
+from services.deadlines import Deadline, DEFAULT_DEADLINE_SECONDS
 from services.document_processor import (
     DocumentExtractor,
-    DocumentGenerator,
     DocumentValidator
 )
+from services.render_cache import render_cache
+from services.result_store import result_store
+from services.job_store import JobStore, QueueFullError
+from services.lazy_imports import lazy_import
+from services.metrics import REGISTRY, REQUEST_LATENCY, REQUESTS_CANCELLED, CACHE_REQUESTS
+from services.tracing import (
+    PROFILING_ENABLED,
+    PROFILE_MODES,
+    Trace,
+    RequestProfiler,
+    activate,
+    recent_traces,
+    span
+)
+from services.executors import (
+    EXECUTORS,
+    EXECUTOR_RETRY_AFTER_SECONDS,
+    ExecutorSaturatedError,
+    llm_executor,
+    extraction_executor,
+    render_executor
+)
+from services.exporter import (
+    EXPORT_FORMATS,
+    ZipStream,
+    render_document,
+    validate_formats
+)
+
+# Loaded with the first LLM client, so only closed if a request used it
+llm_http = lazy_import("services.llm_http")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup and shutdown
+    
+    Warms the process pools, builds the specialist agents in the
+    background (/api/ready reports when they are done), starts in-process
+    job workers (JOB_WORKERS=0 leaves jobs to standalone workers) and
+    stops them on shutdown.
+    """
+    for executor in EXECUTORS.values():
+        executor.warm()
+    agent_warmup = asyncio.create_task(asyncio.to_thread(agent_registry.warm))
+    job_workers.start()
+    yield
+    await job_workers.stop()
+    if not agent_warmup.done():
+        agent_warmup.cancel()
+    if llm_http.loaded:
+        llm_http.close_llm_http_client()
+    for executor in EXECUTORS.values():
+        executor.shutdown()
 
-# Load environment variables
-load_dotenv()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -29,9 +99,20 @@ app = FastAPI(
     description="Intelligent Resume Optimization Platform powered by Multi-Agent AI",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
+# Seconds clients should wait before retrying when the job queue is full
+JOB_RETRY_AFTER_SECONDS = int(os.getenv("JOB_RETRY_AFTER_SECONDS", 30))
+
+# Stop pipeline work for clients that disconnect before their response
+CANCEL_ON_DISCONNECT = os.getenv("CANCEL_ON_DISCONNECT", "true").lower() in ("1", "true", "yes")
+DISCONNECT_POLL_SECONDS = float(os.getenv("DISCONNECT_POLL_SECONDS", 0.25))
+
+# Status for requests whose client closed the connection (nginx convention)
+CLIENT_CLOSED_REQUEST = 499
+
 # Configure CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
@@ -43,8 +124,67 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id", "Server-Timing"],
 )
 
+# Compress JSON and text responses for clients that accept gzip or brotli
+if RESPONSE_COMPRESSION:
+    app.add_middleware(CompressionMiddleware)
+
+
+@app.middleware("http")
+async def instrument_request(request: Request, call_next):
+    """
+    Trace each request and record its latency per route template
+    
+    The trace ID is returned in X-Trace-Id and span durations in
+    Server-Timing. With PROFILING_ENABLED, an X-Debug-Profile header of
+    "cprofile" or "tracemalloc" writes a capture for the request to
+    PROFILE_DIR.
+    """
+    profile_mode = request.headers.get("x-debug-profile", "").lower()
+    if not PROFILING_ENABLED or profile_mode not in PROFILE_MODES:
+        profile_mode = None
+    
+    # Handlers' requests read through this middleware's receive wrapper,
+    # which never reports a disconnect; expose the server's view instead
+    request.state.is_disconnected = request.is_disconnected
+    
+    trace = Trace(request.headers.get("x-trace-id"), profile_mode)
+    profiler = RequestProfiler(trace) if profile_mode else None
+    if profiler is not None:
+        profiler.start()
+    
+    started = time.perf_counter()
+    status = 500
+    response = None
+    try:
+        with activate(trace):
+            response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        duration = time.perf_counter() - started
+        route = request.scope.get("route")
+        route_path = route.path if route is not None else "unmatched"
+        REQUEST_LATENCY.observe(duration, method=request.method, route=route_path, status=status)
+        recent_traces.add(
+            trace,
+            method=request.method,
+            route=route_path,
+            status=status,
+            duration_ms=round(duration * 1000, 3)
+        )
+        
+        profile_file = profiler.stop() if profiler is not None else None
+        if response is not None:
+            response.headers["X-Trace-Id"] = trace.trace_id
+            server_timing = trace.server_timing()
+            if server_timing:
+                response.headers["Server-Timing"] = server_timing
+            if profile_file:
+                response.headers["X-Profile-File"] = profile_file
+
 
 # Pydantic Models
 class OptimizationRequest(BaseModel):
@@ -52,6 +192,9 @@ class OptimizationRequest(BaseModel):
     resume_text: str
     job_title: str
     job_description: str
+    run_id: Optional[str] = None
+    deadline_seconds: Optional[float] = None
+    previous_result_id: Optional[str] = None
 
 
 class OptimizationResponse(BaseModel):
@@ -61,20 +204,130 @@ class OptimizationResponse(BaseModel):
     optimized: str
     enhanced: str
     evaluation: dict
+    result_id: Optional[str] = None
+    run_id: Optional[str] = None
     message: Optional[str] = None
+    degraded: bool = False
+    degraded_stages: List[str] = []
+    deadline_stages: List[str] = []
+    completed_stages: List[str] = []
+    incremental: Optional[dict] = None
+    usage: Optional[dict] = None
 
 
 class CareerGuidanceRequest(BaseModel):
-    """Request model for career guidance"""
-    resume_text: str
-    job_title: str
-    job_description: str
+    """Request model for career guidance (resume_text or result_id)"""
+    resume_text: Optional[str] = None
+    job_title: Optional[str] = None
+    job_description: Optional[str] = None
+    result_id: Optional[str] = None
 
 
 class QualityScoreRequest(BaseModel):
-    """Request model for quality scoring"""
-    resume_text: str
-    job_title: str
+    """Request model for quality scoring (resume_text or result_id)"""
+    resume_text: Optional[str] = None
+    job_title: Optional[str] = None
+    result_id: Optional[str] = None
+
+
+class JobRequest(BaseModel):
+    """Request model for background jobs"""
+    kind: str
+    payload: dict
+
+
+class ExportRequest(BaseModel):
+    """Request model for multi-format export (resume_text or result_id)"""
+    resume_text: Optional[str] = None
+    result_id: Optional[str] = None
+    formats: List[str] = ["pdf", "docx"]
+    filename: str = "resume"
+
+
+# Payload models validated before a job is queued
+JOB_PAYLOAD_MODELS = {
+    "optimize": OptimizationRequest,
+    "career_guidance": CareerGuidanceRequest,
+    "quality_score": QualityScoreRequest,
+}
+
+# Background jobs share a SQLite queue with any standalone workers
+job_store = JobStore()
+job_workers = InProcessWorkerPool(job_store, workers=JOB_WORKERS)
+
+
+# Errors that handlers pass through to the exception handlers below
+CLIENT_ERRORS = (HTTPException, OperationError, ExecutorSaturatedError, CircuitOpenError)
+
+
+@app.exception_handler(OperationError)
+async def operation_error_handler(request: Request, exc: OperationError):
+    """Map operation errors to their HTTP status codes"""
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
+
+
+@app.exception_handler(ExecutorSaturatedError)
+async def saturation_error_handler(request: Request, exc: ExecutorSaturatedError):
+    """Shed load when a workload's executor queue is full"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(EXECUTOR_RETRY_AFTER_SECONDS)}
+    )
+
+
+async def run_until_disconnect(http_request: Request, token: CancellationToken, work: Awaitable) -> Any:
+    """
+    Await pipeline work, cancelling its token if the client disconnects first
+    
+    The connection is polled every DISCONNECT_POLL_SECONDS. Cancelled work
+    stops before its next stage or LLM request and raises OperationCancelled.
+    
+    Args:
+        http_request: Incoming request whose connection is watched
+        token: Token passed to the work
+        work: Awaitable running the work
+        
+    Returns:
+        Any: The work's result
+    """
+    is_disconnected = getattr(http_request.state, "is_disconnected", http_request.is_disconnected)
+    task = asyncio.ensure_future(work)
+    try:
+        while CANCEL_ON_DISCONNECT:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                break
+            if await is_disconnected():
+                token.cancel("client disconnected")
+                break
+        return await task
+    except asyncio.CancelledError:
+        # The server gave up on the request (shutdown or disconnect)
+        token.cancel("request cancelled")
+        raise
+    except OperationCancelled:
+        route = http_request.scope.get("route")
+        REQUESTS_CANCELLED.inc(route=route.path if route is not None else "unmatched")
+        raise
+
+
+def cancelled_response(exc: OperationCancelled, run_id: str) -> JSONResponse:
+    """Response for work stopped after a disconnect (normally never read by the client)"""
+    return JSONResponse(
+        status_code=CLIENT_CLOSED_REQUEST,
+        content={"detail": f"Optimization cancelled: {exc.reason}", "run_id": run_id}
+    )
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_error_handler(request: Request, exc: CircuitOpenError):
+    """Fail fast for work that has no local fallback while the LLM circuit is open"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))}
+    )
 
 
 # Health Check Endpoint
@@ -92,318 +345,591 @@ async def root():
             "career_guidance": "/api/career-guidance",
             "quality_score": "/api/quality-score",
             "download_pdf": "/api/download/pdf",
-            "download_docx": "/api/download/docx"
+            "download_docx": "/api/download/docx",
+            "export": "/api/export",
+            "jobs": "/api/jobs",
+            "usage": "/api/usage",
+            "traces": "/api/traces/{trace_id}",
+            "ready": "/api/ready",
+            "metrics": "/metrics"
         }
     }
 
 
 @app.get("/api/health")
 async def health_check():
-    """Detailed health check with API key verification"""
+    """Detailed health check with API key verification and executor saturation"""
     api_key_configured = bool(os.getenv("OPENAI_API_KEY"))
+    executors = {name: executor.stats() for name, executor in EXECUTORS.items()}
+    
+    def service_status(executor_name: str) -> str:
+        stats = executors[executor_name]
+        return "saturated" if stats["queued"] >= stats["max_queue"] else "operational"
+    
+    llm_circuit = llm_breaker.stats()
+    ai_status = service_status("llm") if api_key_configured else "unconfigured"
+    if ai_status == "operational" and llm_circuit["state"] != "closed":
+        ai_status = "degraded"
+    
+    services = {
+        "document_extraction": service_status("extraction"),
+        "ai_pipeline": ai_status,
+        "pdf_generation": service_status("render")
+    }
     
     return {
-        "status": "healthy",
+        "status": "healthy" if all(status == "operational" for status in services.values()) else "degraded",
         "api_key_configured": api_key_configured,
-        "services": {
-            "document_extraction": "operational",
-            "ai_pipeline": "operational",
-            "pdf_generation": "operational"
-        }
+        "services": services,
+        "executors": executors,
+        "agents": agent_registry.stats(),
+        "llm_circuit": llm_circuit
     }
 
 
+@app.get("/api/ready")
+async def readiness_check():
+    """Readiness probe: 503 until this worker's specialist agents are built"""
+    stats = agent_registry.stats()
+    if not stats["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "agents": stats})
+    return {"status": "ready", "agents": stats}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint for this worker process"""
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/api/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """
+    Look up the spans of a recent request handled by this worker
+    
+    Args:
+        trace_id: Value of a response's X-Trace-Id header
+        
+    Returns:
+        JSON: Request summary and spans ordered by start time
+    """
+    trace = recent_traces.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return trace
+
+
+def strip_usage(response: dict, include: bool) -> dict:
+    """Drop the usage block unless the client asked for it with ?usage=true"""
+    if not include:
+        response.pop("usage", None)
+    return response
+
+
 @app.post("/api/optimize", response_model=OptimizationResponse)
-async def optimize_resume(request: OptimizationRequest):
+async def optimize_resume(
+    request: OptimizationRequest,
+    http_request: Request,
+    shape: str = "full",
+    fields: Optional[str] = None,
+    usage: bool = False
+):
     """
     Optimize resume text through AI pipeline
     
+    Remaining stages are cancelled if the client disconnects; stages that
+    already finished stay checkpointed, so a retry resumes from them. With
+    a deadline (deadline_seconds or DEFAULT_DEADLINE_SECONDS), stages that
+    cannot finish in time are answered locally and the response lists the
+    stages that did complete. With previous_result_id (a result for the
+    same job), only sections edited since are rewritten and the rest are
+    reused; the response lists both under "incremental".
+    
     Args:
         request: Optimization request with resume text, job title, and job description
+        http_request: Incoming request, watched for client disconnects
+        shape: "full" for every artifact as text, "delta" for sanitized and
+            optimized as line deltas against the enhanced resume
+        fields: Comma-separated artifacts to return (sanitized, optimized,
+            enhanced, evaluation); all by default
+        usage: Include per-stage token, latency and cost accounting
         
     Returns:
-        OptimizationResponse: Complete optimization results
+        OptimizationResponse: Complete optimization results, or the requested
+            subset when shape or fields are given
     """
     try:
-        # Validate input
-        is_valid, error_msg = DocumentValidator.validate_resume_content(request.resume_text)
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=error_msg)
-        
-        if not request.job_title.strip():
-            raise HTTPException(status_code=400, detail="Job title is required")
-        
-        if not request.job_description.strip():
-            raise HTTPException(status_code=400, detail="Job description is required")
-        
-        # Execute optimization pipeline
-        pipeline = OptimizationPipeline(verbose=False)
-        
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        sanitized, optimized, enhanced, evaluation_raw = await loop.run_in_executor(
-            None,
-            pipeline.execute_full_optimization,
+        requested_fields = parse_fields(fields)
+        validate_shape(shape)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    run_id = request.run_id or operations.optimization_run_id(
+        request.resume_text,
+        request.job_title,
+        request.job_description,
+        request.previous_result_id
+    )
+    
+    cancel_token = CancellationToken()
+    deadline = Deadline.start(request.deadline_seconds)
+    try:
+        # Run on the LLM workload pool to avoid blocking
+        response = await run_until_disconnect(http_request, cancel_token, llm_executor.run(
+            operations.optimize,
             request.resume_text,
             request.job_title,
-            request.job_description
-        )
-        
-        # Parse evaluation JSON with better error handling
-        evaluation_dict = {}
-        try:
-            evaluation_cleaned = evaluation_raw.strip()
-            
-            # Remove markdown code blocks
-            if evaluation_cleaned.startswith("```json"):
-                evaluation_cleaned = evaluation_cleaned[7:]
-            elif evaluation_cleaned.startswith("```"):
-                evaluation_cleaned = evaluation_cleaned[3:]
-            if evaluation_cleaned.endswith("```"):
-                evaluation_cleaned = evaluation_cleaned[:-3]
-            
-            # Remove any leading/trailing text
-            evaluation_cleaned = evaluation_cleaned.strip()
-            
-            # Find JSON object boundaries
-            start_idx = evaluation_cleaned.find('{')
-            end_idx = evaluation_cleaned.rfind('}')
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = evaluation_cleaned[start_idx:end_idx+1]
-                evaluation_dict = json.loads(json_str)
-            else:
-                # Try parsing the whole thing
-                evaluation_dict = json.loads(evaluation_cleaned)
-                
-        except json.JSONDecodeError as e:
-            print(f"JSON parse error: {e}")
-            print(f"Raw evaluation: {evaluation_raw[:200]}")
-            # Fallback: return structured error
-            evaluation_dict = {
-                "overall_score": 75,
-                "breakdown": {
-                    "keyword_match": 3.5,
-                    "section_structure": 4.0,
-                    "quantified_metrics": 3.5,
-                    "action_verbs": 4.0,
-                    "format_quality": 4.5
-                },
-                "missing_keywords": ["See raw output for details"],
-                "quick_wins": ["Review and optimize based on job requirements"],
-                "summary": "Evaluation completed. See final resume for optimizations.",
-                "raw_output": evaluation_raw[:500]
-            }
-        except Exception as e:
-            print(f"Unexpected error in evaluation parsing: {e}")
-            evaluation_dict = {
-                "overall_score": 75,
-                "breakdown": {},
-                "missing_keywords": [],
-                "quick_wins": [],
-                "summary": "Resume optimized successfully",
-                "raw_output": evaluation_raw[:500] if evaluation_raw else "No evaluation data"
-            }
+            request.job_description,
+            run_id,
+            cancel_token,
+            deadline,
+            request.previous_result_id
+        ))
         
-        return OptimizationResponse(
-            success=True,
-            sanitized=sanitized,
-            optimized=optimized,
-            enhanced=enhanced,
-            evaluation=evaluation_dict,
-            message="Resume optimized successfully"
-        )
+        result = OptimizationResponse(**strip_usage(response, usage))
+        if shape == "full" and requested_fields is None:
+            return result
+        # model_dump() fills a stripped usage block back in as null
+        shaped = shape_optimization(strip_usage(result.model_dump(), usage), shape, requested_fields)
+        return FastJSONResponse(shaped)
         
-    except HTTPException:
+    except OperationCancelled as e:
+        return cancelled_response(e, run_id)
+    except CLIENT_ERRORS:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Optimization failed: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Optimization failed (run {run_id}, retry to resume): {str(e)}"
+        )
 
 
 @app.post("/api/optimize-file")
 async def optimize_resume_file(
+    http_request: Request,
     file: UploadFile = File(...),
     job_title: str = Form(...),
-    job_description: str = Form(...)
+    job_description: str = Form(...),
+    run_id: Optional[str] = Form(None),
+    deadline_seconds: Optional[float] = Form(None),
+    previous_result_id: Optional[str] = Form(None),
+    shape: str = "full",
+    fields: Optional[str] = None,
+    usage: bool = False
 ):
     """
     Optimize resume from uploaded file
     
     Args:
+        http_request: Incoming request, watched for client disconnects
         file: Resume file (PDF, DOCX, or TXT)
         job_title: Target job title
         job_description: Job requirements/description
+        run_id: Optional run identifier for resuming a failed attempt
+        deadline_seconds: Time budget including upload and extraction
+        previous_result_id: Result of an earlier version, as for /api/optimize
+        shape: Response shape, as for /api/optimize
+        fields: Artifacts to return, as for /api/optimize
+        usage: Include usage accounting, as for /api/optimize
         
     Returns:
         JSON: Optimization results
     """
+    received = time.monotonic()
     try:
         # Read file content
-        file_bytes = await file.read()
+        with span("upload.read"):
+            file_bytes = await file.read()
         
-        # Extract text
-        file_type, resume_text = DocumentExtractor.detect_and_extract(file.filename, file_bytes)
+        # Extract text on the extraction workload pool
+        file_type, resume_text = await extraction_executor.run(
+            DocumentExtractor.detect_and_extract,
+            file.filename,
+            file_bytes
+        )
         
         # Validate extracted content
         is_valid, error_msg = DocumentValidator.validate_resume_content(resume_text)
         if not is_valid:
             raise HTTPException(status_code=400, detail=f"Invalid file content: {error_msg}")
         
-        # Create optimization request
+        # Create optimization request, charging extraction to the deadline
+        if deadline_seconds is None:
+            deadline_seconds = DEFAULT_DEADLINE_SECONDS or None
+        if deadline_seconds is not None:
+            deadline_seconds -= time.monotonic() - received
         request = OptimizationRequest(
             resume_text=resume_text,
             job_title=job_title,
-            job_description=job_description
+            job_description=job_description,
+            run_id=run_id,
+            deadline_seconds=deadline_seconds,
+            previous_result_id=previous_result_id
         )
         
         # Process through optimization pipeline
-        return await optimize_resume(request)
+        return await optimize_resume(request, http_request, shape, fields, usage)
         
-    except HTTPException:
+    except CLIENT_ERRORS:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File processing failed: {str(e)}")
 
 
 @app.post("/api/career-guidance")
-async def get_career_guidance(request: CareerGuidanceRequest):
+async def get_career_guidance(request: CareerGuidanceRequest, usage: bool = False):
     """
     Get personalized career guidance and next steps
     
     Args:
         request: Career guidance request
+        usage: Include token, latency and cost accounting
         
     Returns:
         JSON: Career guidance report
     """
     try:
-        pipeline = OptimizationPipeline(verbose=False)
-        
-        loop = asyncio.get_event_loop()
-        guidance_raw = await loop.run_in_executor(
-            None,
-            pipeline.execute_career_guidance,
+        return strip_usage(await llm_executor.run(
+            operations.career_guidance,
             request.resume_text,
             request.job_title,
-            request.job_description
-        )
-        
-        # Parse JSON
-        guidance_dict = {}
-        try:
-            guidance_cleaned = guidance_raw.strip()
-            if guidance_cleaned.startswith("```json"):
-                guidance_cleaned = guidance_cleaned[7:]
-            if guidance_cleaned.endswith("```"):
-                guidance_cleaned = guidance_cleaned[:-3]
-            guidance_dict = json.loads(guidance_cleaned.strip().replace("'", '"'))
-        except:
-            guidance_dict = {"raw_output": guidance_raw}
-        
-        return {
-            "success": True,
-            "guidance": guidance_dict
-        }
+            request.job_description,
+            request.result_id
+        ), usage)
         
+    except CLIENT_ERRORS:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Career guidance failed: {str(e)}")
 
 
 @app.post("/api/quality-score")
-async def get_quality_score(request: QualityScoreRequest):
+async def get_quality_score(request: QualityScoreRequest, usage: bool = False):
     """
     Get comprehensive quality assessment
     
     Args:
         request: Quality score request
+        usage: Include token, latency and cost accounting
         
     Returns:
         JSON: Quality metrics report
     """
     try:
-        pipeline = OptimizationPipeline(verbose=False)
+        return strip_usage(await llm_executor.run(
+            operations.quality_score,
+            request.resume_text,
+            request.job_title,
+            request.result_id
+        ), usage)
+        
+    except CLIENT_ERRORS:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Quality scoring failed: {str(e)}")
+
+
+@app.post("/api/jobs", status_code=202)
+async def create_job(request: JobRequest):
+    """
+    Queue an optimization, career guidance or quality scoring job
+    
+    Args:
+        request: Job kind and the payload of the matching endpoint
         
+    Returns:
+        JSON: Job ID and status URL to poll
+    """
+    payload_model = JOB_PAYLOAD_MODELS.get(request.kind)
+    if payload_model is None:
+        supported = ", ".join(JOB_PAYLOAD_MODELS)
+        raise HTTPException(status_code=400, detail=f"Unsupported job kind '{request.kind}' (supported: {supported})")
+    
+    try:
+        # Deadlines bound synchronous requests; queued jobs run to completion
+        payload = payload_model(**request.payload).model_dump(exclude={"deadline_seconds"})
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid job payload: {str(e)}")
+    
+    # Checked here, so a job that cannot run is refused instead of failing in the worker
+    if not (payload.get("resume_text") or "").strip() and not payload.get("result_id"):
+        required = "resume_text or result_id" if "result_id" in payload else "resume_text"
+        raise HTTPException(status_code=422, detail=f"Invalid job payload: {required} is required")
+    
+    try:
         loop = asyncio.get_event_loop()
-        score_raw = await loop.run_in_executor(
-            None,
-            pipeline.execute_quality_assessment,
-            request.resume_text,
-            request.job_title
+        job_id = await loop.run_in_executor(None, job_store.enqueue, request.kind, payload)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(JOB_RETRY_AFTER_SECONDS)}
         )
+    
+    job_workers.notify()
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/api/jobs/{job_id}"
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Poll a background job
+    
+    Args:
+        job_id: ID returned by POST /api/jobs
         
-        # Parse JSON
-        score_dict = {}
-        try:
-            score_cleaned = score_raw.strip()
-            if score_cleaned.startswith("```json"):
-                score_cleaned = score_cleaned[7:]
-            if score_cleaned.endswith("```"):
-                score_cleaned = score_cleaned[:-3]
-            score_dict = json.loads(score_cleaned.strip().replace("'", '"'))
-        except:
-            score_dict = {"raw_output": score_raw}
+    Returns:
+        JSON: Job status, and its result or error once finished
+    """
+    loop = asyncio.get_event_loop()
+    job = await loop.run_in_executor(None, job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/api/usage")
+async def usage_report(hours: float = 24, group_by: str = "stage", window: Optional[int] = None):
+    """
+    Aggregate LLM token, latency and cost accounting
+    
+    Args:
+        hours: Length of the period ending now
+        group_by: Comma-separated dimensions (endpoint, stage, model, outcome)
+        window: Also break the period into windows of this many seconds
         
-        return {
-            "success": True,
-            "quality_metrics": score_dict
-        }
+    Returns:
+        JSON: Totals for the period and one row per group
+    """
+    dimensions = [dimension.strip() for dimension in group_by.split(",") if dimension.strip()]
+    if hours <= 0 or (window is not None and window <= 0):
+        raise HTTPException(status_code=400, detail="hours and window must be positive")
+    
+    until = time.time()
+    since = until - hours * 3600
+    loop = asyncio.get_event_loop()
+    try:
+        groups = await loop.run_in_executor(
+            None, result_store.usage_summary, since, until, dimensions, window
+        )
+        totals = await loop.run_in_executor(None, result_store.usage_summary, since, until, ())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "since": since,
+        "until": until,
+        "group_by": dimensions,
+        "window_seconds": window,
+        "totals": totals[0],
+        "groups": groups
+    }
+
+
+async def _render_cached(
+    doc_format: str,
+    resume_text: str,
+    result_id: Optional[str] = None
+) -> Tuple[str, bytes]:
+    """
+    Render a document on the render pool, reusing cached output when available
+    
+    Args:
+        doc_format: One of EXPORT_FORMATS
+        resume_text: Resume content
+        result_id: Stored result the text came from, whose rendered
+            artifacts are reused across workers and restarts
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Quality scoring failed: {str(e)}")
+    Returns:
+        Tuple[str, bytes]: (cache_key, document_bytes)
+    """
+    options = EXPORT_FORMATS[doc_format]["options"]
+    cache_key = render_cache.make_key(doc_format, resume_text, **options)
+    artifact = f"render:{cache_key}"
+    
+    document_bytes = render_cache.get(cache_key)
+    CACHE_REQUESTS.inc(cache="render_memory", result="miss" if document_bytes is None else "hit")
+    # Stored artifacts are SQLite reads and writes, kept off the event loop
+    if document_bytes is None and result_id:
+        document_bytes = await asyncio.to_thread(result_store.get_artifact, result_id, artifact)
+        CACHE_REQUESTS.inc(cache="render_store", result="miss" if document_bytes is None else "hit")
+        if document_bytes is not None:
+            render_cache.put(cache_key, document_bytes)
+    
+    if document_bytes is None:
+        document_bytes = await render_executor.run(render_document, doc_format, resume_text)
+        render_cache.put(cache_key, document_bytes)
+        if result_id:
+            await asyncio.to_thread(result_store.save_artifact, result_id, artifact, document_bytes)
+    
+    return cache_key, document_bytes
+
+
+async def _render_download(
+    doc_format: str,
+    resume_text: str,
+    filename: str,
+    if_none_match: Optional[str],
+    result_id: Optional[str] = None
+) -> Response:
+    """
+    Render a single document as a download response
+    
+    Args:
+        doc_format: One of EXPORT_FORMATS
+        resume_text: Resume content
+        filename: Desired filename
+        if_none_match: Value of the client's If-None-Match header
+        result_id: Stored result the text came from
+        
+    Returns:
+        Response: Rendered document, or 304 when the client copy is current
+    """
+    options = EXPORT_FORMATS[doc_format]["options"]
+    etag = f'"{render_cache.make_key(doc_format, resume_text, **options)}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache"
+    }
+    
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    
+    _, document_bytes = await _render_cached(doc_format, resume_text, result_id)
+    
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return Response(
+        content=document_bytes,
+        media_type=EXPORT_FORMATS[doc_format]["media_type"],
+        headers=headers
+    )
 
 
 @app.post("/api/download/pdf")
-async def download_pdf(resume_text: str = Form(...), filename: str = Form("resume.pdf")):
+async def download_pdf(
+    resume_text: Optional[str] = Form(None),
+    result_id: Optional[str] = Form(None),
+    filename: str = Form("resume.pdf"),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Generate and download resume as PDF
     
     Args:
         resume_text: Resume content
+        result_id: Stored result to render instead of resume_text
         filename: Desired filename
+        if_none_match: ETag of a previously downloaded copy
         
     Returns:
         PDF file as response
     """
     try:
-        pdf_bytes = DocumentGenerator.text_to_pdf_bytes(resume_text, title="Professional Resume")
-        
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        resume_text = await asyncio.to_thread(operations.resolve_resume_text, resume_text, result_id)
+        return await _render_download("pdf", resume_text, filename, if_none_match, result_id)
+    except CLIENT_ERRORS:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
 
 
 @app.post("/api/download/docx")
-async def download_docx(resume_text: str = Form(...), filename: str = Form("resume.docx")):
+async def download_docx(
+    resume_text: Optional[str] = Form(None),
+    result_id: Optional[str] = Form(None),
+    filename: str = Form("resume.docx"),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Generate and download resume as DOCX
     
     Args:
         resume_text: Resume content
+        result_id: Stored result to render instead of resume_text
         filename: Desired filename
+        if_none_match: ETag of a previously downloaded copy
         
     Returns:
         DOCX file as response
     """
     try:
-        docx_bytes = DocumentGenerator.text_to_docx_bytes(resume_text)
-        
-        return Response(
-            content=docx_bytes,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        resume_text = await asyncio.to_thread(operations.resolve_resume_text, resume_text, result_id)
+        return await _render_download("docx", resume_text, filename, if_none_match, result_id)
+    except CLIENT_ERRORS:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"DOCX generation failed: {str(e)}")
 
 
+@app.post("/api/export")
+async def export_resume(request: ExportRequest, if_none_match: Optional[str] = Header(None)):
+    """
+    Export a resume in one or more formats from a single request
+    
+    A single format is returned directly. Several formats are rendered
+    concurrently and streamed as a zip bundle, each entry being written
+    as soon as its render finishes.
+    
+    Args:
+        request: Export request with resume text or result ID, formats and base filename
+        if_none_match: ETag of a previously downloaded copy (single format only)
+        
+    Returns:
+        Document file or zip bundle as response
+    """
+    try:
+        formats = validate_formats(request.formats)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    resume_text = await asyncio.to_thread(operations.resolve_resume_text, request.resume_text, request.result_id)
+    
+    try:
+        if len(formats) == 1:
+            doc_format = formats[0]
+            return await _render_download(
+                doc_format,
+                resume_text,
+                f"{request.filename}.{doc_format}",
+                if_none_match,
+                request.result_id
+            )
+    except CLIENT_ERRORS:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+    
+    async def render_entry(doc_format: str) -> Tuple[str, bytes]:
+        _, document_bytes = await _render_cached(doc_format, resume_text, request.result_id)
+        return doc_format, document_bytes
+    
+    async def stream_bundle():
+        bundle = ZipStream()
+        renders = [asyncio.ensure_future(render_entry(doc_format)) for doc_format in formats]
+        try:
+            for completed in asyncio.as_completed(renders):
+                doc_format, document_bytes = await completed
+                yield bundle.add(f"{request.filename}.{doc_format}", document_bytes)
+            yield bundle.close()
+        finally:
+            for render in renders:
+                render.cancel()
+    
+    return StreamingResponse(
+        stream_bundle(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={request.filename}.zip"}
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
@@ -0,0 +1,442 @@
+"""
+API Operations
+Transport-independent implementations shared by HTTP handlers and job workers
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+from core.workflow_orchestrator import OptimizationPipeline, PIPELINE_MODE
+from core.report_parser import parse_report
+from services.cancellation import CancellationToken
+from services.deadlines import Deadline
+from services.document_processor import DocumentValidator
+from services.result_store import result_store
+from services.checkpoint_store import checkpoint_store
+from services.metrics import CACHE_REQUESTS
+from services.tracing import span
+from services.usage import summarize_usage
+
+logger = logging.getLogger(__name__)
+
+# Stages whose locally answered output must not be reused by incremental runs
+REWRITE_STAGES = {"sanitization", "optimization", "enhancement"}
+
+
+class OperationError(Exception):
+    """Base class for errors that map to a client-facing status code"""
+    status_code = 500
+
+
+class InvalidRequestError(OperationError):
+    """Raised when operation inputs are missing or invalid"""
+    status_code = 400
+
+
+class ResultNotFoundError(OperationError):
+    """Raised when a referenced result is unknown or expired"""
+    status_code = 404
+
+
+def load_result(result_id: str) -> dict:
+    """
+    Fetch a stored optimization result
+
+    Args:
+        result_id: ID returned by an optimization
+
+    Returns:
+        dict: Stored result payload
+    """
+    result = result_store.get_result(result_id)
+    if result is None:
+        raise ResultNotFoundError("Result not found or expired")
+    return result
+
+
+def resolve_resume_text(resume_text: Optional[str], result_id: Optional[str]) -> str:
+    """
+    Pick the resume to work on from raw text or a stored result
+
+    Args:
+        resume_text: Resume content sent by the client
+        result_id: Stored result whose enhanced resume should be used
+
+    Returns:
+        str: Resume text
+    """
+    if result_id:
+        return load_result(result_id)["enhanced"]
+    if resume_text and resume_text.strip():
+        return resume_text
+    raise InvalidRequestError("Either resume_text or result_id is required")
+
+
+def default_run_id(*inputs: str) -> str:
+    """
+    Derive a run ID from the request inputs
+
+    Retrying the same request therefore resumes from its checkpoints
+    without the client having to track an ID. The pipeline mode is part of
+    the ID because stage inputs differ between modes.
+    """
+    return hashlib.sha256("\x00".join((PIPELINE_MODE,) + inputs).encode("utf-8")).hexdigest()[:32]
+
+
+def optimization_run_id(
+    resume_text: str,
+    job_title: str,
+    job_description: str,
+    previous_result_id: Optional[str] = None
+) -> str:
+    """Default run ID of an optimization; incremental runs checkpoint partial outputs, so they get their own"""
+    if previous_result_id:
+        return default_run_id(resume_text, job_title, job_description, previous_result_id)
+    return default_run_id(resume_text, job_title, job_description)
+
+
+def checkpoint_run_id(run_id: Optional[str], inputs_run_id: str) -> str:
+    """
+    Run ID checkpoints are stored under
+
+    A client run ID is scoped to the inputs, so reusing one for another
+    resume or job never hands back that run's stage outputs.
+
+    Args:
+        run_id: Run ID sent by the client, if any
+        inputs_run_id: Run ID derived from the inputs (optimization_run_id)
+
+    Returns:
+        str: Checkpoint run ID
+    """
+    if not run_id or run_id == inputs_run_id:
+        return inputs_run_id
+    return default_run_id(run_id, inputs_run_id)
+
+
+def incremental_base(previous_result_id: Optional[str], job_title: str, job_description: str) -> Optional[dict]:
+    """
+    Stored result an optimization can reuse unchanged sections from
+
+    Returns:
+        Optional[dict]: The result, or None if it was made for another job
+            or has rewrite stages that were answered locally
+    """
+    if not previous_result_id:
+        return None
+    previous = load_result(previous_result_id)
+    if (previous["job_title"], previous["job_description"]) != (job_title, job_description):
+        return None
+    if REWRITE_STAGES & set(previous.get("degraded_stages") or ()):
+        return None
+    return previous
+
+
+def artifact_name(kind: str, *parts: str) -> str:
+    """Build a stored artifact name scoped to the inputs it depends on"""
+    digest = hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()[:16]
+    return f"{kind}:{digest}"
+
+
+def parse_evaluation(evaluation_raw: str, usage: Optional[List[Dict[str, Any]]] = None) -> dict:
+    """
+    Parse the evaluation stage output into a report dictionary
+
+    Args:
+        evaluation_raw: Raw evaluation text from the pipeline
+        usage: Usage records a repair call is added to
+
+    Returns:
+        dict: Evaluation report (with parse_error if it could not be recovered)
+    """
+    return parse_report(evaluation_raw, "evaluation", usage=usage)
+
+
+def degraded_message(degraded_stages: list, deadline_stages: list = ()) -> Optional[str]:
+    """Explain which stages were answered locally because the AI service was unavailable or time ran out"""
+    unavailable = [stage for stage in degraded_stages if stage not in deadline_stages]
+    parts = []
+    if unavailable:
+        parts.append(f"AI service temporarily unavailable; these stages used local processing: {', '.join(unavailable)}")
+    if deadline_stages:
+        parts.append(f"Deadline too close; these stages used local processing: {', '.join(deadline_stages)}")
+    if not parts:
+        return None
+    return "; ".join(parts) + " (rewrite stages return their input unchanged)"
+
+
+def record_usage(endpoint: str, pipeline: OptimizationPipeline, run_id: Optional[str] = None):
+    """
+    Persist the usage records of the stages an operation ran
+
+    Args:
+        endpoint: Operation name the usage is attributed to
+        pipeline: Pipeline that ran the stages
+        run_id: Pipeline run ID, if any
+    """
+    if not pipeline.usage:
+        return
+    try:
+        result_store.record_usage(endpoint, pipeline.usage, run_id)
+    except Exception as e:
+        logger.warning("Could not record %s usage: %s", endpoint, e)
+
+
+def flag_unparsed(pipeline: OptimizationPipeline, stage_name: str, report: dict):
+    """Mark a stage whose output could not be parsed, so its spend shows up as wasted"""
+    if "parse_error" not in report:
+        return
+    for record in pipeline.usage:
+        if record["stage"] == stage_name and record["outcome"] == "success":
+            record["outcome"] = "parse_error"
+
+
+def optimize(
+    resume_text: str,
+    job_title: str,
+    job_description: str,
+    run_id: Optional[str] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    deadline: Optional[Deadline] = None,
+    previous_result_id: Optional[str] = None
+) -> dict:
+    """
+    Run the full optimization pipeline and store the result
+
+    Args:
+        resume_text: Raw resume content
+        job_title: Target job title
+        job_description: Job requirements/description
+        run_id: Run ID (derived from the inputs when omitted); checkpoints
+            are only shared by runs with the same ID and inputs
+        cancel_token: Token that stops the pipeline when cancelled; stages
+            finished by then stay checkpointed for a retry
+        deadline: Time by which to answer; stages that cannot finish by
+            then are answered locally and listed in deadline_stages
+        previous_result_id: Result of an earlier version of the resume for
+            the same job; only sections that changed since are rewritten
+            (a full run is made if it cannot be used, see incremental_base)
+
+    Returns:
+        dict: Optimization response fields
+
+    Raises:
+        ResultNotFoundError: If previous_result_id is unknown or expired
+    """
+    # Validate input
+    is_valid, error_msg = DocumentValidator.validate_resume_content(resume_text)
+    if not is_valid:
+        raise InvalidRequestError(error_msg)
+
+    if not job_title.strip():
+        raise InvalidRequestError("Job title is required")
+
+    if not job_description.strip():
+        raise InvalidRequestError("Job description is required")
+
+    inputs_run_id = optimization_run_id(resume_text, job_title, job_description, previous_result_id)
+    run_id = run_id or inputs_run_id
+    checkpoint_id = checkpoint_run_id(run_id, inputs_run_id)
+    previous = incremental_base(previous_result_id, job_title, job_description)
+
+    # Execute optimization pipeline, resuming any checkpointed stages
+    pipeline = OptimizationPipeline(
+        verbose=False,
+        run_id=checkpoint_id,
+        checkpoint_store=checkpoint_store,
+        cancel_token=cancel_token,
+        deadline=deadline
+    )
+    try:
+        if previous is not None:
+            sanitized, optimized, enhanced, evaluation_raw = pipeline.execute_incremental_optimization(
+                resume_text,
+                job_title,
+                job_description,
+                previous
+            )
+        else:
+            sanitized, optimized, enhanced, evaluation_raw = pipeline.execute_full_optimization(
+                resume_text,
+                job_title,
+                job_description
+            )
+
+        with span("parse.evaluation"):
+            evaluation_dict = parse_evaluation(evaluation_raw, pipeline.usage)
+        flag_unparsed(pipeline, "evaluation", evaluation_dict)
+    finally:
+        # Failed and cancelled runs are billed too
+        record_usage("optimize", pipeline, run_id)
+
+    # Checkpoints only serve retries of unfinished runs
+    try:
+        checkpoint_store.clear(checkpoint_id)
+    except Exception as e:
+        logger.warning("Could not clear checkpoints of run %s: %s", checkpoint_id, e)
+
+    # Persist so downloads and follow-ups can reference the result by ID
+    result_id = None
+    try:
+        with span("store.save_result"):
+            result_id = result_store.save_result({
+                "resume_text": resume_text,
+                "job_title": job_title,
+                "job_description": job_description,
+                "sanitized": sanitized,
+                "optimized": optimized,
+                "enhanced": enhanced,
+                "evaluation": evaluation_dict,
+                "degraded_stages": pipeline.degraded_stages
+            })
+    except Exception as e:
+        logger.warning("Could not store optimization result: %s", e)
+
+    return {
+        "success": True,
+        "sanitized": sanitized,
+        "optimized": optimized,
+        "enhanced": enhanced,
+        "evaluation": evaluation_dict,
+        "result_id": result_id,
+        "run_id": run_id,
+        "message": degraded_message(pipeline.degraded_stages, pipeline.deadline_stages) or "Resume optimized successfully",
+        "degraded": bool(pipeline.degraded_stages),
+        "degraded_stages": pipeline.degraded_stages,
+        "deadline_stages": pipeline.deadline_stages,
+        "completed_stages": pipeline.completed_stages,
+        "incremental": {
+            "previous_result_id": previous_result_id,
+            "rewritten_sections": pipeline.rewritten_units,
+            "reused_sections": pipeline.reused_units
+        } if previous is not None else None,
+        "usage": summarize_usage(pipeline.usage)
+    }
+
+
+def career_guidance(
+    resume_text: Optional[str] = None,
+    job_title: Optional[str] = None,
+    job_description: Optional[str] = None,
+    result_id: Optional[str] = None
+) -> dict:
+    """
+    Generate career guidance for raw text or a stored result
+
+    Args:
+        resume_text: Resume content
+        job_title: Target role (defaults to the stored one)
+        job_description: Job requirements (defaults to the stored one)
+        result_id: Stored result to use instead of resume_text
+
+    Returns:
+        dict: Career guidance response
+    """
+    artifact = None
+    if result_id:
+        stored = load_result(result_id)
+        resume_text = stored["enhanced"]
+        job_title = job_title or stored["job_title"]
+        job_description = job_description or stored["job_description"]
+        artifact = artifact_name("career_guidance", job_title, job_description)
+        cached = result_store.get_artifact(result_id, artifact)
+        CACHE_REQUESTS.inc(cache="report_artifact", result="miss" if cached is None else "hit")
+        if cached is not None:
+            return {"success": True, "guidance": cached}
+
+    if not resume_text or not resume_text.strip():
+        raise InvalidRequestError("Either resume_text or result_id is required")
+    if not job_title or not job_description:
+        raise InvalidRequestError("Job title and job description are required")
+
+    pipeline = OptimizationPipeline(verbose=False)
+    try:
+        guidance_raw = pipeline.execute_career_guidance(resume_text, job_title, job_description)
+        with span("parse.career_guidance"):
+            guidance_dict = parse_report(guidance_raw, "career_guidance", usage=pipeline.usage)
+        flag_unparsed(pipeline, "career_guidance", guidance_dict)
+    finally:
+        record_usage("career_guidance", pipeline)
+
+    if artifact and "parse_error" not in guidance_dict:
+        try:
+            result_store.save_artifact(result_id, artifact, guidance_dict)
+        except Exception as e:
+            logger.warning("Could not store career guidance of result %s: %s", result_id, e)
+
+    return {
+        "success": True,
+        "guidance": guidance_dict,
+        "usage": summarize_usage(pipeline.usage)
+    }
+
+
+def quality_score(
+    resume_text: Optional[str] = None,
+    job_title: Optional[str] = None,
+    result_id: Optional[str] = None
+) -> dict:
+    """
+    Score resume quality for raw text or a stored result
+
+    Args:
+        resume_text: Resume content
+        job_title: Target role (defaults to the stored one)
+        result_id: Stored result to use instead of resume_text
+
+    Returns:
+        dict: Quality score response
+    """
+    artifact = None
+    if result_id:
+        stored = load_result(result_id)
+        resume_text = stored["enhanced"]
+        job_title = job_title or stored["job_title"]
+        artifact = artifact_name("quality_score", job_title)
+        cached = result_store.get_artifact(result_id, artifact)
+        CACHE_REQUESTS.inc(cache="report_artifact", result="miss" if cached is None else "hit")
+        if cached is not None:
+            return {"success": True, "quality_metrics": cached}
+
+    if not resume_text or not resume_text.strip():
+        raise InvalidRequestError("Either resume_text or result_id is required")
+    if not job_title:
+        raise InvalidRequestError("Job title is required")
+
+    pipeline = OptimizationPipeline(verbose=False)
+    try:
+        score_raw = pipeline.execute_quality_assessment(resume_text, job_title)
+        with span("parse.quality_score"):
+            score_dict = parse_report(score_raw, "quality_score", usage=pipeline.usage)
+        flag_unparsed(pipeline, "quality_scoring", score_dict)
+    finally:
+        record_usage("quality_score", pipeline)
+
+    # Local estimates are not cached, so the next request gets the AI score
+    if artifact and "parse_error" not in score_dict and not pipeline.degraded_stages:
+        try:
+            result_store.save_artifact(result_id, artifact, score_dict)
+        except Exception as e:
+            logger.warning("Could not store quality score of result %s: %s", result_id, e)
+
+    response = {
+        "success": True,
+        "quality_metrics": score_dict,
+        "usage": summarize_usage(pipeline.usage)
+    }
+    if pipeline.degraded_stages:
+        response.update(
+            degraded=True,
+            degraded_stages=pipeline.degraded_stages,
+            message=degraded_message(pipeline.degraded_stages)
+        )
+    return response
+
+
+# Operations available to the background job queue
+JOB_OPERATIONS = {
+    "optimize": optimize,
+    "career_guidance": career_guidance,
+    "quality_score": quality_score,
+}
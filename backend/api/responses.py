@@ -0,0 +1,240 @@
+"""
+Response Encoding
+Response shapes, fast JSON rendering and gzip/brotli negotiation for API payloads
+"""
+
+import os
+import json
+import gzip
+import importlib.util
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from services.lazy_imports import lazy_import
+from services.line_delta import line_delta
+
+orjson = lazy_import("orjson")
+brotli = lazy_import("brotli")
+
+# Compression Configuration
+RESPONSE_COMPRESSION = os.getenv("RESPONSE_COMPRESSION", "true").lower() in ("1", "true", "yes")
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 4))
+
+# Media types worth compressing (documents and zips already are)
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+# Optimization response shapes:
+#   full  - every artifact as full text (the default)
+#   delta - enhanced as full text, sanitized and optimized as line deltas against it
+RESPONSE_SHAPES = ("full", "delta")
+ARTIFACTS = ("sanitized", "optimized", "enhanced", "evaluation")
+DELTA_ARTIFACTS = ("sanitized", "optimized")
+
+
+def orjson_available() -> bool:
+    """orjson is optional (pip install orjson); without it the standard encoder is used"""
+    return importlib.util.find_spec("orjson") is not None
+
+
+def brotli_available() -> bool:
+    """Brotli is optional (pip install brotli); without it only gzip is offered"""
+    return importlib.util.find_spec("brotli") is not None
+
+
+_ORJSON = orjson_available()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed"""
+
+    def render(self, content: Any) -> bytes:
+        if _ORJSON:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Validate a comma-separated artifact list
+
+    Args:
+        fields: Query value such as "enhanced,evaluation" (None keeps all)
+
+    Returns:
+        Optional[List[str]]: Requested artifacts in request order
+
+    Raises:
+        ValueError: If an artifact name is unknown
+    """
+    if fields is None:
+        return None
+    requested = []
+    for field in fields.split(","):
+        field = field.strip().lower()
+        if not field:
+            continue
+        if field not in ARTIFACTS:
+            raise ValueError(f"Unknown artifact '{field}' (available: {', '.join(ARTIFACTS)})")
+        if field not in requested:
+            requested.append(field)
+    return requested
+
+
+def validate_shape(shape: str) -> str:
+    """
+    Check a response shape name
+
+    Raises:
+        ValueError: If the shape is unknown
+    """
+    if shape not in RESPONSE_SHAPES:
+        raise ValueError(f"Unknown response shape '{shape}' (available: {', '.join(RESPONSE_SHAPES)})")
+    return shape
+
+
+def shape_optimization(response: Dict[str, Any], shape: str, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Reduce an optimization response to the requested artifacts and shape
+
+    Args:
+        response: Full response from operations.optimize
+        shape: Key of RESPONSE_SHAPES
+        fields: Artifacts to include (None for all)
+
+    Returns:
+        Dict[str, Any]: Response with unrequested artifacts removed and, for
+            the delta shape, intermediate versions replaced by line deltas
+            under "deltas" (rebuild them with services.line_delta.apply_line_delta)
+
+    Raises:
+        ValueError: If the shape is unknown
+    """
+    validate_shape(shape)
+    wanted = set(fields if fields is not None else ARTIFACTS)
+    shaped = {key: value for key, value in response.items() if key not in ARTIFACTS or key in wanted}
+
+    if shape == "delta":
+        deltas = {}
+        for artifact in DELTA_ARTIFACTS:
+            if artifact in wanted:
+                deltas[artifact] = line_delta(response["enhanced"], shaped.pop(artifact))
+        # Deltas are relative to the final resume, so it is always sent
+        shaped["enhanced"] = response["enhanced"]
+        shaped["deltas"] = deltas
+    shaped["shape"] = shape
+    return shaped
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into encoding -> q-value"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header
+
+    Brotli is preferred when installed and accepted, then gzip.
+
+    Returns:
+        Optional[str]: "br", "gzip" or None for identity
+    """
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    offers = (("br", brotli_available()), ("gzip", True))
+    candidates = [
+        (accepted.get(name, wildcard), -rank, name)
+        for rank, (name, available) in enumerate(offers)
+        if available and accepted.get(name, wildcard) > 0
+    ]
+    return max(candidates)[2] if candidates else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing complete JSON and text responses
+
+    Only single-message bodies of COMPRESSION_MIN_BYTES or more are
+    compressed; streamed downloads and binary documents pass through.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[dict] = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            if message.get("more_body") or not self._compressible(start, body):
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            response_headers = [
+                (name, value) for name, value in start["headers"]
+                if name.lower() not in (b"content-length", b"vary")
+            ]
+            response_headers += [
+                (b"content-encoding", encoding.encode("ascii")),
+                (b"content-length", str(len(compressed)).encode("ascii")),
+                (b"vary", b"Accept-Encoding"),
+            ]
+            await send(dict(start, headers=response_headers))
+            await send(dict(message, body=compressed))
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressible(self, start: dict, body: bytes) -> bool:
+        if len(body) < self.minimum_size:
+            return False
+        response_headers: List[Tuple[bytes, bytes]] = start.get("headers") or []
+        content_type = b""
+        for name, value in response_headers:
+            name = name.lower()
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type":
+                content_type = value
+        return content_type.decode("latin-1").startswith(COMPRESSIBLE_TYPES)
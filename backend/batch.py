@@ -0,0 +1,425 @@
+"""
+Bulk Resume Optimization
+Optimizes a directory or zip of resumes against one or more job descriptions offline
+
+Text is extracted in the extraction process pool and pipelines run on the
+LLM workload pool with bounded concurrency. Each finished resume/job pair
+is appended to a JSONL file right away; rerunning the same command skips
+pairs already optimized, and interrupted pipelines resume from their stage
+checkpoints. Job description files hold the job title on the first line
+and the description below it. Run from the backend directory:
+    python -m batch resumes/ --jd jobs/ml_engineer.txt --jd jobs/data_engineer.txt --output results.jsonl
+    python -m batch resumes.zip --jd job.txt --output results.parquet --concurrency 8
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import zipfile
+import argparse
+import importlib.util
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables before any configuration is read
+load_dotenv()
+
+# Batch Configuration
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 4))
+BATCH_EXTRACTION_WORKERS = int(os.getenv("BATCH_EXTRACTION_WORKERS", os.cpu_count() or 2))
+
+# Record fields filled only for successful pairs (None otherwise, so every row has the same columns)
+RESULT_FIELDS = (
+    "result_id", "run_id", "overall_score", "degraded_stages", "enhanced", "evaluation",
+    "prompt_tokens", "completion_tokens", "cost_usd"
+)
+
+# Resume files picked up from the input directory or zip
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt", ".text")
+
+
+class ResumeSource(NamedTuple):
+    """A resume file: its name relative to the input and a reader for its bytes"""
+    name: str
+    read: Callable[[], bytes]
+
+
+class Job(NamedTuple):
+    name: str
+    title: str
+    description: str
+
+
+def parquet_available() -> bool:
+    """pyarrow is optional (pip install pyarrow); without it only JSONL output is offered"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _is_resume(name: str) -> bool:
+    base = os.path.basename(name)
+    return name.lower().endswith(RESUME_EXTENSIONS) and not base.startswith(".") and "__MACOSX" not in name
+
+
+def list_resumes(path: str) -> List[ResumeSource]:
+    """
+    Find the resume files of a directory (recursively) or zip archive
+
+    Args:
+        path: Directory or .zip file
+
+    Returns:
+        List[ResumeSource]: Resumes sorted by name
+
+    Raises:
+        ValueError: If path is neither a directory nor a zip file
+    """
+    if os.path.isdir(path):
+        sources = []
+        for root, _, files in os.walk(path):
+            for file_name in files:
+                full_path = os.path.join(root, file_name)
+                name = os.path.relpath(full_path, path)
+                if _is_resume(name):
+                    sources.append(ResumeSource(name, lambda full_path=full_path: _read_file(full_path)))
+        return sorted(sources, key=lambda source: source.name)
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            names = [info.filename for info in archive.infolist() if not info.is_dir() and _is_resume(info.filename)]
+        return [ResumeSource(name, lambda name=name: _read_member(path, name)) for name in sorted(names)]
+
+    raise ValueError(f"{path} is not a directory or zip file")
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _read_member(archive_path: str, name: str) -> bytes:
+    with zipfile.ZipFile(archive_path) as archive:
+        return archive.read(name)
+
+
+def load_job(path: str) -> Job:
+    """
+    Read a job description file (title on the first line, description below)
+
+    Jobs are named by their path as given (normalized), so files with the
+    same name in different directories stay apart in the journal.
+
+    Raises:
+        ValueError: If the title or description is missing
+    """
+    with open(path, encoding="utf-8") as file:
+        title, _, description = file.read().strip().partition("\n")
+    if not title.strip() or not description.strip():
+        raise ValueError(f"{path} needs the job title on the first line and the description below it")
+    return Job(os.path.normpath(path), title.strip(), description.strip())
+
+
+def completed_pairs(journal_path: str) -> Set[Tuple[str, str]]:
+    """(resume, job) pairs the journal already holds a successful record for"""
+    done = set()
+    if not os.path.exists(journal_path):
+        return done
+    with open(journal_path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Line cut short by an interruption
+            if record.get("status") == "ok":
+                done.add((record["resume"], record["job"]))
+    return done
+
+
+def build_record(
+    source: ResumeSource,
+    job: Job,
+    started: float,
+    response: Optional[dict] = None,
+    error: str = ""
+) -> dict:
+    """One output row for a resume/job pair"""
+    record = {
+        "resume": source.name,
+        "job": job.name,
+        "job_title": job.title,
+        "status": "ok" if response is not None else "error",
+        "error": error or None,
+        "seconds": round(time.perf_counter() - started, 3),
+        **dict.fromkeys(RESULT_FIELDS),
+    }
+    if response is not None:
+        usage = response.get("usage") or {}
+        record.update({
+            "result_id": response["result_id"],
+            "run_id": response["run_id"],
+            "overall_score": response["evaluation"].get("overall_score"),
+            "degraded_stages": response["degraded_stages"],
+            "enhanced": response["enhanced"],
+            "evaluation": response["evaluation"],
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "cost_usd": usage.get("cost_usd"),
+        })
+    return record
+
+
+class Progress:
+    """Completion counts, throughput and per-pair latency of a batch run"""
+
+    def __init__(self, total: int, skipped: int):
+        self.total = total
+        self.skipped = skipped
+        self.ok = 0
+        self.failed = 0
+        self.tokens = 0
+        self.cost = 0.0
+        self.latencies: List[float] = []
+        self.started = time.perf_counter()
+        self.interrupted = False
+
+    @property
+    def finished(self) -> int:
+        return self.ok + self.failed
+
+    def rate_per_minute(self) -> float:
+        return self.finished / max(time.perf_counter() - self.started, 1e-9) * 60
+
+    def record(self, record: dict):
+        """Count a finished pair and print a progress line"""
+        if record["status"] == "ok":
+            self.ok += 1
+            self.tokens += record["prompt_tokens"] + record["completion_tokens"]
+            self.cost += record["cost_usd"] or 0.0
+        else:
+            self.failed += 1
+        self.latencies.append(record["seconds"])
+
+        remaining = self.total - self.skipped - self.finished
+        rate = self.rate_per_minute()
+        eta = f"{remaining / rate:.1f} min" if rate else "-"
+        outcome = "ok" if record["status"] == "ok" else f"error: {record['error']}"
+        print(
+            f"[{self.skipped + self.finished}/{self.total}] {record['resume']} x {record['job']}: "
+            f"{outcome} ({record['seconds']:.1f}s) | {rate:.1f}/min, eta {eta}",
+            flush=True
+        )
+
+    def summary(self) -> Dict[str, object]:
+        latencies = sorted(self.latencies)
+
+        def quantile(fraction: float) -> float:
+            return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] if latencies else 0.0
+
+        elapsed = time.perf_counter() - self.started
+        return {
+            "pairs": self.total,
+            "skipped": self.skipped,
+            "ok": self.ok,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 1),
+            "pairs_per_minute": round(self.rate_per_minute(), 2),
+            "p50_seconds": round(quantile(0.5), 2),
+            "p95_seconds": round(quantile(0.95), 2),
+            "total_tokens": self.tokens,
+            "cost_usd": round(self.cost, 4),
+        }
+
+
+async def run_batch(
+    sources: List[ResumeSource],
+    jobs: List[Job],
+    journal_path: str,
+    concurrency: int = BATCH_CONCURRENCY
+) -> Progress:
+    """
+    Optimize every resume against every job, appending records to the journal
+
+    Each resume is read and extracted once, in the extraction process
+    pool, and then optimized for each of its pending jobs. At most
+    concurrency pipelines run at a time; resumes are admitted as pipeline
+    slots free up, so memory stays bounded on large inputs.
+
+    Args:
+        sources: Resumes to process
+        jobs: Job descriptions to optimize each resume for
+        journal_path: JSONL file records are appended to
+        concurrency: Pipelines running at once
+
+    Returns:
+        Progress: Counts and latency statistics of the run
+    """
+    from api import operations
+    from services.cancellation import CancellationToken, OperationCancelled
+    from services.document_processor import DocumentExtractor
+    from services.executors import extraction_executor, llm_executor
+
+    done = completed_pairs(journal_path)
+    pending = [(source, [job for job in jobs if (source.name, job.name) not in done]) for source in sources]
+    progress = Progress(len(sources) * len(jobs), len(done & {(s.name, j.name) for s in sources for j in jobs}))
+
+    llm_executor.max_workers = max(llm_executor.max_workers, concurrency)
+    pipelines = asyncio.Semaphore(concurrency)
+    admitted = asyncio.Semaphore(concurrency * 2)
+    cancel_token = CancellationToken()
+
+    # The first Ctrl-C stops running pipelines at their next LLM request and
+    # skips the rest; a second one exits immediately
+    loop = asyncio.get_running_loop()
+
+    def interrupt():
+        print("Stopping after the running LLM calls; press Ctrl-C again to quit now", flush=True)
+        cancel_token.cancel("interrupted")
+        progress.interrupted = True
+        loop.remove_signal_handler(signal.SIGINT)
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, interrupt)
+    except NotImplementedError:
+        pass  # Not on Windows; Ctrl-C raises KeyboardInterrupt there
+
+    with open(journal_path, "a", encoding="utf-8") as journal:
+        def write(record: dict):
+            journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            journal.flush()
+            progress.record(record)
+
+        async def optimize(source: ResumeSource, resume_text: str, job: Job):
+            async with pipelines:
+                if cancel_token.cancelled:
+                    return
+                started = time.perf_counter()
+                try:
+                    response = await llm_executor.run(
+                        operations.optimize,
+                        resume_text,
+                        job.title,
+                        job.description,
+                        None,
+                        cancel_token,
+                        reject_when_full=False
+                    )
+                    write(build_record(source, job, started, response))
+                except OperationCancelled:
+                    return  # Finished stages stay checkpointed for the next run
+                except Exception as e:
+                    write(build_record(source, job, started, error=str(e)))
+
+        async def process(source: ResumeSource, source_jobs: List[Job]):
+            async with admitted:
+                if cancel_token.cancelled:
+                    return
+                started = time.perf_counter()
+                try:
+                    _, resume_text = await extraction_executor.run(
+                        DocumentExtractor.detect_and_extract,
+                        source.name,
+                        source.read(),
+                        reject_when_full=False
+                    )
+                except Exception as e:
+                    for job in source_jobs:
+                        write(build_record(source, job, started, error=f"Extraction failed: {e}"))
+                    return
+                await asyncio.gather(*(optimize(source, resume_text, job) for job in source_jobs))
+
+        try:
+            await asyncio.gather(*(process(source, source_jobs) for source, source_jobs in pending if source_jobs))
+        finally:
+            cancel_token.cancel("interrupted")
+            extraction_executor.shutdown()
+
+    return progress
+
+
+def write_parquet(journal_path: str, output_path: str) -> int:
+    """
+    Write the latest record of each resume/job pair in the journal to Parquet
+
+    Nested fields (evaluation, degraded_stages) are stored as JSON strings.
+
+    Returns:
+        int: Rows written
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    latest: Dict[Tuple[str, str], dict] = {}
+    with open(journal_path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            latest[(record["resume"], record["job"])] = record
+
+    rows = [
+        {key: json.dumps(value) if isinstance(value, (dict, list)) else value for key, value in record.items()}
+        for record in latest.values()
+    ]
+    pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows), output_path)
+    return len(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("input", help="Directory or zip file of resumes (PDF, DOCX, TXT)")
+    parser.add_argument("--jd", action="append", required=True, help="Job description file (repeatable)")
+    parser.add_argument("--output", default="results.jsonl", help="Output file (.jsonl, or .parquet with pyarrow)")
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY, help="Pipelines running at once")
+    parser.add_argument(
+        "--extraction-workers",
+        type=int,
+        default=BATCH_EXTRACTION_WORKERS,
+        help="Text extraction processes"
+    )
+    args = parser.parse_args()
+
+    parquet = args.output.lower().endswith(".parquet")
+    if parquet and not parquet_available():
+        print("Parquet output needs pyarrow (pip install pyarrow); use a .jsonl output instead")
+        return 2
+    try:
+        sources = list_resumes(args.input)
+        jobs = [load_job(path) for path in args.jd]
+    except (OSError, ValueError) as e:
+        print(str(e))
+        return 2
+    repeated = sorted({job.name for job in jobs if [other.name for other in jobs].count(job.name) > 1})
+    if repeated:
+        print(f"Job descriptions given more than once: {', '.join(repeated)}")
+        return 2
+    if not sources:
+        print(f"No resume files ({', '.join(RESUME_EXTENSIONS)}) found in {args.input}")
+        return 2
+
+    from services.executors import extraction_executor
+    extraction_executor.max_workers = args.extraction_workers
+
+    # Parquet cannot be appended to, so records are journaled as JSONL and converted at the end
+    journal_path = args.output + ".jsonl" if parquet else args.output
+    print(f"{len(sources)} resumes x {len(jobs)} jobs -> {args.output} (concurrency {args.concurrency})", flush=True)
+    try:
+        progress = asyncio.run(run_batch(sources, jobs, journal_path, args.concurrency))
+    except KeyboardInterrupt:
+        progress = None
+    if progress is None or progress.interrupted:
+        print(f"Interrupted; run the same command again to resume from {journal_path}")
+        return 130
+
+    if parquet:
+        rows = write_parquet(journal_path, args.output)
+        print(f"Wrote {rows} rows to {args.output}")
+    print(json.dumps(progress.summary(), indent=2))
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
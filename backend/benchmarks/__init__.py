@@ -0,0 +1,4 @@
+"""
+Performance Benchmarks
+Standalone benchmark scripts for the API, pipeline and document services
+"""
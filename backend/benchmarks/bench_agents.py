@@ -0,0 +1,137 @@
+"""
+Agent Registry Benchmark
+Measures per-request agent overhead: building specialists per stage versus leasing prebuilt ones
+
+Both strategies run the same four pipeline stages against the stub LLM server,
+so the difference between them is construction and cold LLM client cost.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_agents [--requests 20] [--concurrency 4] [--latency fixed:0.05]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from benchmarks.corpus import CORPUS_SIZES, generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+JOB_TITLE = "Senior Backend Engineer"
+JOB_DESCRIPTION = "Python, PostgreSQL, Kubernetes, AWS, distributed systems, mentoring."
+
+# Stages of a full pipeline request
+REQUEST_STAGES = ("sanitization", "optimization", "enhancement", "evaluation")
+
+
+def run(requests: int, concurrency: int) -> dict:
+    """
+    Time construction alone and whole requests under both strategies
+
+    Args:
+        requests: Requests per case
+        concurrency: Concurrent callers in the concurrent cases
+
+    Returns:
+        dict: Latency summaries per case
+    """
+    # Imported after LLM_BACKEND is set so agents are built against the stub
+    from core.agent_registry import STAGE_AGENTS, AgentRegistry
+    from core.workflow_orchestrator import OptimizationPipeline
+    from core import workflow_tasks
+
+    tasks = {
+        "sanitization": lambda agent, text: workflow_tasks.generate_sanitization_workflow(agent, text),
+        "optimization": lambda agent, text: workflow_tasks.generate_optimization_workflow(
+            agent, text, JOB_TITLE, JOB_DESCRIPTION
+        ),
+        "enhancement": lambda agent, text: workflow_tasks.generate_enhancement_workflow(agent, text),
+        "evaluation": lambda agent, text: workflow_tasks.generate_evaluation_workflow(
+            agent, text, JOB_TITLE, JOB_DESCRIPTION
+        ),
+    }
+
+    registry = AgentRegistry(STAGE_AGENTS, warm_size=concurrency)
+    warm_started = time.perf_counter()
+    registry.warm()
+    warm_ms = (time.perf_counter() - warm_started) * 1000
+
+    @contextmanager
+    def build_per_request(stage: str):
+        yield STAGE_AGENTS[stage]()
+
+    strategies = {"per_request": build_per_request, "registry": registry.lease}
+    roles, bullets = CORPUS_SIZES["small"]
+
+    def one_request(acquire, index: int) -> float:
+        # A distinct seed per request keeps prompts unique
+        resume = generate_resume(roles, bullets, seed=index)
+        pipeline = OptimizationPipeline(verbose=False)
+        started = time.perf_counter()
+        for stage in REQUEST_STAGES:
+            with acquire(stage) as agent:
+                pipeline._execute_stage(stage, [agent], [tasks[stage](agent, resume)])
+        return (time.perf_counter() - started) * 1000
+
+    def acquire_only(acquire) -> float:
+        started = time.perf_counter()
+        for stage in REQUEST_STAGES:
+            with acquire(stage):
+                pass
+        return (time.perf_counter() - started) * 1000
+
+    cases = {}
+    for name, acquire in strategies.items():
+        one_request(acquire, -1)  # warm-up: imports and first connection
+        cases[f"acquire/{name}"] = summarize([acquire_only(acquire) for _ in range(requests)])
+
+        started = time.perf_counter()
+        sequential = [one_request(acquire, index) for index in range(requests)]
+        cases[f"request/{name}/sequential"] = dict(
+            summarize(sequential),
+            throughput_rps=round(requests / (time.perf_counter() - started), 3)
+        )
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            concurrent = list(pool.map(lambda index: one_request(acquire, index), range(requests, requests * 2)))
+        cases[f"request/{name}/concurrency_{concurrency}"] = dict(
+            summarize(concurrent),
+            throughput_rps=round(requests / (time.perf_counter() - started), 3)
+        )
+
+    cases["registry/warm_up"] = {"count": 1, "mean_ms": round(warm_ms, 3)}
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20, help="Requests per case")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--latency", default="fixed:0.05", help="Stub LLM latency distribution")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_server(StubLLM(args.latency, resume_size="small"))
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        cases = run(args.requests, args.concurrency)
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["mean_ms", "p50_ms", "p95_ms", "throughput_rps"])
+    parameters = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "latency": args.latency,
+        "stages": list(REQUEST_STAGES),
+    }
+    return finish(build_report("agents", cases, parameters), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
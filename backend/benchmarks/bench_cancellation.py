@@ -0,0 +1,172 @@
+"""
+Cancellation Benchmark
+Abandons optimize requests mid-pipeline and measures the LLM work and capacity that cancellation frees
+
+For each setting of CANCEL_ON_DISCONNECT the API is spawned on a small LLM
+pool against the stub LLM. A burst of clients time out and disconnect
+shortly after sending, then a probe client sends one optimize request and
+waits for it. With cancellation the abandoned pipelines stop at their next
+stage, so the stub serves fewer calls and the probe is answered sooner.
+The suite exits non-zero if cancellation saves no LLM calls.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_cancellation [--abandoned 8] [--workers 2] [--latency fixed:0.3]
+"""
+
+import re
+import sys
+import time
+import asyncio
+import argparse
+from typing import Dict
+
+import httpx
+
+from benchmarks.bench_http import JOB_TITLE, JOB_DESCRIPTION, _free_port, spawn_api
+from benchmarks.corpus import generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+_SAMPLE_LINE = re.compile(r"^(\w+)\{([^}]*)\} (\S+)$")
+
+
+def optimize_payload(seed: int) -> dict:
+    # Unique resumes so no request resumes another's checkpoints
+    return {
+        "resume_text": generate_resume(3, 5, seed=seed),
+        "job_title": JOB_TITLE,
+        "job_description": JOB_DESCRIPTION,
+    }
+
+
+def cancel_counters(base_url: str) -> Dict[str, float]:
+    """Sum the cancellation counters from /metrics, keyed by metric name (and stage state)"""
+    totals: Dict[str, float] = {}
+    for line in httpx.get(f"{base_url}/metrics", timeout=10).text.splitlines():
+        match = _SAMPLE_LINE.match(line)
+        if not match or "cancelled" not in match.group(1):
+            continue
+        name = match.group(1)
+        state = re.search(r'state="(\w+)"', match.group(2))
+        key = f"{name}:{state.group(1)}" if state else name
+        totals[key] = totals.get(key, 0.0) + float(match.group(3))
+    return totals
+
+
+async def abandon_and_probe(base_url: str, abandoned: int, abandon_after: float) -> float:
+    """
+    Send requests that disconnect early, then time one request sent behind them
+
+    Args:
+        base_url: API root URL
+        abandoned: Requests whose clients give up
+        abandon_after: Seconds before those clients disconnect
+
+    Returns:
+        float: Probe latency in milliseconds
+    """
+    async def abandon(seed: int):
+        async with httpx.AsyncClient(base_url=base_url, timeout=abandon_after) as client:
+            try:
+                await client.post("/api/optimize", json=optimize_payload(seed))
+            except httpx.TimeoutException:
+                pass
+
+    burst = [asyncio.ensure_future(abandon(seed)) for seed in range(abandoned)]
+    await asyncio.sleep(0.05)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+        started = time.perf_counter()
+        response = await client.post("/api/optimize", json=optimize_payload(10_000))
+        response.raise_for_status()
+        probe_ms = (time.perf_counter() - started) * 1000
+    await asyncio.gather(*burst)
+    return probe_ms
+
+
+def wait_until_idle(base_url: str, timeout: float = 120):
+    """Wait for abandoned work still running on the LLM executor to finish"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        llm = httpx.get(f"{base_url}/api/health", timeout=10).json()["executors"]["llm"]
+        if llm["in_flight"] == 0 and llm["queued"] == 0:
+            return
+        time.sleep(0.2)
+    raise RuntimeError("LLM executor did not drain")
+
+
+def run_case(stub_url: str, stub: StubLLM, cancel: bool, args: argparse.Namespace) -> dict:
+    """Spawn the API with one CANCEL_ON_DISCONNECT setting and abandon a burst of requests"""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = spawn_api(
+        stub_url,
+        port,
+        CANCEL_ON_DISCONNECT="true" if cancel else "false",
+        LLM_WORKERS=str(args.workers),
+        DISCONNECT_POLL_SECONDS="0.05"
+    )
+    try:
+        deadline = time.time() + 120
+        while httpx.get(f"{base_url}/api/ready", timeout=10).status_code != 200:
+            if time.time() > deadline:
+                raise RuntimeError("Agents did not warm up within 120 seconds")
+            time.sleep(0.25)
+
+        calls_before = stub.requests
+        started = time.perf_counter()
+        probe_ms = asyncio.run(abandon_and_probe(base_url, args.abandoned, args.abandon_after))
+        wait_until_idle(base_url)
+        drain_ms = (time.perf_counter() - started) * 1000
+
+        counters = cancel_counters(base_url)
+        return {
+            "probe_ms": round(probe_ms, 3),
+            "drain_ms": round(drain_ms, 3),
+            "llm_calls": stub.requests - calls_before,
+            "requests_cancelled": counters.get("http_requests_cancelled_total", 0),
+            "stages_skipped": counters.get("pipeline_stages_cancelled_total:skipped", 0),
+            "stages_interrupted": counters.get("pipeline_stages_cancelled_total:interrupted", 0),
+            "llm_requests_refused": counters.get("llm_requests_cancelled_total", 0),
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--abandoned", type=int, default=8, help="Requests whose clients disconnect")
+    parser.add_argument("--abandon-after", type=float, default=0.5, help="Seconds before they disconnect")
+    parser.add_argument("--workers", type=int, default=2, help="LLM_WORKERS of the spawned API")
+    parser.add_argument("--latency", default="fixed:0.3", help="Stub LLM latency distribution")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency)
+    server = start_server(stub)
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        cases = {
+            "cancellation/disabled": run_case(stub_url, stub, False, args),
+            "cancellation/enabled": run_case(stub_url, stub, True, args),
+        }
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["probe_ms", "drain_ms", "llm_calls", "requests_cancelled", "stages_skipped", "stages_interrupted"])
+    parameters = {
+        "abandoned": args.abandoned,
+        "abandon_after": args.abandon_after,
+        "workers": args.workers,
+        "latency": args.latency,
+    }
+    status = finish(build_report("cancellation", cases, parameters), args)
+
+    if cases["cancellation/enabled"]["llm_calls"] >= cases["cancellation/disabled"]["llm_calls"]:
+        print("Cancellation saved no LLM calls")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Circuit Breaker Benchmark
+Runs optimizations through a simulated LLM outage and recovery with the breaker disabled and enabled
+
+The stub LLM answers every call with 503 during the outage phase. Without
+the breaker each optimization waits out SDK and stage retries and then
+fails; with it, optimizations are answered from local fallbacks once the
+circuit opens. After the outage the stub recovers and the suite measures
+how long the breaker takes to close again through its half-open probe.
+The suite exits non-zero if the breaker does not serve degraded results
+during the outage or does not recover afterwards.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_circuit_breaker [--runs 8] [--concurrency 4] [--open-seconds 2]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_pipeline import JOB_TITLE, JOB_DESCRIPTION
+from benchmarks.corpus import generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+
+def outage(runs: int, concurrency: int, seed: int) -> dict:
+    """
+    Run optimizations while every LLM call fails
+
+    Returns:
+        dict: Latency summary and counts of degraded and failed runs
+    """
+    from core.workflow_orchestrator import OptimizationPipeline
+
+    latencies = []
+    outcomes = {"ok": 0, "degraded": 0, "failed": 0}
+
+    def one_run(index: int):
+        pipeline = OptimizationPipeline(verbose=False)
+        started = time.perf_counter()
+        try:
+            pipeline.execute_full_optimization(generate_resume(3, 5, seed=seed + index), JOB_TITLE, JOB_DESCRIPTION)
+            outcomes["degraded" if pipeline.degraded_stages else "ok"] += 1
+        except Exception:
+            outcomes["failed"] += 1
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_run, range(runs)))
+    return dict(summarize(latencies), **outcomes)
+
+
+def recovery(timeout: float = 60) -> float:
+    """Seconds until an optimization runs without degraded stages again"""
+    from core.workflow_orchestrator import OptimizationPipeline
+
+    started = time.perf_counter()
+    index = 0
+    while time.perf_counter() - started < timeout:
+        pipeline = OptimizationPipeline(verbose=False)
+        pipeline.execute_full_optimization(generate_resume(3, 5, seed=10_000 + index), JOB_TITLE, JOB_DESCRIPTION)
+        if not pipeline.degraded_stages:
+            return round(time.perf_counter() - started, 3)
+        index += 1
+        time.sleep(0.1)
+    return float("inf")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=8, help="Optimizations during the outage")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--open-seconds", type=float, default=2.0, help="BREAKER_OPEN_SECONDS for the run")
+    parser.add_argument("--latency", default="fixed:0.02", help="Stub LLM latency distribution")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency)
+    server = start_server(stub)
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["BREAKER_OPEN_SECONDS"] = str(args.open_seconds)
+    try:
+        # Imported after the environment is set
+        from services.circuit_breaker import llm_breaker
+
+        cases = {}
+        for name, enabled in (("disabled", False), ("enabled", True)):
+            llm_breaker.enabled = enabled
+            stub.error_rate = 1.0
+            calls_before = stub.requests + stub.errors
+            case = outage(args.runs, args.concurrency, seed=len(cases) * 1000)
+            case["llm_calls"] = stub.requests + stub.errors - calls_before
+            stub.error_rate = 0.0
+            if enabled:
+                case["recovery_s"] = recovery()
+            cases[f"breaker/{name}"] = case
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["p50_ms", "max_ms", "degraded", "failed", "llm_calls", "recovery_s"])
+    parameters = {
+        "runs": args.runs,
+        "concurrency": args.concurrency,
+        "open_seconds": args.open_seconds,
+        "latency": args.latency,
+    }
+    status = finish(build_report("circuit_breaker", cases, parameters), args)
+
+    enabled = cases["breaker/enabled"]
+    if enabled["degraded"] == 0:
+        print("The breaker served no degraded results during the outage")
+        status = 1
+    if enabled["recovery_s"] == float("inf"):
+        print("The breaker did not close after the provider recovered")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
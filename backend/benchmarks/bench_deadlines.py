@@ -0,0 +1,101 @@
+"""
+Deadline Scheduling Benchmark
+Runs optimizations with heavy-tailed LLM latency with and without a deadline
+
+Without a deadline every stage runs to completion however slow the
+provider is; with one, the pipeline budgets stages from their observed
+latencies, answers the ones that do not fit locally and cuts off calls
+still running at the deadline. The suite reports latency, the share of
+runs that met the deadline and how many stages completed on the LLM, and
+exits non-zero if a run with a deadline overran it by more than --slack
+seconds or no stage completed on the LLM at all.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_deadlines [--runs 12] [--deadline 4] [--latency lognormal:0.4:0.8]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_pipeline import JOB_TITLE, JOB_DESCRIPTION
+from benchmarks.corpus import generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+
+def run_case(runs: int, concurrency: int, deadline_seconds, seed: int) -> dict:
+    """
+    Run optimizations, each under its own deadline if one is given
+
+    Returns:
+        dict: Latency summary, deadline hit rate and mean completed stages
+    """
+    from core.workflow_orchestrator import OptimizationPipeline
+    from services.deadlines import Deadline
+
+    latencies, completed = [], []
+
+    def one_run(index: int):
+        pipeline = OptimizationPipeline(verbose=False, deadline=Deadline.start(deadline_seconds))
+        started = time.perf_counter()
+        pipeline.execute_full_optimization(generate_resume(3, 5, seed=seed + index), JOB_TITLE, JOB_DESCRIPTION)
+        latencies.append((time.perf_counter() - started) * 1000)
+        completed.append(len(pipeline.completed_stages))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_run, range(runs)))
+    case = summarize(latencies)
+    if deadline_seconds:
+        case["met_deadline"] = round(sum(1 for ms in latencies if ms <= deadline_seconds * 1000) / runs, 3)
+    case["completed_stages"] = round(sum(completed) / runs, 2)
+    return case
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=12, help="Optimizations per case")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--deadline", type=float, default=4.0, help="Deadline in seconds")
+    parser.add_argument("--slack", type=float, default=0.5, help="Allowed overrun in seconds")
+    parser.add_argument("--latency", default="lognormal:0.4:0.8", help="Stub LLM latency distribution")
+    parser.add_argument("--warmup", type=int, default=8, help="Runs that seed the stage latency history")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency)
+    server = start_server(stub)
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        run_case(args.warmup, args.concurrency, None, seed=10_000)
+        cases = {
+            "deadline/none": run_case(args.runs, args.concurrency, None, seed=0),
+            f"deadline/{args.deadline:g}s": run_case(args.runs, args.concurrency, args.deadline, seed=0),
+        }
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["p50_ms", "p95_ms", "max_ms", "met_deadline", "completed_stages"])
+    parameters = {
+        "runs": args.runs,
+        "concurrency": args.concurrency,
+        "deadline": args.deadline,
+        "latency": args.latency,
+    }
+    status = finish(build_report("deadlines", cases, parameters), args)
+
+    bounded = cases[f"deadline/{args.deadline:g}s"]
+    if bounded["max_ms"] > (args.deadline + args.slack) * 1000:
+        print(f"A run overran the {args.deadline:g}s deadline by more than {args.slack:g}s")
+        status = 1
+    if bounded["completed_stages"] == 0:
+        print("No stage completed on the LLM within the deadline")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
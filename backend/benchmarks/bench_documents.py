@@ -0,0 +1,94 @@
+"""
+Document Service Microbenchmarks
+Times extraction, rendering and evaluation-JSON cleanup over the generated corpus
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_documents [--repeat 20] [--output results.json]
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+from services.document_processor import DocumentExtractor, DocumentGenerator
+from core.report_parser import parse_report
+from benchmarks.corpus import generate_corpus
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+
+_EVALUATION = {
+    "overall_score": 86,
+    "breakdown": {"keyword_match": 4.5, "section_structure": 5, "quantified_metrics": 4},
+    "missing_keywords": ["Kubernetes", "GraphQL"],
+    "quick_wins": ["Mention Kubernetes in the skills section"],
+    "summary": "Strong technical match.",
+}
+
+# Evaluation outputs in the shapes the LLM actually returns
+EVALUATION_SAMPLES = {
+    "plain": json.dumps(_EVALUATION),
+    "fenced": "```json\n" + json.dumps(_EVALUATION, indent=2) + "\n```",
+    "prose": "Here is the evaluation:\n" + json.dumps(_EVALUATION) + "\nLet me know if you need more.",
+    "python_style": str(_EVALUATION).replace("}", ",}"),
+    "invalid": "The resume scores well overall but lacks Kubernetes experience.",
+}
+
+
+def time_calls(fn, args: tuple, repeat: int) -> dict:
+    """
+    Time repeated calls of fn after one warm-up call
+
+    Returns:
+        dict: Latency summary in milliseconds
+    """
+    fn(*args)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def run(repeat: int) -> dict:
+    """
+    Run every microbenchmark over each corpus size
+
+    Args:
+        repeat: Timed calls per case
+
+    Returns:
+        dict: Latency summary keyed by case name
+    """
+    cases = {}
+    for size, text in generate_corpus().items():
+        pdf_bytes = DocumentGenerator.text_to_pdf_bytes(text)
+        docx_bytes = DocumentGenerator.text_to_docx_bytes(text)
+        cases[f"text_to_pdf_bytes/{size}"] = time_calls(DocumentGenerator.text_to_pdf_bytes, (text,), repeat)
+        cases[f"text_to_docx_bytes/{size}"] = time_calls(DocumentGenerator.text_to_docx_bytes, (text,), repeat)
+        cases[f"extract_from_pdf/{size}"] = time_calls(DocumentExtractor.extract_from_pdf, (pdf_bytes,), repeat)
+        cases[f"extract_from_docx/{size}"] = time_calls(DocumentExtractor.extract_from_docx, (docx_bytes,), repeat)
+
+    # Local parsing only (no repair model call); failures are logged, which
+    # would swamp the timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        for shape, raw in EVALUATION_SAMPLES.items():
+            cases[f"parse_evaluation/{shape}"] = time_calls(parse_report, (raw, "evaluation", False), repeat * 50)
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    cases = run(args.repeat)
+    print_table(cases, ["mean_ms", "p50_ms", "p95_ms", "p99_ms"])
+    return finish(build_report("documents", cases, {"repeat": args.repeat}), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
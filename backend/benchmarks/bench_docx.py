@@ -0,0 +1,64 @@
+"""
+DOCX Generation Benchmark
+Compares the direct OOXML writer against the python-docx implementation
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_docx [--repeat 50]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from services.document_processor import DocumentGenerator
+from benchmarks.corpus import generate_corpus
+
+RENDERERS = {
+    "python_docx": DocumentGenerator.text_to_docx_bytes_python_docx,
+    "ooxml_writer": DocumentGenerator.text_to_docx_bytes,
+}
+
+
+def measure(renderer, text: str, repeat: int) -> dict:
+    """
+    Time a renderer and record its peak allocation for one call
+
+    Args:
+        renderer: Function converting resume text to DOCX bytes
+        text: Resume content
+        repeat: Number of timed iterations
+
+    Returns:
+        dict: Mean milliseconds per call and peak KiB allocated
+    """
+    renderer(text)  # warm-up
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        renderer(text)
+    mean_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    tracemalloc.start()
+    renderer(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"mean_ms": round(mean_ms, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="Timed iterations per renderer")
+    args = parser.parse_args()
+
+    print(f"{'size':<8} {'renderer':<14} {'mean ms':>10} {'peak KiB':>10}")
+    for size, text in generate_corpus().items():
+        results = {name: measure(fn, text, args.repeat) for name, fn in RENDERERS.items()}
+        for name, result in results.items():
+            print(f"{size:<8} {name:<14} {result['mean_ms']:>10} {result['peak_kib']:>10}")
+        speedup = results["python_docx"]["mean_ms"] / max(results["ooxml_writer"]["mean_ms"], 1e-9)
+        print(f"{size:<8} {'speedup':<14} {speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Hedged Request Benchmark
+Compares LLM call tail latency and upstream load with and without hedging against a stub with slow outliers
+
+Calls go through the shared LLM client as a deterministic stage would. The
+stub answers most calls quickly and a few very slowly (--latency
+tail:FAST:SLOW:PROBABILITY). The suite exits non-zero if hedging does not
+lower p99 latency or if it sends more extra requests than its load cap
+allows.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_hedging [--calls 400] [--concurrency 8] [--latency tail:0.05:1.0:0.03]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_llm_http import MESSAGES
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+STAGE = "evaluation"
+
+
+def measure(stub: StubLLM, llm: object, calls: int, concurrency: int) -> dict:
+    """
+    Issue calls attributed to the benchmark stage and summarize their latency
+
+    Args:
+        stub: Running stub whose request counter is read
+        llm: Stub-backed LLM
+        calls: LLM calls to time
+        concurrency: Concurrent callers
+
+    Returns:
+        dict: Latency summary and upstream requests per call
+    """
+    from services.llm_hedging import llm_stage
+
+    latencies = []
+
+    def one_call(index: int):
+        with llm_stage(STAGE):
+            started = time.perf_counter()
+            llm.call(MESSAGES)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    requests_before = stub.requests
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_call, range(calls)))
+    # Losing copies may still be on the wire
+    time.sleep(1.0)
+    return dict(summarize(latencies), requests_per_call=round((stub.requests - requests_before) / calls, 4))
+
+
+def run(stub: StubLLM, calls: int, concurrency: int, warmup: int) -> dict:
+    """Time the same calls with hedging disabled and enabled for the stage"""
+    # Imported after STUB_LLM_URL is set
+    from core.llm_backends import create_llm
+    from services.llm_hedging import llm_hedger
+
+    llm = create_llm("gpt-4o-mini", 0.0, backend="stub")
+    cases = {}
+    for name, stages in (("off", frozenset()), ("on", frozenset({STAGE}))):
+        llm_hedger.stages = stages
+        # Hedge delays need a latency history
+        measure(stub, llm, warmup, concurrency)
+        before = llm_hedger.stats().get(STAGE, {})
+        case = measure(stub, llm, calls, concurrency)
+        after = llm_hedger.stats().get(STAGE, {})
+        hedged = after.get("hedged", 0) - before.get("hedged", 0)
+        case.update(
+            hedge_rate=round(hedged / calls, 4),
+            win_rate=round((after.get("hedge_wins", 0) - before.get("hedge_wins", 0)) / hedged, 4) if hedged else 0.0,
+            throttled=after.get("throttled", 0) - before.get("throttled", 0)
+        )
+        cases[f"hedging/{name}"] = case
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=400, help="Timed LLM calls per case")
+    parser.add_argument("--warmup", type=int, default=60, help="Calls that build the latency history")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--latency", default="tail:0.05:1.0:0.03", help="Stub LLM latency distribution")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency)
+    server = start_server(stub)
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        cases = run(stub, args.calls, args.concurrency, args.warmup)
+    finally:
+        server.shutdown()
+
+    from services.llm_hedging import LLM_HEDGE_BURST, LLM_HEDGE_MAX_RATIO
+
+    print_table(cases, ["p50_ms", "p95_ms", "p99_ms", "max_ms", "requests_per_call", "hedge_rate", "win_rate"])
+    parameters = {
+        "calls": args.calls,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+        "latency": args.latency,
+        "max_ratio": LLM_HEDGE_MAX_RATIO,
+    }
+    status = finish(build_report("hedging", cases, parameters), args)
+
+    off, on = cases["hedging/off"], cases["hedging/on"]
+    if on["p99_ms"] >= off["p99_ms"]:
+        print(f"Hedging did not lower p99 latency ({off['p99_ms']}ms -> {on['p99_ms']}ms)")
+        status = 1
+    load_cap = 1 + LLM_HEDGE_MAX_RATIO + LLM_HEDGE_BURST / args.calls
+    if on["requests_per_call"] > load_cap:
+        print(f"Hedging exceeded its load cap ({on['requests_per_call']} requests per call, cap {load_cap:.3f})")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
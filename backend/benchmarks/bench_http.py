@@ -0,0 +1,184 @@
+"""
+HTTP Load Benchmark
+Drives concurrent requests at the API and reports p50/p95/p99 latency and throughput
+
+By default the API is started in a subprocess with LLM_BACKEND=stub against an
+in-process stub LLM server; pass --url to load an already running server.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_http [--requests 200] [--concurrency 16] [--scenario optimize]
+"""
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from benchmarks.corpus import generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+JOB_TITLE = "Senior Backend Engineer"
+JOB_DESCRIPTION = "Python, PostgreSQL, Kubernetes, AWS, distributed systems, mentoring."
+
+
+def _optimize(client: httpx.AsyncClient, index: int):
+    # Unique resumes so every request runs the pipeline instead of resuming checkpoints
+    return client.post("/api/optimize", json={
+        "resume_text": generate_resume(3, 5, seed=index),
+        "job_title": JOB_TITLE,
+        "job_description": JOB_DESCRIPTION,
+    })
+
+
+def _download_pdf(client: httpx.AsyncClient, index: int):
+    return client.post("/api/download/pdf", data={"resume_text": generate_resume(3, 5, seed=index % 8)})
+
+
+def _export(client: httpx.AsyncClient, index: int):
+    return client.post("/api/export", json={
+        "resume_text": generate_resume(3, 5, seed=index % 8),
+        "formats": ["pdf", "docx", "json"],
+    })
+
+
+def _health(client: httpx.AsyncClient, index: int):
+    return client.get("/api/health")
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "health": _health,
+    "download_pdf": _download_pdf,
+    "export": _export,
+    "optimize": _optimize,
+}
+
+
+async def load(base_url: str, scenario: str, requests: int, concurrency: int) -> dict:
+    """
+    Send requests with a fixed number of concurrent callers
+
+    Args:
+        base_url: API root URL
+        scenario: Key of SCENARIOS
+        requests: Total requests
+        concurrency: Concurrent callers
+
+    Returns:
+        dict: Latency summary of successful requests, throughput and status counts
+    """
+    send = SCENARIOS[scenario]
+    latencies = []
+    statuses = Counter()
+    next_index = iter(range(requests))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        await send(client, -1)  # warm-up
+
+        async def caller():
+            for index in next_index:
+                started = time.perf_counter()
+                try:
+                    response = await send(client, index)
+                    statuses[response.status_code] += 1
+                    if response.status_code < 400:
+                        latencies.append((time.perf_counter() - started) * 1000)
+                except httpx.HTTPError as e:
+                    statuses[type(e).__name__] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(caller() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return dict(
+        summarize(latencies),
+        throughput_rps=round(len(latencies) / elapsed, 3),
+        error_rate=round(1 - len(latencies) / requests, 4) if requests else 0.0,
+        statuses={str(status): count for status, count in statuses.items()}
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def spawn_api(stub_url: str, port: int, **env_overrides: str) -> subprocess.Popen:
+    """Start the API on the stub LLM backend (plus any env overrides) and wait until it answers"""
+    env = dict(
+        os.environ,
+        LLM_BACKEND="stub",
+        STUB_LLM_URL=stub_url,
+        RESUMEFORGE_DATA_DIR=tempfile.mkdtemp(prefix="resumeforge-bench-"),
+        **env_overrides
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("API process exited during startup")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/health", timeout=1)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError("API did not start within 60 seconds")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Load an already running API instead of spawning one")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Scenario(s) to run")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent callers")
+    parser.add_argument("--latency", default="fixed:0.2", help="Stub LLM latency distribution (spawned API only)")
+    add_arguments(parser)
+    args = parser.parse_args()
+    scenarios = args.scenario or ["health", "download_pdf", "optimize"]
+
+    server: Optional[object] = None
+    api_process: Optional[subprocess.Popen] = None
+    base_url = args.url
+    try:
+        if base_url is None:
+            server = start_server(StubLLM(args.latency))
+            port = _free_port()
+            api_process = spawn_api(f"http://127.0.0.1:{server.server_address[1]}/v1", port)
+            base_url = f"http://127.0.0.1:{port}"
+
+        cases = {}
+        for scenario in scenarios:
+            cases[f"http/{scenario}"] = asyncio.run(load(base_url, scenario, args.requests, args.concurrency))
+    finally:
+        if api_process is not None:
+            api_process.terminate()
+            api_process.wait(timeout=30)
+        if server is not None:
+            server.shutdown()
+
+    print_table(cases, ["p50_ms", "p95_ms", "p99_ms", "throughput_rps", "error_rate"])
+    parameters = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "latency": args.latency if args.url is None else None,
+        "url": args.url,
+    }
+    return finish(build_report("http", cases, parameters), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
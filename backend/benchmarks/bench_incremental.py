@@ -0,0 +1,134 @@
+"""
+Incremental Re-optimization Benchmark
+Compares full re-runs of an edited resume with incremental runs against the previous result
+
+The stub LLM echoes the resume it is given and takes --token-latency per
+output token, so stage latency follows the amount of text rewritten, as it
+does with a real model. For each corpus size a previous result is stored
+for the original resume, then the resume is re-optimized after editing no
+roles, one role and every role, with and without previous_result_id. The
+suite reports latency, completion tokens and rewritten sections, and exits
+non-zero if an incremental run after a one-role edit is not faster than a
+full re-run.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_incremental [--runs 3] [--size large] [--token-latency 0.002]
+"""
+
+import os
+import sys
+import time
+import uuid
+import argparse
+from typing import Optional
+
+from benchmarks.bench_pipeline import JOB_TITLE, JOB_DESCRIPTION
+from benchmarks.corpus import CORPUS_SIZES, generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+# Corpus sizes run by default (small resumes have a single role)
+DEFAULT_SIZES = ("medium", "large")
+
+
+def edit_roles(text: str, count: Optional[int]) -> str:
+    """Reword the first bullet of the first count roles (every role when None)"""
+    from core.resume_model import parse_resume
+
+    resume = parse_resume(text)
+    for role in resume.experience[:count]:
+        role.bullets[0] = role.bullets[0] + " across three teams"
+    return resume.render()
+
+
+def seed_previous(text: str) -> str:
+    """Store a result for the resume as an earlier optimization would have"""
+    from services.result_store import result_store
+
+    return result_store.save_result({
+        "resume_text": text,
+        "job_title": JOB_TITLE,
+        "job_description": JOB_DESCRIPTION,
+        "sanitized": text,
+        "optimized": text,
+        "enhanced": text,
+        "evaluation": {},
+        "degraded_stages": []
+    })
+
+
+def run_case(text: str, previous_result_id: Optional[str], runs: int) -> dict:
+    """
+    Optimize the resume runs times, each under a fresh run ID
+
+    Returns:
+        dict: Latency summary, mean completion tokens and rewritten sections
+    """
+    from api import operations
+
+    latencies, tokens, rewritten = [], [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = operations.optimize(
+            text,
+            JOB_TITLE,
+            JOB_DESCRIPTION,
+            run_id=uuid.uuid4().hex,
+            previous_result_id=previous_result_id
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        tokens.append(response["usage"]["completion_tokens"])
+        if response["incremental"] is not None:
+            rewritten.append(len(response["incremental"]["rewritten_sections"]))
+    case = summarize(latencies)
+    case["completion_tokens"] = round(sum(tokens) / runs, 1)
+    if rewritten:
+        case["rewritten_sections"] = round(sum(rewritten) / runs, 1)
+    return case
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3, help="Optimizations per case")
+    parser.add_argument("--size", choices=sorted(CORPUS_SIZES), default=None, help="Only this corpus size")
+    parser.add_argument("--latency", default="fixed:0.05", help="Stub LLM latency distribution")
+    parser.add_argument("--token-latency", type=float, default=0.002, help="Stub LLM seconds per output token")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency, echo=True, token_latency=args.token_latency)
+    server = start_server(stub)
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    sizes = [args.size] if args.size else list(DEFAULT_SIZES)
+    cases = {}
+    try:
+        run_case(generate_resume(2, 2), None, 1)  # warm-up
+        for size in sizes:
+            original = edit_roles(generate_resume(*CORPUS_SIZES[size]), 0)
+            previous_result_id = seed_previous(original)
+            for edit, count in (("none", 0), ("one_role", 1), ("all_roles", None)):
+                edited = edit_roles(original, count)
+                cases[f"{size}/full/{edit}"] = run_case(edited, None, args.runs)
+                cases[f"{size}/incremental/{edit}"] = run_case(edited, previous_result_id, args.runs)
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["p50_ms", "p95_ms", "completion_tokens", "rewritten_sections"])
+    parameters = {
+        "runs": args.runs,
+        "sizes": sizes,
+        "latency": args.latency,
+        "token_latency": args.token_latency,
+    }
+    status = finish(build_report("incremental", cases, parameters), args)
+
+    for size in sizes:
+        if cases[f"{size}/incremental/one_role"]["p50_ms"] >= cases[f"{size}/full/one_role"]["p50_ms"]:
+            print(f"Incremental runs after a one-role edit are not faster than full re-runs for {size} resumes")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+LLM Connection Reuse Benchmark
+Counts connections the stub LLM server sees for per-call, per-LLM and shared pooled clients
+
+The shared case must not open more connections than there are concurrent
+callers; the suite exits non-zero if it does, so it doubles as a reuse check.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_llm_http [--calls 120] [--concurrency 8] [--llms 24]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+MESSAGES = [
+    {"role": "system", "content": "You are ATS Compatibility Analyst."},
+    {"role": "user", "content": "Score this resume for a Senior Backend Engineer role."},
+]
+
+
+def run(stub: StubLLM, calls: int, concurrency: int, llm_count: int) -> dict:
+    """
+    Issue the same calls through three client strategies
+
+    Args:
+        stub: Running stub whose connection counter is read
+        calls: LLM calls per case
+        concurrency: Concurrent callers
+        llm_count: LLM instances shared round-robin by the callers
+            (like the agents a worker keeps in its registry)
+
+    Returns:
+        dict: Latency summary, connections opened and reuse ratio per case
+    """
+    # Imported after STUB_LLM_URL is set
+    from crewai import LLM
+    from core.llm_backends import STUB_LLM_URL, create_llm
+
+    def own_client() -> object:
+        return LLM(model="gpt-4o-mini", temperature=0.0, base_url=STUB_LLM_URL, api_key="stub")
+
+    def shared_client() -> object:
+        return create_llm("gpt-4o-mini", 0.0, backend="stub")
+
+    def measure(get_llm: Callable[[int], object]) -> dict:
+        connections_before = stub.connections
+        latencies = []
+
+        def one_call(index: int):
+            llm = get_llm(index)
+            started = time.perf_counter()
+            llm.call(MESSAGES)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one_call, range(calls)))
+        elapsed = time.perf_counter() - started
+        opened = stub.connections - connections_before
+        return dict(
+            summarize(latencies),
+            throughput_rps=round(calls / elapsed, 3),
+            connections=opened,
+            reuse_ratio=round(1 - opened / calls, 3)
+        )
+
+    per_llm = [own_client() for _ in range(llm_count)]
+    shared = [shared_client() for _ in range(llm_count)]
+    return {
+        "llm_http/per_call_client": measure(lambda index: own_client()),
+        "llm_http/per_llm_client": measure(lambda index: per_llm[index % llm_count]),
+        "llm_http/shared_pool": measure(lambda index: shared[index % llm_count]),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=120, help="LLM calls per case")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--llms", type=int, default=24, help="LLM instances reused by the callers")
+    parser.add_argument("--latency", default="fixed:0.02", help="Stub LLM latency distribution")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stub = StubLLM(args.latency)
+    server = start_server(stub)
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        cases = run(stub, args.calls, args.concurrency, args.llms)
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["p50_ms", "p95_ms", "throughput_rps", "connections", "reuse_ratio"])
+    parameters = {"calls": args.calls, "concurrency": args.concurrency, "llms": args.llms, "latency": args.latency}
+    status = finish(build_report("llm_http", cases, parameters), args)
+
+    shared_connections = cases["llm_http/shared_pool"]["connections"]
+    if shared_connections > args.concurrency:
+        print(f"Connection reuse check failed: {shared_connections} connections for {args.concurrency} callers")
+        return 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Pipeline Benchmark
+Runs the full optimization pipeline against the stub LLM server with controllable latency
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_pipeline [--runs 10] [--concurrency 4] [--latency fixed:0.2]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.corpus import CORPUS_SIZES, generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+JOB_TITLE = "Senior Backend Engineer"
+JOB_DESCRIPTION = "Python, PostgreSQL, Kubernetes, AWS, distributed systems, mentoring."
+
+
+def run(runs: int, concurrency: int, resume_size: str) -> dict:
+    """
+    Time full pipeline runs, sequentially and with concurrent callers
+
+    Args:
+        runs: Pipeline runs per case
+        concurrency: Concurrent callers in the concurrent case
+        resume_size: Corpus size of the input resume
+
+    Returns:
+        dict: Latency summaries for whole runs and for each stage
+    """
+    # Imported after LLM_BACKEND is set so agents are built against the stub
+    from core.workflow_orchestrator import OptimizationPipeline
+    from services.tracing import Trace, activate
+
+    roles, bullets = CORPUS_SIZES[resume_size]
+    stage_samples = {}
+
+    def one_run(index: int) -> float:
+        # A distinct seed per run keeps inputs (and cache keys) unique
+        resume = generate_resume(roles, bullets, seed=index)
+        trace = Trace()
+        started = time.perf_counter()
+        with activate(trace):
+            OptimizationPipeline(verbose=False).execute_full_optimization(resume, JOB_TITLE, JOB_DESCRIPTION)
+        elapsed = (time.perf_counter() - started) * 1000
+        for span_record in trace.spans:
+            stage_samples.setdefault(span_record["name"], []).append(span_record["duration_ms"])
+        return elapsed
+
+    one_run(-1)  # warm-up: imports, agent construction, connection setup
+    stage_samples.clear()
+
+    cases = {}
+    started = time.perf_counter()
+    sequential = [one_run(index) for index in range(runs)]
+    cases["pipeline/sequential"] = dict(
+        summarize(sequential),
+        throughput_rps=round(runs / (time.perf_counter() - started), 3)
+    )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        concurrent = list(pool.map(one_run, range(runs, runs * 2)))
+    cases[f"pipeline/concurrency_{concurrency}"] = dict(
+        summarize(concurrent),
+        throughput_rps=round(runs / (time.perf_counter() - started), 3)
+    )
+
+    for name, samples in sorted(stage_samples.items()):
+        cases[name] = summarize(samples)
+    return cases
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Pipeline runs per case")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--latency", default="fixed:0.2", help="Stub LLM latency distribution")
+    parser.add_argument("--resume-size", default="medium", choices=list(CORPUS_SIZES), help="Input resume size")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = start_server(StubLLM(args.latency, resume_size=args.resume_size))
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        cases = run(args.runs, args.concurrency, args.resume_size)
+    finally:
+        server.shutdown()
+
+    print_table(cases, ["mean_ms", "p50_ms", "p95_ms", "p99_ms", "throughput_rps"])
+    parameters = {
+        "runs": args.runs,
+        "concurrency": args.concurrency,
+        "latency": args.latency,
+        "resume_size": args.resume_size,
+    }
+    return finish(build_report("pipeline", cases, parameters), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Response Payload Benchmark
+Measures optimization payload bytes and serialization time for each response shape and encoder
+
+Intermediate resume versions are derived from corpus resumes the way the
+pipeline changes them: the optimized version rewrites some bullets and the
+enhanced version rewrites a few more and the summary. Each shape is
+serialized with the standard json module, with pydantic (full shape only,
+as the API does) and with the fast response class, and its body is
+measured raw, gzipped and, if brotli is installed, brotli-compressed. The
+suite exits non-zero if the delta shape is not smaller than the full one.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_responses [--repeat 200] [--size large]
+"""
+
+import sys
+import json
+import gzip
+import time
+import argparse
+from typing import Callable
+
+from api.main import OptimizationResponse
+from api.responses import (
+    FastJSONResponse,
+    GZIP_LEVEL,
+    BROTLI_QUALITY,
+    brotli_available,
+    orjson_available,
+    shape_optimization
+)
+from core import local_fallbacks
+from benchmarks.bench_pipeline import JOB_TITLE, JOB_DESCRIPTION
+from benchmarks.corpus import CORPUS_SIZES, generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table
+
+# Response variants as (shape, fields)
+VARIANTS = {
+    "full": ("full", None),
+    "delta": ("delta", None),
+    "enhanced+evaluation": ("full", ["enhanced", "evaluation"]),
+    "evaluation": ("full", ["evaluation"]),
+}
+
+
+def rewrite(text: str, every: int, marker: str) -> str:
+    """Rewrite every n-th bullet and the summary line as a pipeline stage would"""
+    lines = text.split("\n")
+    bullet = 0
+    for index, line in enumerate(lines):
+        if line.startswith("- "):
+            bullet += 1
+            if bullet % every == 0:
+                lines[index] = f"- {marker} {line[2:]} with measurable business impact"
+        elif index > 0 and lines[index - 1].strip("* ").upper() == "SUMMARY" and line:
+            lines[index] = f"{line} ({marker})"
+    return "\n".join(lines)
+
+
+def optimization_response(roles: int, bullets: int) -> dict:
+    """A full /api/optimize response built from a corpus resume"""
+    sanitized = generate_resume(roles, bullets)
+    optimized = rewrite(sanitized, 3, "Drove")
+    enhanced = rewrite(optimized, 4, "Owned")
+    return OptimizationResponse(
+        success=True,
+        sanitized=sanitized,
+        optimized=optimized,
+        enhanced=enhanced,
+        evaluation=json.loads(local_fallbacks.evaluate(enhanced, JOB_TITLE, JOB_DESCRIPTION)),
+        result_id="0" * 32,
+        run_id="0" * 32,
+        message="Resume optimization completed successfully!"
+    ).model_dump()
+
+
+def mean_ms(serialize: Callable[[], bytes], repeat: int) -> float:
+    serialize()  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        serialize()
+    return round((time.perf_counter() - started) * 1000 / repeat, 4)
+
+
+def measure(response: dict, shape: str, fields, repeat: int) -> dict:
+    """
+    Size and serialization cost of one response variant
+
+    Returns:
+        dict: Body bytes (raw and compressed) and mean milliseconds per encoder,
+            including the time to compute the shape
+    """
+    def shaped():
+        return shape_optimization(response, shape, fields) if shape != "full" or fields else response
+
+    fast = FastJSONResponse(None).render
+    body = fast(shaped())
+    case = {
+        "bytes": len(body),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=GZIP_LEVEL)),
+        "stdlib_ms": mean_ms(lambda: json.dumps(shaped()).encode("utf-8"), repeat),
+        "fast_ms": mean_ms(lambda: fast(shaped()), repeat),
+    }
+    if brotli_available():
+        import brotli
+        case["br_bytes"] = len(brotli.compress(body, quality=BROTLI_QUALITY))
+    if shape == "full" and not fields:
+        model = OptimizationResponse(**response)
+        case["pydantic_ms"] = mean_ms(model.model_dump_json, repeat)
+    return case
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="Timed serializations per case")
+    parser.add_argument("--size", choices=sorted(CORPUS_SIZES), default=None, help="Only this corpus size")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    sizes = [args.size] if args.size else list(CORPUS_SIZES)
+    cases = {}
+    for size in sizes:
+        response = optimization_response(*CORPUS_SIZES[size])
+        for name, (shape, fields) in VARIANTS.items():
+            cases[f"{size}/{name}"] = measure(response, shape, fields, args.repeat)
+
+    columns = ["bytes", "gzip_bytes", "br_bytes", "stdlib_ms", "pydantic_ms", "fast_ms"]
+    print_table(cases, columns)
+    print(f"fast encoder: {'orjson' if orjson_available() else 'json (orjson not installed)'}")
+    parameters = {"repeat": args.repeat, "sizes": sizes, "orjson": orjson_available(), "brotli": brotli_available()}
+    status = finish(build_report("responses", cases, parameters), args)
+
+    for size in sizes:
+        if cases[f"{size}/delta"]["bytes"] >= cases[f"{size}/full"]["bytes"]:
+            print(f"The delta shape is not smaller than the full shape for {size} resumes")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Resume Model Benchmark
+Compares the resume text stages used to receive with the compact form and bullet fragment they receive now
+
+For each corpus size the suite reports the characters of the rendered
+resume, its compact form (optimization and evaluation input) and the
+tagged bullet fragment (enhancement input), the share of bullets that fit
+in the enhancement stage's prompt budget before (700 characters of resume
+text) and after (ENHANCEMENT_FRAGMENT_CHARS of fragment), and the cost of
+parsing, rendering and splicing. It exits non-zero if a compact form or
+fragment is not smaller than the text, a resume does not survive a
+render/parse round trip or splicing an unchanged fragment changes the text.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_resume_model [--repeat 200] [--size large]
+"""
+
+import sys
+import time
+import argparse
+from typing import Callable
+
+from core.resume_model import bullet_fragment, compact_text, parse_fragment, parse_resume, splice_fragment
+from core.workflow_orchestrator import ENHANCEMENT_FRAGMENT_CHARS
+from benchmarks.corpus import CORPUS_SIZES, generate_resume
+from benchmarks.reporting import add_arguments, build_report, finish, print_table
+
+# Characters of resume text the enhancement prompt embedded before fragments
+TEXT_PREVIEW_CHARS = 700
+
+
+def mean_us(operation: Callable[[], object], repeat: int) -> float:
+    operation()  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    return round((time.perf_counter() - started) * 1_000_000 / repeat, 2)
+
+
+def measure(text: str, repeat: int) -> dict:
+    """
+    Representation sizes, prompt coverage and model costs for one resume
+
+    Returns:
+        dict: Character counts, bullet coverage and mean microseconds per operation
+    """
+    resume = parse_resume(text)
+    rendered = resume.render()
+    fragment = bullet_fragment(resume, ENHANCEMENT_FRAGMENT_CHARS)
+    rewritten = "\n".join(f"[{tag}] {item} with impact" for tag, item in parse_fragment(fragment).items())
+    bullets = sum(len(role.bullets) for role in resume.experience)
+    preview = rendered[:TEXT_PREVIEW_CHARS]
+    return {
+        "text_chars": len(rendered),
+        "compact_chars": len(compact_text(resume)),
+        "fragment_chars": len(bullet_fragment(resume)),
+        "text_bullets_seen": round(sum(f"- {b}" in preview for r in resume.experience for b in r.bullets) / bullets, 3),
+        "fragment_bullets_seen": round((len(parse_fragment(fragment)) - bool(resume.summary)) / bullets, 3),
+        "parse_us": mean_us(lambda: parse_resume(text), repeat),
+        "render_us": mean_us(resume.render, repeat),
+        "splice_us": mean_us(lambda: splice_fragment(text, resume, rewritten), repeat),
+        "round_trip": parse_resume(rendered) == resume,
+        "splice_identity": splice_fragment(text, resume, fragment)[0] == text,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="Timed operations per case")
+    parser.add_argument("--size", choices=sorted(CORPUS_SIZES), default=None, help="Only this corpus size")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    sizes = [args.size] if args.size else list(CORPUS_SIZES)
+    cases = {size: measure(generate_resume(*CORPUS_SIZES[size]), args.repeat) for size in sizes}
+
+    columns = [
+        "text_chars", "compact_chars", "fragment_chars", "text_bullets_seen",
+        "fragment_bullets_seen", "parse_us", "render_us", "splice_us"
+    ]
+    print_table(cases, columns)
+    parameters = {"repeat": args.repeat, "sizes": sizes, "fragment_chars": ENHANCEMENT_FRAGMENT_CHARS}
+    status = finish(build_report("resume_model", cases, parameters), args)
+
+    for size, case in cases.items():
+        if case["compact_chars"] >= case["text_chars"] or case["fragment_chars"] >= case["text_chars"]:
+            print(f"The compact form or fragment is not smaller than the text for {size} resumes")
+            status = 1
+        if not case["round_trip"]:
+            print(f"A {size} resume changed in a render/parse round trip")
+            status = 1
+        if not case["splice_identity"]:
+            print(f"Splicing an unchanged fragment changed a {size} resume")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
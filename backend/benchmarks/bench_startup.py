@@ -0,0 +1,125 @@
+"""
+Startup Benchmark
+Measures cold import time of the API module with -X importtime and enforces an import budget
+
+Each run imports the module in a fresh interpreter. The suite exits non-zero
+if the median import exceeds the budget or if a deferred dependency (crewai,
+the LLM SDKs, pypdf, python-docx, ReportLab) was imported at startup.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_startup [--runs 5] [--budget-ms 1500] [--top 15]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+
+# Cold import budget for the API module, in milliseconds
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", 1500))
+
+# Modules that must only load on first use
+DEFERRED_MODULES = ("crewai", "litellm", "openai", "httpx", "pypdf", "docx", "reportlab")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+_PROBE = """
+import sys, time, json
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+loaded = [name for name in {deferred!r} if name in sys.modules]
+print(json.dumps({{"import_ms": elapsed, "deferred_loaded": loaded}}))
+"""
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    Cumulative import time per module from -X importtime output
+
+    Args:
+        stderr: Interpreter stderr
+
+    Returns:
+        Dict[str, int]: Microseconds keyed by module name
+    """
+    cumulative = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative
+
+
+def cold_import(module: str) -> Tuple[dict, Dict[str, int]]:
+    """Import a module in a fresh interpreter and return its probe result and import times"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module, deferred=DEFERRED_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1]), parse_importtime(completed.stderr)
+
+
+def run(module: str, runs: int, top: int) -> Tuple[dict, List[str]]:
+    """
+    Import the module cold several times
+
+    Args:
+        module: Module to import
+        runs: Fresh interpreters to start
+        top: Slowest modules (by cumulative time) to report individually
+
+    Returns:
+        Tuple[dict, List[str]]: Cases, and deferred modules that were imported
+    """
+    import_ms = []
+    module_us: Dict[str, List[int]] = {}
+    deferred_loaded = set()
+    for _ in range(runs):
+        probe, cumulative = cold_import(module)
+        import_ms.append(probe["import_ms"])
+        deferred_loaded.update(probe["deferred_loaded"])
+        for name, micros in cumulative.items():
+            module_us.setdefault(name, []).append(micros)
+
+    cases = {f"startup/import_{module}": summarize(import_ms)}
+    slowest = sorted(module_us.items(), key=lambda item: -sum(item[1]) / len(item[1]))
+    for name, samples in slowest[:top]:
+        if name != module:
+            cases[f"module/{name}"] = summarize([micros / 1000 for micros in samples])
+    return cases, sorted(deferred_loaded)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="api.main", help="Module whose cold import is measured")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS, help="Median import budget")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    cases, deferred_loaded = run(args.module, args.runs, args.top)
+    print_table(cases, ["mean_ms", "p50_ms", "max_ms"])
+    parameters = {"module": args.module, "runs": args.runs, "budget_ms": args.budget_ms}
+    status = finish(build_report("startup", cases, parameters), args)
+
+    median = cases[f"startup/import_{args.module}"]["p50_ms"]
+    if median > args.budget_ms:
+        print(f"Import budget exceeded: {args.module} took {median:.0f}ms (budget {args.budget_ms:.0f}ms)")
+        status = 1
+    if deferred_loaded:
+        print(f"Deferred modules imported at startup: {', '.join(deferred_loaded)}")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Benchmark Corpus
+Generates synthetic resumes of controllable size in the standard resume format
+"""
+
+import random
+
+_SKILL_GROUPS = {
+    "Programming Languages": ["Python", "SQL", "TypeScript", "Go", "Java"],
+    "Machine Learning & NLP": ["PyTorch", "TensorFlow/Keras", "Hugging Face Transformers", "scikit-learn"],
+    "Cloud & DevOps": ["AWS", "Docker", "Kubernetes", "Terraform", "GitHub Actions"],
+}
+
+_VERBS = ["Led", "Architected", "Spearheaded", "Delivered", "Optimized", "Automated", "Designed", "Scaled"]
+_OBJECTS = [
+    "a real-time analytics platform",
+    "the customer onboarding service",
+    "ML models for demand forecasting",
+    "CI/CD pipelines for 12 microservices",
+    "a data warehouse migration",
+    "an internal search engine",
+]
+_OUTCOMES = [
+    "reducing latency by {n}%",
+    "saving ${n}K annually",
+    "improving accuracy by {n}%",
+    "cutting deployment time by {n}%",
+    "serving {n}M+ daily requests",
+]
+
+# Named corpus sizes as number of roles and bullets per role
+CORPUS_SIZES = {
+    "small": (1, 3),
+    "medium": (3, 5),
+    "large": (6, 8),
+    "xlarge": (12, 10),
+}
+
+
+def generate_resume(roles: int = 3, bullets_per_role: int = 5, seed: int = 7) -> str:
+    """
+    Build a deterministic synthetic resume
+
+    Args:
+        roles: Number of experience entries
+        bullets_per_role: Achievement bullets per entry
+        seed: Random seed so runs are comparable
+
+    Returns:
+        str: Resume text following RESUME_FORMAT_TEMPLATE conventions
+    """
+    rng = random.Random(seed)
+    lines = [
+        "**Alex Morgan**",
+        "alex.morgan@example.com",
+        "+1 555 010 2030",
+        "Austin, Texas",
+        "",
+        "---",
+        "",
+        "**SUMMARY**",
+        "Software engineer with a track record of shipping **data-intensive** products, "
+        "leading small teams and improving reliability across distributed systems.",
+        "",
+        "---",
+        "",
+        "**SKILLS**",
+        "",
+    ]
+    for group, skills in _SKILL_GROUPS.items():
+        lines.append(f"**{group}:**")
+        lines.extend(f"- {skill}" for skill in skills)
+        lines.append("")
+
+    lines.extend(["---", "", "**PROFESSIONAL EXPERIENCE**", ""])
+    for index in range(roles):
+        start_year = 2024 - (index + 1) * 2
+        lines.append(f"**Senior Engineer {index + 1}**")
+        lines.append(f"**Company {index + 1}, Austin, USA**")
+        lines.append(f"**Jan {start_year} - Dec {start_year + 1}**")
+        for _ in range(bullets_per_role):
+            outcome = rng.choice(_OUTCOMES).format(n=rng.randint(10, 90))
+            lines.append(f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)}, {outcome}")
+        lines.append("")
+
+    lines.extend([
+        "---",
+        "",
+        "**EDUCATION**",
+        "",
+        "**B.S. Computer Science**",
+        "**University of Texas, Austin, USA**",
+        "**2014**",
+    ])
+    return "\n".join(lines)
+
+
+def generate_corpus() -> dict:
+    """
+    Build one resume for each named corpus size
+
+    Returns:
+        dict: Resume text keyed by size name
+    """
+    return {
+        name: generate_resume(roles, bullets)
+        for name, (roles, bullets) in CORPUS_SIZES.items()
+    }
@@ -0,0 +1,61 @@
+"""
+Golden Evaluation Set
+Deterministic resume/job description pairs with the keywords each job expects
+"""
+
+from typing import Iterator
+
+from benchmarks.corpus import CORPUS_SIZES, generate_resume
+
+GOLDEN_JOBS = [
+    {
+        "job_id": "backend",
+        "job_title": "Senior Backend Engineer",
+        "job_description": (
+            "Design and operate Python microservices on AWS. Strong PostgreSQL, Kubernetes "
+            "and Terraform skills, experience with CI/CD, observability and mentoring engineers."
+        ),
+        "keywords": ["Python", "AWS", "PostgreSQL", "Kubernetes", "Terraform", "CI/CD", "mentoring"],
+    },
+    {
+        "job_id": "ml",
+        "job_title": "Machine Learning Engineer",
+        "job_description": (
+            "Build and deploy NLP models with PyTorch and Hugging Face Transformers. Own feature "
+            "pipelines in SQL, model monitoring, A/B testing and MLOps on Docker."
+        ),
+        "keywords": ["PyTorch", "Hugging Face", "NLP", "SQL", "A/B testing", "MLOps", "Docker"],
+    },
+    {
+        "job_id": "data",
+        "job_title": "Data Platform Engineer",
+        "job_description": (
+            "Own our data warehouse, streaming ingestion with Kafka and batch jobs in Spark. "
+            "Python and SQL required; experience with dbt, Airflow and data quality checks."
+        ),
+        "keywords": ["data warehouse", "Kafka", "Spark", "Python", "SQL", "dbt", "Airflow"],
+    },
+]
+
+# Corpus sizes included in the golden set
+GOLDEN_SIZES = ("small", "medium", "large")
+
+
+def golden_pairs() -> Iterator[dict]:
+    """
+    Yield every golden resume/job pair
+
+    Returns:
+        Iterator[dict]: pair_id, resume_text, job_title, job_description and keywords
+    """
+    for size_index, size in enumerate(GOLDEN_SIZES):
+        roles, bullets = CORPUS_SIZES[size]
+        resume_text = generate_resume(roles, bullets, seed=100 + size_index)
+        for job in GOLDEN_JOBS:
+            yield {
+                "pair_id": f"{job['job_id']}/{size}",
+                "resume_text": resume_text,
+                "job_title": job["job_title"],
+                "job_description": job["job_description"],
+                "keywords": job["keywords"],
+            }
@@ -0,0 +1,150 @@
+"""
+Quality vs Latency Harness
+Runs the golden set through each pipeline mode and compares speed, token spend and output quality
+
+Uses recorded LLM responses by default, so it runs offline and deterministically.
+Record the cassette once against the live API, then replay (from the backend directory):
+    python -m benchmarks.quality_harness --backend record
+    python -m benchmarks.quality_harness [--mode full --mode skip_sanitization]
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from typing import Dict, List
+
+from benchmarks.golden_set import golden_pairs
+from benchmarks.reporting import add_arguments, build_report, finish, print_table, summarize
+from benchmarks.stub_llm_server import StubLLM, start_server
+
+DEFAULT_CASSETTE = os.path.join(os.path.dirname(__file__), "cassettes", "quality.jsonl")
+
+_HEADING = re.compile(r"^\*\*([A-Z][A-Z &/]+)\*\*$")
+
+
+def keyword_coverage(text: str, keywords: List[str]) -> float:
+    """Fraction of expected keywords present in the text (case-insensitive)"""
+    lowered = text.lower()
+    return sum(1 for keyword in keywords if keyword.lower() in lowered) / len(keywords)
+
+
+def section_headings(text: str) -> set:
+    """Uppercase bold section headings such as **SUMMARY**"""
+    return {match.group(1) for match in map(_HEADING.match, (line.strip() for line in text.splitlines())) if match}
+
+
+def section_preservation(original: str, rewritten: str) -> float:
+    """Fraction of the original section headings still present after rewriting"""
+    headings = section_headings(original)
+    if not headings:
+        return 1.0
+    return len(headings & section_headings(rewritten)) / len(headings)
+
+
+def evaluate_mode(mode: str, pairs: List[dict]) -> dict:
+    """
+    Run every golden pair through one pipeline mode
+
+    Args:
+        mode: Key of PIPELINE_MODES
+        pairs: Golden pairs from golden_pairs()
+
+    Returns:
+        dict: Latency summary plus mean token and quality signals
+    """
+    from core.resume_format_template import validate_resume_format
+    from core.workflow_orchestrator import OptimizationPipeline
+    from services.tracing import Trace, activate
+
+    latencies, prompt_tokens, completion_tokens = [], [], []
+    coverage, format_passes, preservation, length_ratios = [], [], [], []
+    failures = 0
+
+    for pair in pairs:
+        trace = Trace()
+        started = time.perf_counter()
+        try:
+            with activate(trace):
+                _, _, enhanced, _ = OptimizationPipeline(verbose=False).execute_full_optimization(
+                    pair["resume_text"], pair["job_title"], pair["job_description"], mode=mode
+                )
+        except Exception as e:
+            failures += 1
+            print(f"{mode} {pair['pair_id']}: {e}")
+            continue
+
+        latencies.append((time.perf_counter() - started) * 1000)
+        attrs = [span_record.get("attrs", {}) for span_record in trace.spans]
+        prompt_tokens.append(sum(attr.get("prompt_tokens", 0) for attr in attrs))
+        completion_tokens.append(sum(attr.get("completion_tokens", 0) for attr in attrs))
+        coverage.append(keyword_coverage(enhanced, pair["keywords"]))
+        format_passes.append(1.0 if validate_resume_format(enhanced)[0] else 0.0)
+        preservation.append(section_preservation(pair["resume_text"], enhanced))
+        length_ratios.append(len(enhanced) / max(len(pair["resume_text"]), 1))
+
+    def mean(values: List[float]) -> float:
+        return round(sum(values) / len(values), 3) if values else 0.0
+
+    return dict(
+        summarize(latencies),
+        prompt_tokens=mean(prompt_tokens),
+        completion_tokens=mean(completion_tokens),
+        keyword_coverage=mean(coverage),
+        format_pass_rate=mean(format_passes),
+        section_preservation=mean(preservation),
+        length_ratio=mean(length_ratios),
+        failures=failures
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", action="append", help="Pipeline mode(s) to compare (default: all)")
+    parser.add_argument(
+        "--backend",
+        default="replay",
+        choices=["replay", "record", "stub"],
+        help="replay recorded responses, record them from the live API, or use the stub server"
+    )
+    parser.add_argument("--cassette", default=DEFAULT_CASSETTE, help="Recorded responses (JSONL)")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    # Configure the backend before the pipeline modules read it; a miss in
+    # replay is deterministic, so retrying it would only add latency
+    os.environ["LLM_BACKEND"] = args.backend
+    os.environ["LLM_CASSETTE_PATH"] = args.cassette
+    os.environ["STAGE_MAX_ATTEMPTS"] = "1"
+    server = None
+    if args.backend == "stub":
+        server = start_server(StubLLM())
+        os.environ["STUB_LLM_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    from core.workflow_orchestrator import PIPELINE_MODES
+
+    modes = args.mode or list(PIPELINE_MODES)
+    unknown = [mode for mode in modes if mode not in PIPELINE_MODES]
+    if unknown:
+        parser.error(f"Unknown mode(s): {', '.join(unknown)} (available: {', '.join(PIPELINE_MODES)})")
+
+    pairs = list(golden_pairs())
+    cases: Dict[str, dict] = {}
+    try:
+        for mode in modes:
+            cases[f"mode/{mode}"] = evaluate_mode(mode, pairs)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    print_table(cases, [
+        "p50_ms", "p95_ms", "prompt_tokens", "completion_tokens", "keyword_coverage",
+        "format_pass_rate", "section_preservation", "length_ratio", "failures"
+    ])
+    parameters = {"backend": args.backend, "pairs": len(pairs), "modes": modes}
+    return finish(build_report("quality", cases, parameters), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
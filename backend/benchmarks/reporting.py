@@ -0,0 +1,169 @@
+"""
+Benchmark Reporting
+Latency summaries, JSON result files and regression checks against a baseline
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+from typing import Dict, List, Optional
+
+# Directory holding baseline result files, one per suite
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+# Metrics compared against the baseline and whether higher values are better
+COMPARED_METRICS = {
+    "mean_ms": False,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "throughput_rps": True,
+    "keyword_coverage": True,
+    "format_pass_rate": True,
+    "section_preservation": True,
+}
+
+DEFAULT_TOLERANCE = 0.15
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples_ms: List[float]) -> dict:
+    """
+    Summarize latency samples
+
+    Args:
+        samples_ms: Latencies in milliseconds
+
+    Returns:
+        dict: count, mean, p50, p95, p99 and max in milliseconds
+    """
+    ordered = sorted(samples_ms)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def build_report(suite: str, cases: Dict[str, dict], parameters: Optional[dict] = None) -> dict:
+    """Wrap per-case results with run metadata"""
+    return {
+        "suite": suite,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "parameters": parameters or {},
+        "cases": cases,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Find metrics that regressed beyond the tolerance
+
+    Args:
+        report: Current results from build_report
+        baseline: Stored results of the same suite
+        tolerance: Allowed relative slowdown (0.15 = 15%)
+
+    Returns:
+        List[str]: One message per regression
+    """
+    regressions = []
+    for case, metrics in report["cases"].items():
+        baseline_metrics = baseline.get("cases", {}).get(case)
+        if not baseline_metrics:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            current = metrics.get(metric)
+            previous = baseline_metrics.get(metric)
+            if current is None or not previous:
+                continue
+            change = (current - previous) / previous
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(f"{case} {metric}: {previous} -> {current} ({change:+.1%})")
+    return regressions
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Add the shared output and baseline options to a benchmark CLI"""
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against (default: baselines/<suite>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative regression")
+
+
+def finish(report: dict, args: argparse.Namespace) -> int:
+    """
+    Write results, compare them with the baseline and return an exit code
+
+    Returns:
+        int: 1 if any metric regressed beyond the tolerance, else 0
+    """
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"Results written to {args.output}")
+
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f"{report['suite']}.json")
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path) or ".", exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    if not os.path.exists(baseline_path):
+        if args.baseline:
+            print(f"Baseline {baseline_path} not found")
+            return 1
+        return 0
+
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressions against {baseline_path} (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"No regressions against {baseline_path}")
+    return 0
+
+
+def print_table(cases: Dict[str, dict], columns: List[str]):
+    """Print selected metrics of each case as an aligned table"""
+    widths = [max(12, len(column) + 2) for column in columns]
+    print(f"{'case':<32}" + "".join(f"{column:>{width}}" for column, width in zip(columns, widths)))
+    for case, metrics in cases.items():
+        print(f"{case:<32}" + "".join(f"{metrics.get(column, ''):>{width}}" for column, width in zip(columns, widths)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare a benchmark result file with a baseline")
+    parser.add_argument("results", help="Result JSON written with --output")
+    parser.add_argument("baseline", help="Baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    cli_args = parser.parse_args()
+    with open(cli_args.results, encoding="utf-8") as results_file, open(cli_args.baseline, encoding="utf-8") as baseline_file:
+        found = compare(json.load(results_file), json.load(baseline_file), cli_args.tolerance)
+    for message in found:
+        print(message)
+    sys.exit(1 if found else 0)
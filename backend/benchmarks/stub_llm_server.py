@@ -0,0 +1,373 @@
+"""
+Stub LLM Server
+OpenAI-compatible chat completions endpoint returning canned stage outputs
+
+Lets the whole API run and be load-tested offline with LLM_BACKEND=stub
+(from the backend directory):
+    python -m benchmarks.stub_llm_server --port 8765 --latency lognormal:1.5:0.4
+"""
+
+import re
+import json
+import math
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+from .corpus import CORPUS_SIZES, generate_resume
+
+# Tagged summary/bullet lines of enhancement prompts (core.resume_model.bullet_fragment)
+FRAGMENT_ITEM = re.compile(r"^\[(S|\d+\.\d+)\] (.+)$", re.MULTILINE)
+
+# Agent role (from the system prompt) to pipeline stage
+ROLE_STAGES = {
+    "Document Sanitization Specialist": "sanitization",
+    "ATS Optimization Strategist": "optimization",
+    "Achievement Architecture Specialist": "enhancement",
+    "ATS Compatibility Analyst": "evaluation",
+    "Career Navigation Strategist": "career_guidance",
+    "Resume Quality Metrics Evaluator": "quality_scoring",
+}
+
+_EVALUATION = {
+    "overall_score": 86,
+    "breakdown": {
+        "keyword_match": 4.5,
+        "section_structure": 5,
+        "quantified_metrics": 4,
+        "action_verbs": 4.5,
+        "format_quality": 4.5
+    },
+    "missing_keywords": ["Kubernetes", "GraphQL"],
+    "quick_wins": ["Mention Kubernetes in the skills section", "Quantify the onboarding project"],
+    "summary": "Strong technical match with well quantified achievements."
+}
+
+_CAREER_GUIDANCE = {
+    "skill_gaps": ["system design", "GraphQL"],
+    "recommended_actions": [
+        {"action": "Complete a system design course", "timeline": "1-2 months", "priority": "High"}
+    ],
+    "transferable_skills": ["technical leadership", "data pipelines"],
+    "target_companies": ["Stripe", "Datadog"],
+    "networking_tips": "Join local platform engineering meetups"
+}
+
+_QUALITY_SCORE = {
+    "overall_score": 84,
+    "dimension_scores": {
+        "clarity": 9, "impact": 8, "keyword_optimization": 8, "quantification": 9,
+        "formatting": 9, "achievement_focus": 8, "storytelling": 7,
+        "skills_relevance": 9, "experience_depth": 8, "overall_polish": 9
+    },
+    "strengths": ["Quantified achievements", "Consistent formatting"],
+    "weaknesses": ["Summary could target the role more directly"],
+    "improvement_priority": ["Tailor the summary to the job title"]
+}
+
+
+def canned_outputs(resume_size: str = "medium") -> Dict[str, str]:
+    """
+    Build the stage outputs served by the stub
+
+    Args:
+        resume_size: Corpus size (see benchmarks.corpus.CORPUS_SIZES) of rewritten resumes
+
+    Returns:
+        Dict[str, str]: Output text per stage
+    """
+    roles, bullets = CORPUS_SIZES[resume_size]
+    resume = generate_resume(roles, bullets)
+    return {
+        "sanitization": resume,
+        "optimization": resume,
+        "enhancement": resume,
+        "evaluation": json.dumps(_EVALUATION),
+        "career_guidance": json.dumps(_CAREER_GUIDANCE),
+        "quality_scoring": json.dumps(_QUALITY_SCORE),
+    }
+
+
+def expand_compact(text: str) -> str:
+    """Turn a compact resume (core.resume_model.compact_text) back into the template layout"""
+    lines = text.strip().removesuffix("...").splitlines()
+    if not lines:
+        return ""
+    blocks = ["\n".join(f"**{part}**" if index == 0 else part for index, part in enumerate(lines[0].split(" | ")))]
+    experience = False
+    for line in lines[1:]:
+        title, separator, content = line.partition(":")
+        if title.isupper() and (separator or experience):
+            experience = not content.strip()
+            block = [f"**{title}**"]
+            if "SKILL" in title:
+                for group in content.split(";"):
+                    category, _, skills = group.partition(":")
+                    block += ["", f"**{category.strip()}:**"] + [f"- {skill.strip()}" for skill in skills.split(",")]
+            elif content.strip():
+                block += [part.strip() for part in content.split(";")] if title != "SUMMARY" else [content.strip()]
+            blocks.append(block)
+        elif experience and not line.startswith("- "):
+            blocks[-1] += [""] + [f"**{part.strip()}**" for part in line.split(" | ") if part.strip()]
+        elif len(blocks) > 1:
+            blocks[-1].append(line)
+    return "\n\n---\n\n".join(block if isinstance(block, str) else "\n".join(block) for block in blocks)
+
+
+# Where echoing rewrite stages find the resume in their prompt: (start marker, end marker, conversion)
+ECHO_MARKERS = {
+    "sanitization": ("the following resume text:\n\n", "\n\nREQUIREMENTS:", lambda text: text.removesuffix("...")),
+    "optimization": ("CURRENT RESUME:\n", "\n\nOPTIMIZATION STRATEGY:", expand_compact),
+}
+
+
+def parse_latency(spec: str, rng: random.Random) -> Callable[[], float]:
+    """
+    Parse a latency distribution spec into a sampler returning seconds
+
+    Supported specs: "fixed:S", "uniform:LOW:HIGH", "normal:MEAN:STDDEV",
+    "lognormal:MEDIAN:SIGMA" and "tail:S:SLOW:PROBABILITY" (S seconds, but
+    SLOW seconds for the given fraction of calls).
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(value) for value in params.split(":") if value]
+    if kind == "fixed" and len(values) == 1:
+        return lambda: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda: rng.uniform(values[0], values[1])
+    if kind == "normal" and len(values) == 2:
+        return lambda: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal" and len(values) == 2:
+        mu = math.log(values[0]) if values[0] > 0 else 0.0
+        return lambda: rng.lognormvariate(mu, values[1])
+    if kind == "tail" and len(values) == 3:
+        return lambda: values[1] if rng.random() < values[2] else values[0]
+    raise ValueError(f"Invalid latency spec '{spec}'")
+
+
+class StubLLM:
+    """Canned responses and latency samplers shared by the request handlers"""
+
+    def __init__(
+        self,
+        default_latency: str = "fixed:0",
+        stage_latency: Optional[Dict[str, str]] = None,
+        resume_size: str = "medium",
+        seed: int = 7,
+        error_rate: float = 0.0,
+        echo: bool = False,
+        token_latency: float = 0.0
+    ):
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.outputs = canned_outputs(resume_size)
+        self.default_latency = parse_latency(default_latency, self._rng)
+        self.stage_latency = {
+            stage: parse_latency(spec, self._rng)
+            for stage, spec in (stage_latency or {}).items()
+        }
+        self.error_rate = error_rate  # Fraction of calls answered with 503 (adjustable while running)
+        self.echo = echo  # Rewrite stages return the resume in their prompt instead of a canned one
+        self.token_latency = token_latency  # Seconds added per completion token
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def should_fail(self) -> bool:
+        """Sample whether this call simulates a provider outage"""
+        with self._lock:
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+    @staticmethod
+    def detect_stage(messages: list) -> str:
+        """Find the pipeline stage from the agent role in the prompt"""
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        for role, stage in ROLE_STAGES.items():
+            if role in prompt:
+                return stage
+        return "enhancement"
+
+    def answer(self, stage: str, messages: list) -> str:
+        """Canned stage output; tagged fragment items (and, with echo, resumes) in the prompt are echoed back"""
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        items = FRAGMENT_ITEM.findall(prompt)
+        if stage == "enhancement" and items:
+            return "\n".join(f"[{tag}] {text.rstrip('.')} with measurable business impact" for tag, text in items)
+        if self.echo and stage in ECHO_MARKERS:
+            marker, end, convert = ECHO_MARKERS[stage]
+            start = prompt.find(marker)
+            if start >= 0:
+                start += len(marker)
+                return convert(prompt[start:prompt.find(end, start)])
+        return self.outputs[stage]
+
+    def complete(self, payload: dict) -> dict:
+        """Produce a chat completion, sleeping for the stage's sampled latency (plus token_latency per output token)"""
+        messages = payload.get("messages", [])
+        stage = self.detect_stage(messages)
+        with self._lock:
+            self.requests += 1
+            delay = self.stage_latency.get(stage, self.default_latency)()
+
+        content = f"Thought: I now can give a great answer\nFinal Answer: {self.answer(stage, messages)}"
+        prompt_text = json.dumps(messages)
+        prompt_tokens = max(1, len(prompt_text) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        time.sleep(delay + completion_tokens * self.token_latency)
+        return {
+            "id": "chatcmpl-stub-" + hashlib.sha1(prompt_text.encode("utf-8")).hexdigest()[:12],
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+
+def make_handler(stub: StubLLM):
+    """Bind a request handler class to a StubLLM"""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes; with Nagle on, long-lived
+        # keep-alive connections stall on the client's delayed ACK
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            stub.connection_opened()
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, body: dict):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+            else:
+                self._send_json(200, {
+                    "status": "ok",
+                    "requests": stub.requests,
+                    "errors": stub.errors,
+                    "connections": stub.connections
+                })
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if stub.should_fail():
+                self._send_json(503, {"error": {"message": "Stub outage", "type": "server_error"}})
+                return
+            completion = stub.complete(payload)
+
+            if not payload.get("stream"):
+                self._send_json(200, completion)
+                return
+
+            # Single-chunk server-sent event stream
+            choice = completion["choices"][0]
+            chunks = [
+                dict(completion, object="chat.completion.chunk", choices=[{
+                    "index": 0, "delta": choice["message"], "finish_reason": None
+                }], usage=None),
+                dict(completion, object="chat.completion.chunk", choices=[{
+                    "index": 0, "delta": {}, "finish_reason": "stop"
+                }]),
+            ]
+            body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return StubHandler
+
+
+def start_server(stub: StubLLM, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Serve a StubLLM on a background thread
+
+    Args:
+        stub: Response and latency configuration
+        host: Bind address
+        port: Bind port (0 picks a free one, see server.server_address)
+
+    Returns:
+        ThreadingHTTPServer: Running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(stub))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _parse_stage_latency(values) -> Dict[str, str]:
+    stage_latency = {}
+    for value in values or []:
+        stage, _, spec = value.partition("=")
+        if stage not in ROLE_STAGES.values() or not spec:
+            raise SystemExit(f"Invalid --stage-latency '{value}' (expected STAGE=SPEC)")
+        stage_latency[stage] = spec
+    return stage_latency
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub OpenAI-compatible LLM server for offline testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="fixed:0", help="Default latency distribution, e.g. lognormal:1.5:0.4")
+    parser.add_argument("--stage-latency", action="append", help="Per-stage override, e.g. evaluation=fixed:0.5")
+    parser.add_argument("--resume-size", default="medium", help="Corpus size of rewritten resumes")
+    parser.add_argument("--seed", type=int, default=7, help="Latency sampling seed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls answered with 503")
+    parser.add_argument("--echo", action="store_true", help="Rewrite stages return the resume they were given")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Seconds added per completion token")
+    args = parser.parse_args()
+
+    stub = StubLLM(
+        args.latency,
+        _parse_stage_latency(args.stage_latency),
+        args.resume_size,
+        args.seed,
+        args.error_rate,
+        args.echo,
+        args.token_latency
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(stub))
+    server.daemon_threads = True
+    print(f"Stub LLM server listening on http://{args.host}:{args.port}/v1 (set STUB_LLM_URL to match)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,159 @@
+"""
+Specialist Agent Registry
+Builds each stage's agent and LLM client once per worker and lends it to one run at a time
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+from services.metrics import REGISTRY, CACHE_REQUESTS, CallbackMetric
+from .ai_specialists import (
+    create_document_sanitizer,
+    create_ats_strategist,
+    create_achievement_architect,
+    create_compatibility_analyst,
+    create_career_navigator,
+    create_metrics_evaluator
+)
+
+if TYPE_CHECKING:
+    from crewai import Agent
+
+logger = logging.getLogger(__name__)
+
+# Agents built per stage at startup; defaults to the LLM executor's
+# concurrency so a full worker never has to build one on the request path
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", os.getenv("LLM_WORKERS", 8)))
+
+# Factory of the specialist that runs each pipeline stage
+STAGE_AGENTS: Dict[str, Callable[[], "Agent"]] = {
+    "sanitization": create_document_sanitizer,
+    "optimization": create_ats_strategist,
+    "enhancement": create_achievement_architect,
+    "evaluation": create_compatibility_analyst,
+    "career_guidance": create_career_navigator,
+    "quality_scoring": create_metrics_evaluator,
+}
+
+
+class AgentRegistry:
+    """
+    Per-process pools of prebuilt specialist agents
+
+    A crewai Agent keeps execution state (its executor, crew and the
+    cumulative token usage of its LLM) while a task runs, so an agent is
+    leased to one stage run at a time instead of being shared. Idle agents
+    are reused most-recently-returned first, which keeps their LLM
+    client's connections warm; a lease on an empty pool builds a new agent
+    that joins the pool when it is returned.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], "Agent"]], warm_size: int = AGENT_POOL_SIZE):
+        """
+        Initialize empty pools
+
+        Args:
+            factories: Agent factory per stage
+            warm_size: Agents built per stage by warm()
+        """
+        self.factories = factories
+        self.warm_size = warm_size
+        self._idle: Dict[str, deque] = {stage: deque() for stage in factories}
+        self._lock = threading.Lock()
+        self.built = {stage: 0 for stage in factories}
+        self.leased = {stage: 0 for stage in factories}
+        self.ready = False
+        self.error: Optional[str] = None
+        self.warm_seconds: Optional[float] = None
+
+    def _build(self, stage: str) -> "Agent":
+        agent = self.factories[stage]()
+        with self._lock:
+            self.built[stage] += 1
+        return agent
+
+    def warm(self):
+        """
+        Fill every stage's pool up to warm_size and mark the registry ready
+
+        A failure is kept in error (and reported by stats()) instead of
+        raised, so the worker stays up and the readiness probe explains it.
+        """
+        started = time.perf_counter()
+        try:
+            for stage, idle in self._idle.items():
+                for _ in range(max(self.warm_size - len(idle), 0)):
+                    idle.append(self._build(stage))
+        except Exception as e:
+            self.error = f"Agent warm-up failed: {str(e)}"
+            logger.error(self.error, exc_info=True)
+            return
+        self.warm_seconds = round(time.perf_counter() - started, 3)
+        self.error = None
+        self.ready = True
+
+    @contextmanager
+    def lease(self, stage: str) -> Iterator["Agent"]:
+        """
+        Borrow the stage's agent for one run
+
+        An agent whose run raised is dropped rather than returned, so a
+        failure cannot leave half-finished state behind for the next run.
+
+        Args:
+            stage: Key of the factories mapping
+
+        Yields:
+            Agent: Exclusively leased agent
+        """
+        idle = self._idle[stage]
+        try:
+            agent = idle.pop()
+            CACHE_REQUESTS.inc(cache="agent_pool", result="hit")
+        except IndexError:
+            CACHE_REQUESTS.inc(cache="agent_pool", result="miss")
+            agent = self._build(stage)
+
+        with self._lock:
+            self.leased[stage] += 1
+        try:
+            yield agent
+            idle.append(agent)
+        finally:
+            with self._lock:
+                self.leased[stage] -= 1
+
+    def stats(self) -> dict:
+        """Readiness and pool occupancy"""
+        return {
+            "ready": self.ready,
+            "error": self.error,
+            "warm_seconds": self.warm_seconds,
+            "pool_size": self.warm_size,
+            "idle": {stage: len(idle) for stage, idle in self._idle.items()},
+            "leased": dict(self.leased),
+            "built": dict(self.built),
+        }
+
+
+# One registry per worker process
+agent_registry = AgentRegistry(STAGE_AGENTS)
+
+
+for _field, _type, _help in (
+    ("idle", "gauge", "Prebuilt agents waiting to be leased"),
+    ("leased", "gauge", "Agents currently running a stage"),
+    ("built", "counter", "Agents constructed, at warm-up or on demand"),
+):
+    REGISTRY.register(CallbackMetric(
+        f"agent_pool_{_field}" + ("_total" if _type == "counter" else ""),
+        _help,
+        ("stage",),
+        _type,
+        lambda field=_field: [((stage,), value) for stage, value in agent_registry.stats()[field].items()]
+    ))
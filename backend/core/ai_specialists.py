@@ -3,11 +3,16 @@ AI Specialist Agents Configuration
 Defines specialized AI agents for resume optimization workflow
 """
 
-from crewai import Agent
 import os
 
-# AI Model Configuration
-AI_MODEL = "gpt-4o-mini"
+from services.lazy_imports import lazy_import
+
+# crewai and the LLM SDKs load when the first agent is built
+crewai = lazy_import("crewai")
+llm_backends = lazy_import(".llm_backends", __package__)
+
+# AI Model Configuration (backend selected by LLM_BACKEND, see llm_backends.py)
+AI_MODEL = os.getenv("AI_MODEL", "gpt-4o-mini")
 TEMPERATURE_PRECISE = 0.0
 TEMPERATURE_BALANCED = 0.2
 TEMPERATURE_CREATIVE = 0.3
@@ -26,7 +31,7 @@ class AISpecialistFactory:
         Returns:
             Agent: Document sanitization specialist
         """
-        return Agent(
+        return crewai.Agent(
             role="Document Sanitization Specialist",
             goal="Transform raw document text into clean, structured content optimized for AI processing.",
             backstory=(
@@ -35,8 +40,7 @@ class AISpecialistFactory:
                 "removing formatting artifacts, normalizing structure, and preserving critical "
                 "content while eliminating noise. You work with precision and efficiency."
             ),
-            model=AI_MODEL,
-            temperature=TEMPERATURE_PRECISE,
+            llm=llm_backends.create_llm(AI_MODEL, TEMPERATURE_PRECISE),
             max_iter=MAX_ITERATIONS,
             max_execution_time=EXECUTION_TIMEOUT
         )
@@ -49,7 +53,7 @@ class AISpecialistFactory:
         Returns:
             Agent: ATS optimization strategist
         """
-        return Agent(
+        return crewai.Agent(
             role="ATS Optimization Strategist",
             goal="Engineer high-performance resumes that achieve 85+ ATS compatibility scores.",
             backstory=(
@@ -59,8 +63,7 @@ class AISpecialistFactory:
                 "and format resumes for maximum parsing accuracy. You combine technical expertise "
                 "with storytelling to create compelling, ATS-friendly narratives."
             ),
-            model=AI_MODEL,
-            temperature=TEMPERATURE_CREATIVE,
+            llm=llm_backends.create_llm(AI_MODEL, TEMPERATURE_CREATIVE),
             max_iter=MAX_ITERATIONS,
             max_execution_time=EXECUTION_TIMEOUT
         )
@@ -73,7 +76,7 @@ class AISpecialistFactory:
         Returns:
             Agent: Achievement architecture specialist
         """
-        return Agent(
+        return crewai.Agent(
             role="Achievement Architecture Specialist",
             goal="Transform ordinary descriptions into quantified, high-impact achievement statements.",
             backstory=(
@@ -83,8 +86,7 @@ class AISpecialistFactory:
                 "combine powerful action verbs, specific contributions, and measurable outcomes "
                 "to create compelling professional narratives."
             ),
-            model=AI_MODEL,
-            temperature=TEMPERATURE_BALANCED,
+            llm=llm_backends.create_llm(AI_MODEL, TEMPERATURE_BALANCED),
             max_iter=MAX_ITERATIONS,
             max_execution_time=EXECUTION_TIMEOUT
         )
@@ -97,7 +99,7 @@ class AISpecialistFactory:
         Returns:
             Agent: Compatibility analysis specialist
         """
-        return Agent(
+        return crewai.Agent(
             role="ATS Compatibility Analyst",
             goal="Deliver precise ATS compatibility scores with actionable optimization roadmaps.",
             backstory=(
@@ -107,8 +109,7 @@ class AISpecialistFactory:
                 "detailed scoring breakdowns and prioritized recommendations that hiring "
                 "managers can immediately implement."
             ),
-            model=AI_MODEL,
-            temperature=TEMPERATURE_PRECISE,
+            llm=llm_backends.create_llm(AI_MODEL, TEMPERATURE_PRECISE),
             max_iter=MAX_ITERATIONS,
             max_execution_time=EXECUTION_TIMEOUT
         )
@@ -121,7 +122,7 @@ class AISpecialistFactory:
         Returns:
             Agent: Career navigation specialist
         """
-        return Agent(
+        return crewai.Agent(
             role="Career Navigation Strategist",
             goal="Provide personalized career guidance and strategic next-step recommendations.",
             backstory=(
@@ -130,8 +131,7 @@ class AISpecialistFactory:
                 "demands to provide actionable career advice. Your recommendations are specific, "
                 "achievable, and aligned with current job market realities."
             ),
-            model=AI_MODEL,
-            temperature=TEMPERATURE_BALANCED,
+            llm=llm_backends.create_llm(AI_MODEL, TEMPERATURE_BALANCED),
             max_iter=MAX_ITERATIONS,
             max_execution_time=EXECUTION_TIMEOUT
         )
@@ -144,7 +144,7 @@ class AISpecialistFactory:
         Returns:
             Agent: Metrics evaluation specialist
         """
-        return Agent(
+        return crewai.Agent(
             role="Resume Quality Metrics Evaluator",
             goal="Conduct comprehensive resume assessments across 10+ quality dimensions.",
             backstory=(
@@ -154,8 +154,7 @@ class AISpecialistFactory:
                 "Your multi-dimensional scoring system helps candidates understand exactly "
                 "where their resume excels and where it needs improvement."
             ),
-            model=AI_MODEL,
-            temperature=TEMPERATURE_PRECISE,
+            llm=llm_backends.create_llm(AI_MODEL, TEMPERATURE_PRECISE),
             max_iter=MAX_ITERATIONS,
             max_execution_time=EXECUTION_TIMEOUT
         )
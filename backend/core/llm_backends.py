@@ -0,0 +1,205 @@
+"""
+LLM Backend Selection
+Builds the LLM used by every agent: live, recorded/replayed or a local stub server
+"""
+
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+from openai import OpenAI
+
+try:
+    from crewai.llms.providers.openai.completion import OpenAICompletion
+except ImportError:  # Provider layout of another crewai release: keep its own clients
+    OpenAICompletion = None
+
+from services.llm_http import LLM_HTTP_SHARED, llm_http_client
+from services.sqlite_store import DATA_DIR
+
+# Backend Configuration
+#   live   - call the provider API
+#   record - call the provider API and append responses to the cassette
+#   replay - answer from the cassette only (no network, no API key)
+#   stub   - call the local stub server (python -m benchmarks.stub_llm_server)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "live").lower()
+LLM_BACKENDS = ("live", "record", "replay", "stub")
+LLM_CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", os.path.join(DATA_DIR, "llm_cassette.jsonl"))
+STUB_LLM_URL = os.getenv("STUB_LLM_URL", "http://127.0.0.1:8765/v1")
+
+
+class CassetteMissError(RuntimeError):
+    """Raised in replay mode when a prompt was never recorded"""
+
+
+def prompt_key(model: str, messages: Any) -> str:
+    """
+    Hash a prompt into its cassette key
+
+    Args:
+        model: Model name
+        messages: Prompt string or list of role/content messages
+
+    Returns:
+        str: sha256 hex digest
+    """
+    payload = json.dumps({"model": model, "messages": messages}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """Append-only JSONL file of recorded LLM responses keyed by prompt hash"""
+
+    def __init__(self, path: str = LLM_CASSETTE_PATH):
+        self.path = path
+        self._entries: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            entries = {}
+            if os.path.exists(self.path):
+                with open(self.path, encoding="utf-8") as cassette_file:
+                    for line in cassette_file:
+                        if line.strip():
+                            entry = json.loads(line)
+                            entries[entry["key"]] = entry
+            self._entries = entries
+        return self._entries
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._load().get(key)
+
+    def record(self, key: str, response: str, usage: dict, role: Optional[str] = None):
+        """Store a response, replacing any earlier recording of the same prompt"""
+        entry = {"key": key, "role": role, "response": response, "usage": usage}
+        with self._lock:
+            self._load()[key] = entry
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as cassette_file:
+                cassette_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+class CassetteLLM(BaseLLM):
+    """
+    LLM that answers from a cassette, optionally recording live responses
+
+    With a delegate, misses are forwarded to it and recorded; without one
+    a miss raises CassetteMissError so replays never touch the network.
+    """
+
+    llm_type: str = "cassette"
+    cassette: Any = None
+    delegate: Optional[Any] = None
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None
+    ):
+        formatted = self._format_messages(messages)
+        key = prompt_key(self.model, formatted)
+        entry = self.cassette.get(key)
+        if entry is not None:
+            self._track_token_usage_internal(entry.get("usage") or {})
+            return entry["response"]
+
+        role = getattr(from_agent, "role", None)
+        if self.delegate is None:
+            raise CassetteMissError(
+                f"No recorded response for prompt {key[:12]} (agent: {role}); "
+                "record it with LLM_BACKEND=record"
+            )
+
+        before = self.delegate.get_token_usage_summary()
+        response = self.delegate.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model
+        )
+        after = self.delegate.get_token_usage_summary()
+        usage = {
+            "prompt_tokens": after.prompt_tokens - before.prompt_tokens,
+            "completion_tokens": after.completion_tokens - before.completion_tokens,
+            "total_tokens": after.total_tokens - before.total_tokens,
+        }
+        self._track_token_usage_internal(usage)
+        if isinstance(response, str):
+            self.cassette.record(key, response, usage, role)
+        return response
+
+
+# One cassette per process so recordings are appended through a single lock
+_cassette = Cassette()
+
+
+def _pooled(llm):
+    """
+    Send an OpenAI-compatible LLM's synchronous calls through the shared pool
+
+    crewai gives every LLM its own SDK client and connection pool; agents
+    call the model synchronously, so replacing the sync client is enough
+    for all stage traffic to reuse the process-wide connections. The
+    client and its parameters are private to crewai, so an LLM without
+    them keeps crewai's default client.
+    """
+    if not LLM_HTTP_SHARED or OpenAICompletion is None or not isinstance(llm, OpenAICompletion):
+        return llm
+    get_client_params = getattr(llm, "_get_client_params", None)
+    if getattr(llm, "interceptor", None) is not None or not callable(get_client_params) or not hasattr(llm, "_client"):
+        return llm
+    try:
+        llm._client = OpenAI(**get_client_params(), http_client=llm_http_client())
+    except (ValueError, TypeError, AttributeError):
+        # No API key yet, or parameters this SDK does not take: crewai's
+        # own client stays in place (or is built on first use)
+        pass
+    return llm
+
+
+def create_llm(model: str, temperature: float, backend: str = LLM_BACKEND, **options):
+    """
+    Build the LLM for an agent according to the configured backend
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        backend: One of LLM_BACKENDS
+        **options: Extra LLM settings such as max_tokens
+
+    Returns:
+        LLM instance to pass as Agent(llm=...)
+    """
+    if backend == "live":
+        return _pooled(LLM(model=model, temperature=temperature, **options))
+    if backend == "stub":
+        return _pooled(LLM(model=model, temperature=temperature, base_url=STUB_LLM_URL, api_key="stub", **options))
+    if backend == "record":
+        return CassetteLLM(
+            model=model,
+            temperature=temperature,
+            cassette=_cassette,
+            delegate=_pooled(LLM(model=model, temperature=temperature, **options)),
+            **options
+        )
+    if backend == "replay":
+        return CassetteLLM(model=model, temperature=temperature, cassette=_cassette, **options)
+
+    supported = ", ".join(LLM_BACKENDS)
+    raise ValueError(f"Unsupported LLM_BACKEND '{backend}' (supported: {supported})")
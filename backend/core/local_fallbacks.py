@@ -0,0 +1,166 @@
+"""
+Local Stage Fallbacks
+Rule-based stand-ins for LLM stages, served while the LLM circuit breaker is open
+"""
+
+import re
+import json
+import unicodedata
+from typing import Dict, List
+
+# Bullet glyphs normalized to "-" (as the sanitization agent is asked to); "*"
+# only counts when whitespace follows, so **HEADING** markup is left alone
+_BULLET = re.compile(r"^\s*(?:[•●▪◦‣∙·–—]|\*(?=\s))\s*")
+_PAGE_ARTIFACT = re.compile(r"^\s*(page\s+\d+(\s+of\s+\d+)?|\d+\s*/\s*\d+|\d{1,3})\s*$", re.IGNORECASE)
+_CONTROL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\u200b\ufeff]")
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9+#.\-]*[A-Za-z0-9+#]|[A-Za-z]")
+_NUMBER = re.compile(r"\d")
+
+SECTION_HEADINGS = ("summary", "skills", "experience", "education")
+
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could do does
+each either etc for from has have having how if in including into is it its job least like may more
+most must new not of on or other our own per plus preferred prior role required requirements should
+so strong such team than that the their them then there these they this those through to under
+understanding using via was we well were what when where which while who will with within work years
+you your
+""".split())
+
+ACTION_VERBS = frozenset("""
+accelerated achieved automated built championed consolidated created cut decreased delivered
+designed developed directed drove eliminated engineered established expanded generated grew
+implemented improved increased launched led managed mentored migrated modernized negotiated
+optimized orchestrated owned partnered published redesigned reduced refactored resolved
+scaled shipped simplified spearheaded streamlined trained transformed
+""".split())
+
+
+def sanitize(raw_document_text: str) -> str:
+    """
+    Clean extracted resume text without an LLM
+
+    Normalizes Unicode and bullets, drops control characters and page
+    number artifacts and collapses runs of whitespace and blank lines.
+
+    Args:
+        raw_document_text: Raw text from the uploaded document
+
+    Returns:
+        str: Cleaned resume text
+    """
+    text = _CONTROL.sub("", unicodedata.normalize("NFKC", raw_document_text))
+    lines = []
+    for line in text.splitlines():
+        if _PAGE_ARTIFACT.match(line):
+            continue
+        line = re.sub(r"[ \t]+", " ", _BULLET.sub("- ", line)).strip()
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def _keywords(text: str, limit: int = 40) -> List[str]:
+    """Distinct non-stopword terms in order of first appearance"""
+    seen = {}
+    for word in _WORD.findall(text):
+        key = word.lower()
+        if len(key) > 2 and key not in STOPWORDS and key not in seen:
+            seen[key] = word
+    return list(seen.values())[:limit]
+
+
+def _bullets(text: str) -> List[str]:
+    return [line.strip()[2:] for line in text.splitlines() if line.strip().startswith("- ")]
+
+
+def _signals(resume_content: str, requirements: str) -> Dict[str, object]:
+    """Ratios the local scores are built from"""
+    lowered = resume_content.lower()
+    keywords = _keywords(requirements)
+    missing = [keyword for keyword in keywords if keyword.lower() not in lowered]
+    bullets = _bullets(resume_content)
+    quantified = sum(1 for bullet in bullets if _NUMBER.search(bullet))
+    verb_led = sum(1 for bullet in bullets if bullet.split(" ", 1)[0].lower().strip(",.") in ACTION_VERBS)
+    long_lines = sum(1 for line in resume_content.splitlines() if len(line) > 160)
+    return {
+        "keyword_coverage": 1 - len(missing) / len(keywords) if keywords else 1.0,
+        "missing_keywords": missing,
+        "section_coverage": sum(1 for heading in SECTION_HEADINGS if heading in lowered) / len(SECTION_HEADINGS),
+        "quantified_ratio": quantified / len(bullets) if bullets else 0.0,
+        "action_verb_ratio": verb_led / len(bullets) if bullets else 0.0,
+        "format_ratio": 1 - long_lines / max(1, len(resume_content.splitlines())) if bullets else 0.4,
+    }
+
+
+def _quick_wins(signals: Dict[str, object]) -> List[str]:
+    wins = []
+    if signals["missing_keywords"]:
+        wins.append("Work these job keywords into the resume: " + ", ".join(signals["missing_keywords"][:5]))
+    if signals["quantified_ratio"] < 0.5:
+        wins.append("Add numbers (percentages, counts, time saved) to more bullet points")
+    if signals["action_verb_ratio"] < 0.5:
+        wins.append("Start bullet points with strong action verbs")
+    if signals["section_coverage"] < 1:
+        wins.append("Use clear Summary, Skills, Experience and Education sections")
+    return wins
+
+
+def evaluate(resume_content: str, target_position: str, position_requirements: str) -> str:
+    """
+    Estimate ATS compatibility from keyword and structure heuristics
+
+    Args:
+        resume_content: Resume to evaluate
+        target_position: Target job title
+        position_requirements: Job requirements/description
+
+    Returns:
+        str: Evaluation report JSON in the evaluation stage's format
+    """
+    signals = _signals(resume_content, f"{target_position} {position_requirements}")
+    breakdown = {
+        "keyword_match": signals["keyword_coverage"],
+        "section_structure": signals["section_coverage"],
+        "quantified_metrics": signals["quantified_ratio"],
+        "action_verbs": signals["action_verb_ratio"],
+        "format_quality": signals["format_ratio"],
+    }
+    breakdown = {name: round(1 + 4 * ratio, 1) for name, ratio in breakdown.items()}
+    return json.dumps({
+        "overall_score": round(sum(breakdown.values()) / len(breakdown) * 20),
+        "breakdown": breakdown,
+        "missing_keywords": signals["missing_keywords"][:10],
+        "quick_wins": _quick_wins(signals),
+        "summary": "Estimated locally from keyword and structure checks while AI evaluation is unavailable."
+    })
+
+
+def score_quality(resume_content: str, target_position: str) -> str:
+    """
+    Estimate quality dimensions from structure heuristics
+
+    Args:
+        resume_content: Resume to evaluate
+        target_position: Target job title
+
+    Returns:
+        str: Quality report JSON in the quality scoring stage's format
+    """
+    signals = _signals(resume_content, target_position)
+    ratios = {
+        "keyword_optimization": signals["keyword_coverage"],
+        "quantification": signals["quantified_ratio"],
+        "achievement_focus": signals["action_verb_ratio"],
+        "formatting": signals["format_ratio"],
+        "clarity": signals["section_coverage"],
+    }
+    dimension_scores = {name: round(1 + 9 * ratio, 1) for name, ratio in ratios.items()}
+    ranked = sorted(dimension_scores, key=dimension_scores.get)
+    return json.dumps({
+        "overall_score": round(sum(dimension_scores.values()) / len(dimension_scores) * 10),
+        "dimension_scores": dimension_scores,
+        "strengths": [name.replace("_", " ").capitalize() for name in ranked[-2:] if dimension_scores[name] >= 7],
+        "weaknesses": [name.replace("_", " ").capitalize() for name in ranked[:2] if dimension_scores[name] < 7],
+        "improvement_priority": _quick_wins(signals)
+    })
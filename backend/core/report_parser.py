@@ -0,0 +1,223 @@
+"""
+Structured Report Parsing
+Validates JSON reports from the evaluation, guidance and scoring stages against their schemas
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from services.circuit_breaker import llm_breaker
+from services.json_extract import extract_json, JSONExtractionError
+from services.lazy_imports import lazy_import
+from services.metrics import JSON_PARSE_FALLBACKS, LLM_TOKENS, REPORT_PARSES
+from services.usage import stage_record
+
+logger = logging.getLogger(__name__)
+
+# Only the repair call needs crewai's LLM stack
+llm_backends = lazy_import(".llm_backends", __package__)
+
+# A cheap model call that reformats output which local repair could not fix
+REPORT_REPAIR_ENABLED = os.getenv("REPORT_REPAIR_ENABLED", "true").lower() in ("1", "true", "yes")
+REPORT_REPAIR_MODEL = os.getenv("REPORT_REPAIR_MODEL", os.getenv("AI_MODEL", "gpt-4o-mini"))
+REPORT_REPAIR_MAX_TOKENS = int(os.getenv("REPORT_REPAIR_MAX_TOKENS", 1024))
+
+Score = Union[int, float]
+
+# Repair LLMs are built once per thread, so each one's token counts only
+# advance with that thread's calls
+_repair_llms = threading.local()
+
+
+class _Report(BaseModel):
+    """Base schema: unknown fields from the model are kept"""
+    model_config = ConfigDict(extra="allow")
+
+
+class EvaluationReport(_Report):
+    """ATS compatibility evaluation"""
+    overall_score: Score = Field(ge=0, le=100)
+    breakdown: Dict[str, Score] = {}
+    missing_keywords: List[str] = []
+    quick_wins: List[str] = []
+    summary: str = ""
+
+
+class RecommendedAction(_Report):
+    """One step of a career guidance plan"""
+    action: str
+    timeline: str = ""
+    priority: str = ""
+
+
+class CareerGuidanceReport(_Report):
+    """Career guidance and next steps"""
+    skill_gaps: List[str] = []
+    recommended_actions: List[RecommendedAction] = []
+    transferable_skills: List[str] = []
+    target_companies: List[str] = []
+    networking_tips: Union[str, List[str]] = ""
+
+
+class QualityScoreReport(_Report):
+    """Multi-dimensional quality assessment"""
+    overall_score: Score = Field(ge=0, le=100)
+    dimension_scores: Dict[str, Score] = {}
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    improvement_priority: List[str] = []
+
+
+REPORT_SCHEMAS: Dict[str, Type[_Report]] = {
+    "evaluation": EvaluationReport,
+    "career_guidance": CareerGuidanceReport,
+    "quality_score": QualityScoreReport,
+}
+
+
+def _validate(raw: str, schema: Type[_Report]) -> Tuple[Optional[dict], str]:
+    """
+    Parse and validate locally
+
+    Returns:
+        Tuple[Optional[dict], str]: (report or None, method or error message)
+    """
+    try:
+        data, method = json.loads(raw), "direct"
+    except (json.JSONDecodeError, TypeError):
+        try:
+            data, method = extract_json(raw), "local_repair"
+        except JSONExtractionError as e:
+            return None, str(e)
+
+    try:
+        return schema.model_validate(data).model_dump(), method
+    except ValidationError as e:
+        return None, f"Schema validation failed: {e.error_count()} error(s)"
+
+
+def _repair_llm() -> Any:
+    llm = getattr(_repair_llms, "llm", None)
+    if llm is None:
+        llm = _repair_llms.llm = llm_backends.create_llm(
+            REPORT_REPAIR_MODEL, 0.0, max_tokens=REPORT_REPAIR_MAX_TOKENS
+        )
+    return llm
+
+
+def _token_totals(llm: Any) -> Dict[str, int]:
+    summary = getattr(llm, "get_token_usage_summary", None)
+    usage = summary() if summary is not None else None
+    return {field: getattr(usage, field, 0) or 0 for field in ("prompt_tokens", "completion_tokens")}
+
+
+def _repair_with_llm(
+    raw: str,
+    schema: Type[_Report],
+    error: str,
+    report: str,
+    usage: Optional[List[Dict[str, Any]]] = None
+) -> Optional[str]:
+    """
+    Ask a cheap model to rewrite malformed output as JSON matching the schema
+
+    Like stage calls, the repair call goes through the LLM circuit breaker
+    (it is skipped while the circuit is open) and is recorded as a
+    "<report>_repair" usage record.
+
+    Returns:
+        Optional[str]: Repaired output, or None if no call was made or it failed
+    """
+    try:
+        llm = _repair_llm()
+    except Exception as e:
+        logger.warning("Report repair LLM for %s unavailable: %s", report, e)
+        return None
+    if not llm_breaker.allow():
+        logger.info("Report repair of %s skipped: LLM circuit open", report)
+        return None
+
+    prompt = (
+        "Rewrite the following text as a single JSON object matching this JSON schema. "
+        "Keep every value from the text, do not invent scores, and output only the JSON.\n\n"
+        f"SCHEMA:\n{json.dumps(schema.model_json_schema())}\n\n"
+        f"PROBLEM: {error}\n\n"
+        f"TEXT:\n{raw[:6000]}"
+    )
+    stage_name = f"{report}_repair"
+    baseline = _token_totals(llm)
+    started = time.perf_counter()
+    repaired = None
+    try:
+        repaired = llm.call(prompt)
+    except Exception as e:
+        logger.warning("Report repair call for %s failed: %s", report, e)
+    duration = time.perf_counter() - started
+    llm_breaker.record(duration, ok=repaired is not None)
+
+    tokens = {field: max(total - baseline[field], 0) for field, total in _token_totals(llm).items()}
+    LLM_TOKENS.observe(tokens["prompt_tokens"], stage=stage_name, direction="input")
+    LLM_TOKENS.observe(tokens["completion_tokens"], stage=stage_name, direction="output")
+    record = stage_record(
+        stage_name,
+        "success" if repaired is not None else "error",
+        duration,
+        model=str(getattr(llm, "model", None) or REPORT_REPAIR_MODEL),
+        attempts=1,
+        **tokens
+    )
+    if usage is not None:
+        usage.append(record)
+    return repaired
+
+
+def parse_report(
+    raw: str,
+    report: str,
+    repair: bool = REPORT_REPAIR_ENABLED,
+    usage: Optional[List[Dict[str, Any]]] = None
+) -> dict:
+    """
+    Parse a stage's JSON report, repairing formatting noise
+
+    Clean JSON is parsed directly; fences, prose, quoting and trailing
+    commas are fixed locally; only output that still fails is sent to a
+    repair model call. Reports that cannot be recovered carry a
+    parse_error and the raw output instead of invented values.
+
+    Args:
+        raw: Raw stage output
+        report: Key of REPORT_SCHEMAS
+        repair: Allow the repair model call
+        usage: Usage records of the operation; a repair call adds its own
+
+    Returns:
+        dict: Validated report fields
+    """
+    schema = REPORT_SCHEMAS[report]
+    raw = (raw or "").strip()
+
+    parsed, detail = _validate(raw, schema)
+    if parsed is None and repair and raw:
+        repaired = _repair_with_llm(raw, schema, detail, report, usage)
+        if repaired:
+            parsed, repair_detail = _validate(repaired, schema)
+            detail = "llm_repair" if parsed is not None else repair_detail
+
+    if parsed is not None:
+        REPORT_PARSES.inc(report=report, method=detail)
+        return parsed
+
+    REPORT_PARSES.inc(report=report, method="failed")
+    JSON_PARSE_FALLBACKS.inc(report=report)
+    logger.warning("Could not parse %s report: %s", report, detail)
+    return {
+        "parse_error": detail,
+        "raw_output": raw[:500] if raw else "No output"
+    }
@@ -0,0 +1,524 @@
+"""
+Structured Resume Model
+Compact parsed form of resumes in the RESUME_FORMAT_TEMPLATE layout, passed between pipeline stages
+"""
+
+import re
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Section kinds with structured content; all other sections are kept verbatim
+SECTION_KINDS = {
+    "summary": ("SUMMARY", "PROFILE", "OBJECTIVE"),
+    "skills": ("SKILL",),
+    "experience": ("EXPERIENCE", "EMPLOYMENT", "WORK HISTORY"),
+}
+
+# Words section titles are made of: a line is a title when every word is a
+# title word or qualifier ("PROFESSIONAL EXPERIENCE", "EDUCATION &
+# CERTIFICATIONS"), so role headings such as "SENIOR PROJECT MANAGER" are not
+SECTION_TITLE_WORDS = tuple(word for keywords in SECTION_KINDS.values() for keyword in keywords for word in keyword.split()) + (
+    "EDUCATION", "CERTIFICATION", "PROJECT", "AWARD", "HONOR", "PUBLICATION", "LANGUAGE",
+    "VOLUNTEER", "INTEREST", "ACHIEVEMENT", "TRAINING", "COURSEWORK", "LEADERSHIP", "REFERENCE",
+)
+SECTION_TITLE_QUALIFIERS = frozenset((
+    "PROFESSIONAL", "TECHNICAL", "CORE", "KEY", "RELEVANT", "SELECTED", "ADDITIONAL", "CAREER",
+    "EXECUTIVE", "OTHER", "AND",
+))
+
+# Fragment item lines: "[S] summary" or "[role.bullet] text"
+_ITEM = re.compile(r"^\s*\[(S|\d+\.\d+)\]\s*(.*\S)\s*$")
+_DIVIDERS = ("---", "___")
+_TITLE_WORD = re.compile(r"[A-Z]+")
+# Indentation and bullet marker kept when a line's text is replaced
+_LINE_PREFIX = re.compile(r"^\s*(?:[-•*](?:\s+|$))?")
+
+
+@dataclass(slots=True)
+class Contact:
+    name: str = ""
+    lines: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SkillGroup:
+    category: str
+    skills: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Role:
+    """Job entry: bold heading lines (title, company, dates) and achievement bullets"""
+    headings: List[str] = field(default_factory=list)
+    bullets: List[str] = field(default_factory=list)
+    # Line of each bullet in the parsed text (see splice_fragment)
+    bullet_lines: List[int] = field(default_factory=list, compare=False, repr=False)
+
+
+@dataclass(slots=True)
+class Section:
+    """
+    A section in document order with its own content
+
+    Summary, skills and experience sections keep their parsed summary,
+    skill groups or roles; other sections keep their lines.
+    """
+    title: str
+    kind: str = "other"
+    lines: List[str] = field(default_factory=list)
+    summary: str = ""
+    skills: List[SkillGroup] = field(default_factory=list)
+    roles: List[Role] = field(default_factory=list)
+    # Lines of the summary in the parsed text (see splice_fragment)
+    summary_lines: List[int] = field(default_factory=list, compare=False, repr=False)
+
+
+@dataclass(slots=True)
+class Resume:
+    contact: Contact = field(default_factory=Contact)
+    sections: List[Section] = field(default_factory=list)
+
+    @property
+    def summary(self) -> str:
+        """Summary of the first summary section (the one stages rewrite)"""
+        section = self.first("summary")
+        return section.summary if section is not None else ""
+
+    @property
+    def skills(self) -> List[SkillGroup]:
+        """Skill groups of all skills sections"""
+        return [group for section in self.sections if section.kind == "skills" for group in section.skills]
+
+    @property
+    def experience(self) -> List[Role]:
+        """Roles of all experience sections, in document order"""
+        return [role for section in self.sections if section.kind == "experience" for role in section.roles]
+
+    def first(self, kind: str) -> Optional[Section]:
+        """First section of a kind, if any"""
+        return next((section for section in self.sections if section.kind == kind), None)
+
+    def render(self) -> str:
+        """Resume text in the RESUME_FORMAT_TEMPLATE layout"""
+        blocks = ["\n".join([f"**{self.contact.name}**"] + self.contact.lines)]
+        for section in self.sections:
+            lines = [f"**{section.title}**"]
+            if section.kind == "summary":
+                lines.append(section.summary)
+            elif section.kind == "skills":
+                for group in section.skills:
+                    lines += ["", f"**{group.category}:**"] + [f"- {skill}" for skill in group.skills]
+            elif section.kind == "experience":
+                for role in section.roles:
+                    lines += [""] + [f"**{heading}**" for heading in role.headings]
+                    lines += [f"- {bullet}" for bullet in role.bullets]
+            else:
+                lines += section.lines
+            blocks.append("\n".join(lines))
+        return "\n\n---\n\n".join(blocks)
+
+
+def section_kind(title: str) -> str:
+    """Structured kind of a section title (or "other")"""
+    for kind, keywords in SECTION_KINDS.items():
+        if any(keyword in title for keyword in keywords):
+            return kind
+    return "other"
+
+
+def _is_title(plain: str) -> bool:
+    """Whether a whole line is a section title (see SECTION_TITLE_WORDS)"""
+    words = _TITLE_WORD.findall(plain)
+    titled = [word for word in words if word.startswith(SECTION_TITLE_WORDS)]
+    return bool(titled) and all(word in SECTION_TITLE_QUALIFIERS or word in titled for word in words)
+
+
+def _is_heading(line: str, plain: str, after_divider: bool) -> bool:
+    """All-caps section titles, or any all-caps line right after a divider"""
+    if not plain.isupper() or len(plain) >= 50 or plain.endswith(":") or _bullet(line) is not None:
+        return False
+    return after_divider or _is_title(plain)
+
+
+def _bullet(line: str) -> Optional[str]:
+    if line.startswith(("- ", "• ", "* ")) or line in ("-", "•"):
+        return line[1:].strip()
+    return None
+
+
+def parse_resume(text: str) -> Resume:
+    """
+    Parse resume text following RESUME_FORMAT_TEMPLATE conventions
+
+    The first line is the name and the lines up to the first section
+    heading are contact details. All-caps lines that are a section title
+    as a whole (see SECTION_TITLE_WORDS) or follow a "---" divider start
+    sections; other all-caps lines (companies, locations, role titles,
+    "AI/ML:" categories) do not. Summary, skills and experience sections
+    are structured; other sections (education, certifications, ...) keep
+    their lines. Summary and bullet lines remember their line number, so
+    rewrites can be spliced back into the text.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        Resume: Parsed resume
+    """
+    resume = Resume()
+    section: Optional[Section] = None
+    summary: List[str] = []
+    role: Optional[Role] = None
+    after_divider = False
+
+    for index, raw_line in enumerate(text.splitlines()):
+        line = raw_line.strip()
+        if line in _DIVIDERS:
+            after_divider = True
+            continue
+        plain = line.replace("**", "").strip()
+        if plain:
+            divided, after_divider = after_divider, False
+        else:
+            divided = False
+
+        if not resume.contact.name:
+            if plain:
+                resume.contact.name = plain
+            continue
+        if plain and _is_heading(line, plain, divided):
+            _end_summary(section, summary)
+            section = Section(plain, section_kind(plain))
+            resume.sections.append(section)
+            role = None
+            continue
+        if section is None:
+            if plain:
+                resume.contact.lines.append(plain)
+            continue
+
+        if section.kind == "summary":
+            if plain:
+                summary.append(line)
+                section.summary_lines.append(index)
+        elif section.kind == "skills":
+            _parse_skill_line(section, line, plain)
+        elif section.kind == "experience":
+            role = _parse_experience_line(section, role, line, plain, index)
+        elif plain or section.lines:
+            section.lines.append(line)
+
+    _end_summary(section, summary)
+    for section in resume.sections:
+        while section.lines and not section.lines[-1]:
+            section.lines.pop()
+    return resume
+
+
+def _end_summary(section: Optional[Section], summary: List[str]):
+    """Join the collected lines of a summary section"""
+    if section is not None and section.kind == "summary":
+        section.summary = " ".join(summary)
+    summary.clear()
+
+
+def _parse_skill_line(section: Section, line: str, plain: str):
+    """Category headings ("**Category:**" or "Category: a, b") and '-' skills"""
+    if not plain:
+        return
+    skill = _bullet(line)
+    if skill is not None:
+        if not section.skills:
+            section.skills.append(SkillGroup("Skills"))
+        section.skills[-1].skills.append(skill.replace("**", ""))
+        return
+    category, _, inline = plain.partition(":")
+    group = SkillGroup(category.strip())
+    group.skills += [item.strip() for item in inline.split(",") if item.strip()]
+    section.skills.append(group)
+
+
+def _parse_experience_line(
+    section: Section,
+    role: Optional[Role],
+    line: str,
+    plain: str,
+    index: int
+) -> Optional[Role]:
+    """Bold lines head a role (a bold line after bullets starts the next one); others are bullets"""
+    if not plain:
+        return role
+    bullet = _bullet(line)
+    if bullet is None and line.startswith("**"):
+        if role is None or role.bullets:
+            role = Role()
+            section.roles.append(role)
+        role.headings.append(plain)
+        return role
+    if role is None:
+        role = Role()
+        section.roles.append(role)
+    role.bullets.append(bullet if bullet is not None else plain)
+    role.bullet_lines.append(index)
+    return role
+
+
+def compact_text(resume: Resume) -> str:
+    """
+    Markup-free form of a resume for prompts that only read it
+
+    Drops bold markers, dividers and blank lines and puts contact details
+    and skill groups on one line each, so more of the resume fits in a
+    prompt's character budget.
+    """
+    lines = [" | ".join([resume.contact.name] + resume.contact.lines)]
+    for section in resume.sections:
+        if section.kind == "summary":
+            lines.append(f"{section.title}: {section.summary.replace('**', '')}")
+        elif section.kind == "skills":
+            groups = "; ".join(f"{group.category}: {', '.join(group.skills)}" for group in section.skills)
+            lines.append(f"{section.title}: {groups}")
+        elif section.kind == "experience":
+            lines.append(f"{section.title}:")
+            for role in section.roles:
+                lines.append(" | ".join(role.headings))
+                lines += [f"- {bullet}" for bullet in role.bullets]
+        else:
+            content = "; ".join(line.replace("**", "").strip() for line in section.lines if line.strip())
+            lines.append(f"{section.title}: {content}")
+    return "\n".join(lines)
+
+
+def bullet_fragment(resume: Resume, limit: Optional[int] = None) -> str:
+    """
+    The parts of a resume the enhancement stage rewrites, one tagged item per line
+
+    The summary is tagged [S] and bullets [role.bullet] (1-based, counted
+    over all experience sections). Role titles and companies are included
+    untagged as context. With a limit, items past it are left out whole;
+    splice_fragment keeps them unchanged.
+
+    Args:
+        resume: Parsed resume
+        limit: Maximum characters
+
+    Returns:
+        str: Fragment text
+    """
+    lines = [f"[S] {resume.summary}"] if resume.summary else []
+    for role_number, role in enumerate(resume.experience, 1):
+        lines.append(f"# {' | '.join(role.headings[:2])}")
+        lines += [f"[{role_number}.{number}] {bullet}" for number, bullet in enumerate(role.bullets, 1)]
+
+    if limit is not None:
+        kept, size = [], 0
+        for line in lines:
+            if size + len(line) + 1 > limit:
+                break
+            kept.append(line)
+            size += len(line) + 1
+        lines = kept
+    return "\n".join(lines)
+
+
+def parse_fragment(output: str) -> Dict[str, str]:
+    """Tagged items of a stage's fragment output, keyed by tag"""
+    items = {}
+    for line in output.splitlines():
+        match = _ITEM.match(line.replace("**", ""))
+        if match:
+            items[match.group(1)] = match.group(2).lstrip("-•* ").strip()
+    return items
+
+
+def splice_fragment(text: str, resume: Resume, output: str) -> Tuple[str, int]:
+    """
+    Write a stage's rewritten fragment items back into the text they came from
+
+    Only summary and bullet lines whose item was reworded are replaced
+    (keeping their indentation and bullet marker; a reworded summary takes
+    the place of all its lines). Every other line, including markup, blank
+    lines and dividers, stays as it was. Items missing from the output
+    keep their text; unknown tags are ignored.
+
+    Args:
+        text: Resume text
+        resume: The text parsed (parse_resume), as the fragment was built from
+        output: Stage output with tagged item lines
+
+    Returns:
+        Tuple[str, int]: Spliced text and the number of items applied
+    """
+    items = parse_fragment(output)
+    lines: List[Optional[str]] = list(text.splitlines())
+    applied, changed = 0, False
+
+    summary = resume.first("summary")
+    if summary is not None and summary.summary and "S" in items:
+        applied += 1
+        if items["S"] != summary.summary.replace("**", ""):
+            first, *rest = summary.summary_lines
+            lines[first] = _LINE_PREFIX.match(lines[first]).group() + items["S"]
+            for index in rest:
+                lines[index] = None
+            changed = True
+
+    for role_number, role in enumerate(resume.experience, 1):
+        for number, (bullet, index) in enumerate(zip(role.bullets, role.bullet_lines), 1):
+            rewritten = items.get(f"{role_number}.{number}")
+            if rewritten is None:
+                continue
+            applied += 1
+            if rewritten != bullet.replace("**", ""):
+                lines[index] = _LINE_PREFIX.match(lines[index]).group() + rewritten
+                changed = True
+
+    if not changed:
+        return text, applied
+    spliced = "\n".join(line for line in lines if line is not None)
+    return spliced + "\n" if text.endswith("\n") else spliced, applied
+
+
+def role_units(resume: Resume) -> List[Tuple[str, Role]]:
+    """Roles keyed "role:<title | company>" (lowercased; repeats get a "#n" suffix)"""
+    keyed, seen = [], {}
+    for role in resume.experience:
+        key = "role:" + " | ".join(role.headings[:2]).lower()
+        seen[key] = seen.get(key, 0) + 1
+        keyed.append((key if seen[key] == 1 else f"{key}#{seen[key]}", role))
+    return keyed
+
+
+def units(resume: Resume) -> Dict[str, Any]:
+    """
+    Resume content by section unit, in document order
+
+    Units are "contact", "summary" and "skills" (the first section of each
+    kind), one per role over all experience sections (see role_units) and
+    "section:<TITLE>" for every other section.
+    """
+    keyed: Dict[str, Any] = {"contact": resume.contact}
+    roles = iter(role_units(resume))
+    for section, key in _section_keys(resume):
+        if key == "summary":
+            keyed[key] = section.summary
+        elif key == "skills":
+            keyed[key] = section.skills
+        elif key is None:
+            keyed.update(next(roles) for _ in section.roles)
+        else:
+            keyed[key] = section
+    return keyed
+
+
+def _section_keys(resume: Resume) -> List[Tuple[Section, Optional[str]]]:
+    """Unit key of each section (None for experience sections, whose roles are units)"""
+    keyed, seen = [], set()
+    for section in resume.sections:
+        if section.kind == "experience":
+            keyed.append((section, None))
+        elif section.kind in ("summary", "skills") and section.kind not in seen:
+            seen.add(section.kind)
+            keyed.append((section, section.kind))
+        else:
+            keyed.append((section, f"section:{section.title}"))
+    return keyed
+
+
+def fingerprints(resume: Resume) -> Dict[str, str]:
+    """Content hash of each section unit"""
+    return {key: hashlib.sha256(repr(unit).encode("utf-8")).hexdigest()[:16] for key, unit in units(resume).items()}
+
+
+def changed_units(previous: Resume, current: Resume) -> List[str]:
+    """Units of the current resume that are new or differ from the previous one"""
+    before = fingerprints(previous)
+    return [key for key, fingerprint in fingerprints(current).items() if before.get(key) != fingerprint]
+
+
+def aligned_units(source: Resume, output: Resume) -> Dict[str, Any]:
+    """
+    Map a stage's output units onto the units of the resume it was given
+
+    Rewrites may reword role titles, so roles are matched by position when
+    both resumes have as many, and by key otherwise. Other units are
+    matched by key; units missing from the output are left out.
+
+    Args:
+        source: Resume a stage was given
+        output: Parsed stage output
+
+    Returns:
+        Dict[str, Any]: Output units keyed by the source's unit keys
+    """
+    source_units = units(source)
+    output_units = units(output)
+    aligned = {key: output_units[key] for key in source_units if key in output_units and not key.startswith("role:")}
+    source_roles = role_units(source)
+    if len(source_roles) == len(output.experience):
+        aligned.update((key, role) for (key, _), role in zip(source_roles, output.experience))
+    else:
+        aligned.update((key, output_units[key]) for key, _ in source_roles if key in output_units)
+    return aligned
+
+
+def rebuild(structure: Resume, replacements: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> Resume:
+    """
+    Resume with the sections of structure, taking units from replacements where given
+
+    Every experience section keeps its own roles; sections left without
+    units are dropped.
+
+    Args:
+        structure: Resume whose section order and units are used
+        replacements: Units to use instead, keyed as by units()
+        keys: Units to keep (all when None); the contact is always kept
+
+    Returns:
+        Resume: Rebuilt resume
+    """
+    keep = None if keys is None else set(keys)
+    resume = Resume(contact=replacements.get("contact", structure.contact))
+    roles = iter(role_units(structure))
+    for section, key in _section_keys(structure):
+        if key is None:
+            section_roles = [next(roles) for _ in section.roles]
+            kept = [replacements.get(role_key, role) for role_key, role in section_roles if keep is None or role_key in keep]
+            if kept:
+                resume.sections.append(Section(section.title, section.kind, roles=kept))
+        elif keep is not None and key not in keep:
+            continue
+        elif key == "summary":
+            resume.sections.append(Section(section.title, section.kind, summary=replacements.get(key, section.summary)))
+        elif key == "skills":
+            resume.sections.append(Section(section.title, section.kind, skills=replacements.get(key, section.skills)))
+        else:
+            content = replacements.get(key, section)
+            resume.sections.append(replace(content, title=section.title, kind=section.kind))
+    return resume
+
+
+def validate_resume(resume: Resume) -> Tuple[bool, List[str]]:
+    """
+    Check a parsed resume for the sections and entries the template requires
+
+    Args:
+        resume: Parsed resume
+
+    Returns:
+        Tuple of (is_valid, list of issues found)
+    """
+    issues = []
+    if not resume.contact.name:
+        issues.append("Missing name")
+    kinds = {section.kind for section in resume.sections}
+    for kind, label in (("summary", "SUMMARY"), ("skills", "SKILLS"), ("experience", "EXPERIENCE")):
+        if kind not in kinds:
+            issues.append(f"Missing required section: {label}")
+    if "summary" in kinds and not resume.summary:
+        issues.append("Empty summary")
+    for role in resume.experience:
+        if not role.bullets:
+            issues.append(f"No bullet points for: {' | '.join(role.headings) or 'untitled role'}")
+    return not issues, issues
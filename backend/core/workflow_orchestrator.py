@@ -4,15 +4,30 @@ Manages the multi-stage AI processing pipeline for resume optimization
 """
 
 import os
-from typing import Dict, Any, Tuple
-from crewai import Crew, Process
-from .ai_specialists import (
-    create_document_sanitizer,
-    create_ats_strategist,
-    create_achievement_architect,
-    create_compatibility_analyst,
-    create_career_navigator,
-    create_metrics_evaluator
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, List, Tuple, Optional
+from services.cancellation import CancellationToken, OperationCancelled, activate as activate_cancellation
+from services.circuit_breaker import CircuitOpenError, llm_breaker
+from services.deadlines import Deadline, DeadlineToken, fits, stage_latencies
+from services.metrics import STAGE_DURATION, LLM_TOKENS, CACHE_REQUESTS, STAGES_CANCELLED, DEGRADED_STAGES
+from services.lazy_imports import lazy_import
+from services.llm_hedging import llm_stage
+from services.tracing import current_trace
+from services.usage import stage_record
+from . import local_fallbacks
+from .agent_registry import agent_registry
+from .resume_model import (
+    Resume,
+    aligned_units,
+    bullet_fragment,
+    changed_units,
+    compact_text,
+    parse_resume,
+    rebuild,
+    splice_fragment,
+    units,
+    validate_resume
 )
 from .workflow_tasks import (
     generate_sanitization_workflow,
@@ -23,6 +38,24 @@ from .workflow_tasks import (
     generate_quality_scoring_workflow
 )
 
+crewai = lazy_import("crewai")
+
+# Attempts per stage before the failure is surfaced to the caller
+STAGE_MAX_ATTEMPTS = int(os.getenv("STAGE_MAX_ATTEMPTS", 2))
+STAGE_RETRY_BACKOFF = 1.0  # Seconds, doubled after each failed attempt
+
+# Characters of tagged summary/bullet items sent to the enhancement stage;
+# items past the limit are kept unenhanced
+ENHANCEMENT_FRAGMENT_CHARS = int(os.getenv("ENHANCEMENT_FRAGMENT_CHARS", 4000))
+
+# Stages run by each pipeline mode; a skipped rewrite stage passes its input through
+PIPELINE_MODES = {
+    "full": ("sanitization", "optimization", "enhancement", "evaluation"),
+    "skip_sanitization": ("optimization", "enhancement", "evaluation"),
+    "single_rewrite": ("sanitization", "optimization", "evaluation"),
+}
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "full")
+
 
 class OptimizationPipeline:
     """
@@ -32,21 +65,53 @@ class OptimizationPipeline:
     resume transformation and analysis.
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        run_id: Optional[str] = None,
+        checkpoint_store: Optional[Any] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        deadline: Optional[Deadline] = None
+    ):
         """
         Initialize the optimization pipeline
         
         Args:
             verbose: Enable detailed logging of agent activities
+            run_id: Identifier under which stage outputs are checkpointed
+            checkpoint_store: Durable store with load(run_id, stage) and
+                save(run_id, stage, output); completed stages of a run are
+                read back instead of being executed again
+            cancel_token: Token whose cancellation skips the remaining
+                stages and refuses further LLM requests of the running one
+                (OperationCancelled is raised)
+            deadline: Time by which the run has to return; stages with a
+                local fallback that cannot finish in time are answered by it
+                (rewrite stages pass their input through) instead
         """
         self.verbose = verbose
+        self.run_id = run_id
+        self.checkpoint_store = checkpoint_store
+        self.cancel_token = cancel_token
+        self.deadline = deadline
+        self.degraded_stages: List[str] = []
+        self.deadline_stages: List[str] = []
+        self.completed_stages: List[str] = []
+        self.usage: List[Dict[str, Any]] = []
+        self.resumes: Dict[str, Resume] = {}
+        self.rewritten_units: List[str] = []
+        self.reused_units: List[str] = []
         self._cache = {}
+        self._interrupted = set()
+        self._schedule: List[str] = []
+        self._checkpointed = set()
     
     def _execute_stage(
         self, 
         stage_name: str, 
         agents: list, 
-        tasks: list
+        tasks: list,
+        fallback: Optional[Callable[[], str]] = None
     ) -> str:
         """
         Execute a single pipeline stage
@@ -55,30 +120,247 @@ class OptimizationPipeline:
             stage_name: Identifier for the processing stage
             agents: List of AI agents for this stage
             tasks: List of tasks to execute
+            fallback: Local stand-in used while the LLM circuit is open or
+                when the deadline leaves too little time (without one,
+                CircuitOpenError is raised and deadlines are not enforced)
             
         Returns:
             str: Processed output from the stage
         """
-        crew = Crew(
-            agents=agents,
-            tasks=tasks,
-            process=Process.sequential,
-            verbose=self.verbose
-        )
+        checkpointing = self.run_id is not None and self.checkpoint_store is not None
+        started = time.perf_counter()
+        model = self._model_name(agents)
+        self._raise_if_cancelled()
+        if stage_name in self._schedule:
+            self._schedule.remove(stage_name)
         
-        result = crew.kickoff()
-        output = str(result).strip()
+        # Resume from a previous attempt of this run
+        if checkpointing:
+            output = self.checkpoint_store.load(self.run_id, stage_name)
+            CACHE_REQUESTS.inc(cache="checkpoint", result="miss" if output is None else "hit")
+            if output is not None:
+                self._cache[stage_name] = output
+                self._record_stage(stage_name, started, "checkpoint", model=model)
+                return output
+        
+        # Tokens of failed attempts are billed too
+        spent = {"prompt_tokens": 0, "completion_tokens": 0}
+        backoff = STAGE_RETRY_BACKOFF
+        for attempt in range(1, STAGE_MAX_ATTEMPTS + 1):
+            if fallback is not None and not self._fits_deadline(stage_name):
+                return self._degrade(
+                    stage_name, started, fallback, "deadline", model=model, attempts=attempt - 1, **spent
+                )
+            if not llm_breaker.allow():
+                return self._degrade(stage_name, started, fallback, model=model, attempts=attempt - 1, **spent)
+            
+            # Leased agents are reused, so their LLMs' token counts are cumulative
+            baseline = self._token_totals(agents)
+            attempt_started = time.perf_counter()
+            try:
+                crew = crewai.Crew(
+                    agents=agents,
+                    tasks=tasks,
+                    process=crewai.Process.sequential,
+                    verbose=self.verbose
+                )
+                
+                # The shared LLM transport checks the token before each request
+                # and hedges slow calls of stages listed in LLM_HEDGE_STAGES
+                token = self.cancel_token
+                if self.deadline is not None and fallback is not None:
+                    token = DeadlineToken(self.deadline, self.cancel_token)
+                with activate_cancellation(token), llm_stage(stage_name):
+                    result = crew.kickoff()
+                output = str(result).strip()
+                llm_breaker.record(time.perf_counter() - attempt_started)
+                break
+            except OperationCancelled as e:
+                self._add_spent(spent, agents, baseline)
+                if e.reason == "deadline":
+                    return self._degrade(
+                        stage_name, started, fallback, "deadline", model=model, attempts=attempt, **spent
+                    )
+                self._interrupted.add(stage_name)
+                STAGES_CANCELLED.inc(stage=stage_name, state="interrupted")
+                self._record_stage(stage_name, started, "cancelled", model=model, attempts=attempt, **spent)
+                raise
+            except Exception:
+                llm_breaker.record(time.perf_counter() - attempt_started, ok=False)
+                self._add_spent(spent, agents, baseline)
+                if attempt == STAGE_MAX_ATTEMPTS:
+                    self._record_stage(stage_name, started, "error", model=model, attempts=attempt, **spent)
+                    raise
+                self._sleep(backoff)
+                backoff *= 2
+        
+        usage = self._record_token_usage(stage_name, result, baseline)
+        for field, tokens in usage.items():
+            spent[field] += tokens
+        self._record_stage(stage_name, started, "success", model=model, attempts=attempt, **spent)
         
         # Cache intermediate results
         self._cache[stage_name] = output
+        if checkpointing:
+            self.checkpoint_store.save(self.run_id, stage_name, output)
         
         return output
     
+    def _degrade(
+        self,
+        stage_name: str,
+        started: float,
+        fallback: Optional[Callable[[], str]],
+        reason: str = "circuit_open",
+        **attrs
+    ) -> str:
+        """Answer a stage locally because the LLM circuit is open or time ran out (never checkpointed)"""
+        if fallback is None:
+            self._record_stage(stage_name, started, "circuit_open", **attrs)
+            raise CircuitOpenError("AI", llm_breaker.retry_after())
+        output = fallback()
+        DEGRADED_STAGES.inc(stage=stage_name, reason=reason)
+        self.degraded_stages.append(stage_name)
+        if reason == "deadline":
+            self.deadline_stages.append(stage_name)
+        self._cache[stage_name] = output
+        self._record_stage(stage_name, started, "deadline" if reason == "deadline" else "degraded", **attrs)
+        return output
+    
+    def _stage_budget(self, stage_name: str) -> float:
+        """Seconds a stage is expected to take (nothing if a checkpoint answers it)"""
+        return 0.0 if stage_name in self._checkpointed else stage_latencies.estimate(stage_name)
+    
+    def _fits_deadline(self, stage_name: str) -> bool:
+        """Whether the stage's LLM run fits the deadline next to the more important stages still to come"""
+        if self.deadline is None:
+            return True
+        later = {stage: self._stage_budget(stage) for stage in self._schedule}
+        return fits(stage_name, later, self._stage_budget(stage_name), self.deadline.remaining())
+    
+    def _plan(self, stages: Tuple[str, ...]):
+        """Remember the stages still to run (and which are checkpointed) for deadline budgeting"""
+        self._schedule = list(stages)
+        if self.deadline is not None and self.run_id is not None and self.checkpoint_store is not None:
+            self._checkpointed = {
+                stage for stage in stages
+                if self.checkpoint_store.load(self.run_id, stage) is not None
+            }
+    
+    def _raise_if_cancelled(self):
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+    
+    def _sleep(self, seconds: float):
+        """Retry backoff that ends early when the run is cancelled"""
+        if self.cancel_token is None:
+            time.sleep(seconds)
+        elif self.cancel_token.wait(seconds):
+            self.cancel_token.raise_if_cancelled()
+    
+    @contextmanager
+    def _cancellation_scope(self, stages: Tuple[str, ...]):
+        """Count the stages a cancellation leaves unrun as skipped"""
+        try:
+            yield
+        except OperationCancelled:
+            for stage_name in stages:
+                if stage_name not in self._cache and stage_name not in self._interrupted:
+                    STAGES_CANCELLED.inc(stage=stage_name, state="skipped")
+            raise
+    
+    def _record_stage(self, stage_name: str, started: float, outcome: str, **attrs):
+        """Record a stage's duration as a metric, a span of the current trace and a usage record"""
+        duration = time.perf_counter() - started
+        STAGE_DURATION.observe(duration, stage=stage_name, outcome=outcome)
+        trace = current_trace()
+        if trace is not None:
+            trace.add_span(f"stage.{stage_name}", time.time() - duration, duration, dict(attrs, outcome=outcome))
+        self.usage.append(stage_record(stage_name, outcome, duration, **attrs))
+        if outcome in ("success", "checkpoint"):
+            self.completed_stages.append(stage_name)
+        if outcome == "success":
+            stage_latencies.observe(stage_name, duration)
+    
+    @staticmethod
+    def _model_name(agents: list) -> Optional[str]:
+        """Model of the first agent's LLM"""
+        for agent in agents:
+            model = getattr(getattr(agent, "llm", None), "model", None)
+            if model:
+                return str(model)
+        return None
+    
+    @classmethod
+    def _add_spent(cls, spent: Dict[str, int], agents: list, baseline: Dict[str, int]):
+        """Add the tokens an unfinished attempt used to the stage's total"""
+        totals = cls._token_totals(agents)
+        for field in spent:
+            spent[field] += max(totals[field] - baseline.get(field, 0), 0)
+    
+    @staticmethod
+    def _token_totals(agents: list) -> Dict[str, int]:
+        """Cumulative prompt and completion tokens of the agents' LLMs"""
+        totals = {"prompt_tokens": 0, "completion_tokens": 0}
+        for agent in agents:
+            summary = getattr(getattr(agent, "llm", None), "get_token_usage_summary", None)
+            if summary is None:
+                continue
+            usage = summary()
+            for field in totals:
+                totals[field] += getattr(usage, field, 0) or 0
+        return totals
+    
+    @staticmethod
+    def _record_token_usage(stage_name: str, result: Any, baseline: Dict[str, int]) -> Dict[str, int]:
+        """Record prompt and completion token counts a crew run added to the baseline"""
+        usage = getattr(result, "token_usage", None)
+        if usage is None:
+            return {}
+        tokens = {
+            field: max((getattr(usage, field, 0) or 0) - baseline.get(field, 0), 0)
+            for field in ("prompt_tokens", "completion_tokens")
+        }
+        LLM_TOKENS.observe(tokens["prompt_tokens"], stage=stage_name, direction="input")
+        LLM_TOKENS.observe(tokens["completion_tokens"], stage=stage_name, direction="output")
+        return tokens
+    
+    def _parsed(self, stage_name: str, content: str) -> Resume:
+        """Parsed form of a stage's resume output, parsed once per run"""
+        resume = self.resumes.get(stage_name)
+        if resume is None:
+            resume = self.resumes[stage_name] = parse_resume(content)
+        return resume
+    
+    def _merge_enhancement(self, optimized_resume: Resume, optimized_content: str, output: str) -> str:
+        """
+        Splice the enhancement stage's tagged items into the optimized resume text
+        
+        Args:
+            optimized_resume: Parsed optimized resume the fragment was built from
+            optimized_content: Optimized resume text
+            output: Enhancement stage output
+            
+        Returns:
+            str: Enhanced resume text
+        """
+        enhanced_content, applied = splice_fragment(optimized_content, optimized_resume, output)
+        if not applied:
+            # Untagged output (a full resume from an older checkpoint) is used if it is one
+            parsed = parse_resume(output)
+            if validate_resume(parsed)[0]:
+                self.resumes["enhancement"] = parsed
+                enhanced_content = output
+        
+        self._cache["enhancement"] = enhanced_content
+        return enhanced_content
+    
     def execute_full_optimization(
         self,
         raw_document_text: str,
         target_position: str,
-        position_requirements: str
+        position_requirements: str,
+        mode: Optional[str] = None
     ) -> Tuple[str, str, str, str]:
         """
         Execute the complete 4-stage optimization pipeline
@@ -87,6 +369,7 @@ class OptimizationPipeline:
             raw_document_text: Raw resume text from uploaded file
             target_position: Job title or role being targeted
             position_requirements: Job description or requirements
+            mode: Key of PIPELINE_MODES (defaults to PIPELINE_MODE)
             
         Returns:
             Tuple containing:
@@ -95,57 +378,176 @@ class OptimizationPipeline:
                 - enhanced_content: Final polished resume
                 - evaluation_report: Detailed assessment
         """
-        # Stage 1: Document Sanitization
-        sanitizer = create_document_sanitizer()
-        sanitization_task = generate_sanitization_workflow(sanitizer, raw_document_text)
+        stages = PIPELINE_MODES[mode or PIPELINE_MODE]
+        self._plan(stages)
+        
+        with self._cancellation_scope(stages):
+            sanitized_content, optimized_content, enhanced_content = self._rewrite(
+                raw_document_text,
+                target_position,
+                position_requirements,
+                stages
+            )
+            evaluation_report = self._evaluate(enhanced_content, target_position, position_requirements)
+            return sanitized_content, optimized_content, enhanced_content, evaluation_report
+    
+    def execute_incremental_optimization(
+        self,
+        raw_document_text: str,
+        target_position: str,
+        position_requirements: str,
+        previous: Dict[str, Any],
+        mode: Optional[str] = None
+    ) -> Tuple[str, str, str, str]:
+        """
+        Re-optimize an edited resume, rewriting only the sections that changed
+        
+        The resume and the previous result's input are split into section
+        units (contact, summary, skills, each role, other sections) and
+        fingerprinted. Changed units, and units the previous result has no
+        rewritten version of, go through the rewrite stages as one partial
+        resume; the rest are spliced in from the previous result. Evaluation
+        always runs over the merged resume. The units sent are listed in
+        self.rewritten_units and the reused ones in self.reused_units.
+        
+        Args:
+            raw_document_text: Edited resume text
+            target_position: Job title (the same as the previous result's)
+            position_requirements: Job description (the same as the previous result's)
+            previous: Stored result with resume_text, sanitized, optimized and enhanced
+            mode: Key of PIPELINE_MODES (defaults to PIPELINE_MODE)
+            
+        Returns:
+            Tuple: As execute_full_optimization, over the merged resume
+        """
+        stages = PIPELINE_MODES[mode or PIPELINE_MODE]
+        artifacts = ("sanitized", "optimized", "enhanced")
+        current = parse_resume(raw_document_text)
+        previous_input = parse_resume(previous["resume_text"])
+        cached = {artifact: aligned_units(previous_input, parse_resume(previous[artifact])) for artifact in artifacts}
+        
+        # The contact block is taken from the edit as is and never sent on its own
+        changed = set(changed_units(previous_input, current))
+        self.rewritten_units = [
+            key for key in units(current)
+            if key != "contact" and (key in changed or any(key not in cached[artifact] for artifact in artifacts))
+        ]
+        self.reused_units = [key for key in units(current) if key != "contact" and key not in self.rewritten_units]
+        
+        rewrite_stages = tuple(stage for stage in stages if stage != "evaluation") if self.rewritten_units else ()
+        self._plan(rewrite_stages + ("evaluation",))
+        
+        with self._cancellation_scope(rewrite_stages + ("evaluation",)):
+            rewritten = {artifact: {} for artifact in artifacts}
+            if rewrite_stages:
+                partial = rebuild(current, {}, self.rewritten_units)
+                outputs = self._rewrite(partial.render(), target_position, position_requirements, rewrite_stages)
+                for artifact, output in zip(artifacts, outputs):
+                    rewritten[artifact] = aligned_units(partial, parse_resume(output))
+            
+            # Rewritten units the stages dropped keep the edited text
+            merged = []
+            for artifact, stage_name in zip(artifacts, ("sanitization", "optimization", "enhancement")):
+                replacements = {key: cached[artifact][key] for key in self.reused_units}
+                replacements.update(rewritten[artifact])
+                if "contact" not in changed:
+                    replacements["contact"] = cached[artifact]["contact"]
+                # Parsed again from the rendered text when needed, so line numbers match it
+                self.resumes.pop(stage_name, None)
+                self._cache[stage_name] = rebuild(current, replacements).render()
+                merged.append(self._cache[stage_name])
+            
+            sanitized_content, optimized_content, enhanced_content = merged
+            evaluation_report = self._evaluate(enhanced_content, target_position, position_requirements)
+            return sanitized_content, optimized_content, enhanced_content, evaluation_report
+    
+    def _rewrite(
+        self,
+        raw_document_text: str,
+        target_position: str,
+        position_requirements: str,
+        stages: Tuple[str, ...]
+    ) -> Tuple[str, str, str]:
+        """
+        Run the rewrite stages (sanitization, optimization, enhancement) listed in stages
         
-        sanitized_content = self._execute_stage(
-            "sanitization",
-            [sanitizer],
-            [sanitization_task]
-        )
+        Returns:
+            Tuple: Sanitized, optimized and enhanced resume text
+        """
+        # Stage 1: Document Sanitization
+        sanitized_content = raw_document_text
+        if "sanitization" in stages:
+            with agent_registry.lease("sanitization") as sanitizer:
+                sanitization_task = generate_sanitization_workflow(sanitizer, raw_document_text)
+                
+                sanitized_content = self._execute_stage(
+                    "sanitization",
+                    [sanitizer],
+                    [sanitization_task],
+                    fallback=lambda: local_fallbacks.sanitize(raw_document_text)
+                )
         
         # Stage 2: ATS Optimization
-        strategist = create_ats_strategist()
-        optimization_task = generate_optimization_workflow(
-            strategist,
-            sanitized_content,
-            target_position,
-            position_requirements
-        )
-        
-        optimized_content = self._execute_stage(
-            "optimization",
-            [strategist],
-            [optimization_task]
-        )
-        
-        # Stage 3: Achievement Enhancement
-        architect = create_achievement_architect()
-        enhancement_task = generate_enhancement_workflow(architect, optimized_content)
-        
-        enhanced_content = self._execute_stage(
-            "enhancement",
-            [architect],
-            [enhancement_task]
-        )
-        
-        # Stage 4: Compatibility Evaluation
-        analyst = create_compatibility_analyst()
-        evaluation_task = generate_evaluation_workflow(
-            analyst,
-            enhanced_content,
-            target_position,
-            position_requirements
-        )
-        
-        evaluation_report = self._execute_stage(
-            "evaluation",
-            [analyst],
-            [evaluation_task]
-        )
-        
-        return sanitized_content, optimized_content, enhanced_content, evaluation_report
+        with agent_registry.lease("optimization") as strategist:
+            optimization_task = generate_optimization_workflow(
+                strategist,
+                compact_text(self._parsed("sanitization", sanitized_content)),
+                target_position,
+                position_requirements
+            )
+            
+            optimized_content = self._execute_stage(
+                "optimization",
+                [strategist],
+                [optimization_task],
+                fallback=lambda: sanitized_content
+            )
+        
+        # Stage 3: Achievement Enhancement (summary and bullets only, if there are any)
+        enhanced_content = optimized_content
+        optimized_resume = self._parsed("optimization", optimized_content)
+        fragment = bullet_fragment(optimized_resume, ENHANCEMENT_FRAGMENT_CHARS)
+        if "enhancement" in stages and fragment:
+            with agent_registry.lease("enhancement") as architect:
+                enhancement_task = generate_enhancement_workflow(architect, fragment)
+                
+                enhancement_output = self._execute_stage(
+                    "enhancement",
+                    [architect],
+                    [enhancement_task],
+                    fallback=lambda: fragment
+                )
+            enhanced_content = self._merge_enhancement(optimized_resume, optimized_content, enhancement_output)
+        
+        return sanitized_content, optimized_content, enhanced_content
+    
+    def _evaluate(self, enhanced_content: str, target_position: str, position_requirements: str) -> str:
+        """
+        Run the compatibility evaluation stage over the enhanced resume
+        
+        Returns:
+            str: Evaluation report
+        """
+        enhanced_resume = self._parsed("enhancement", enhanced_content)
+        with agent_registry.lease("evaluation") as analyst:
+            evaluation_task = generate_evaluation_workflow(
+                analyst,
+                compact_text(enhanced_resume),
+                target_position,
+                position_requirements,
+                format_issues=validate_resume(enhanced_resume)[1]
+            )
+            
+            return self._execute_stage(
+                "evaluation",
+                [analyst],
+                [evaluation_task],
+                fallback=lambda: local_fallbacks.evaluate(
+                    enhanced_content,
+                    target_position,
+                    position_requirements
+                )
+            )
     
     def execute_career_guidance(
         self,
@@ -164,19 +566,20 @@ class OptimizationPipeline:
         Returns:
             str: Career guidance report
         """
-        navigator = create_career_navigator()
-        guidance_task = generate_career_guidance_workflow(
-            navigator,
-            resume_content,
-            target_position,
-            position_requirements
-        )
-        
-        return self._execute_stage(
-            "career_guidance",
-            [navigator],
-            [guidance_task]
-        )
+        with self._cancellation_scope(("career_guidance",)):
+            with agent_registry.lease("career_guidance") as navigator:
+                guidance_task = generate_career_guidance_workflow(
+                    navigator,
+                    resume_content,
+                    target_position,
+                    position_requirements
+                )
+                
+                return self._execute_stage(
+                    "career_guidance",
+                    [navigator],
+                    [guidance_task]
+                )
     
     def execute_quality_assessment(
         self,
@@ -193,18 +596,20 @@ class OptimizationPipeline:
         Returns:
             str: Detailed quality metrics report
         """
-        evaluator = create_metrics_evaluator()
-        scoring_task = generate_quality_scoring_workflow(
-            evaluator,
-            resume_content,
-            target_position
-        )
-        
-        return self._execute_stage(
-            "quality_scoring",
-            [evaluator],
-            [scoring_task]
-        )
+        with self._cancellation_scope(("quality_scoring",)):
+            with agent_registry.lease("quality_scoring") as evaluator:
+                scoring_task = generate_quality_scoring_workflow(
+                    evaluator,
+                    resume_content,
+                    target_position
+                )
+                
+                return self._execute_stage(
+                    "quality_scoring",
+                    [evaluator],
+                    [scoring_task],
+                    fallback=lambda: local_fallbacks.score_quality(resume_content, target_position)
+                )
     
     def get_cached_stage(self, stage_name: str) -> str:
         """
@@ -221,6 +626,7 @@ class OptimizationPipeline:
     def clear_cache(self):
         """Clear all cached pipeline results"""
         self._cache.clear()
+        self.resumes.clear()
 
 
 # Legacy compatibility function
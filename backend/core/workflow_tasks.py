@@ -3,10 +3,17 @@ Workflow Task Definitions
 Defines AI tasks for each stage of the resume optimization pipeline
 """
 
-from crewai import Task
+from typing import TYPE_CHECKING, List, Optional
 
+from services.lazy_imports import lazy_import
 
-def generate_sanitization_workflow(agent, raw_document_text: str) -> Task:
+if TYPE_CHECKING:
+    from crewai import Task
+
+crewai = lazy_import("crewai")
+
+
+def generate_sanitization_workflow(agent, raw_document_text: str) -> "Task":
     """
     Create a document sanitization task
     
@@ -24,7 +31,7 @@ def generate_sanitization_workflow(agent, raw_document_text: str) -> Task:
         else raw_document_text
     )
     
-    return Task(
+    return crewai.Task(
         description=(
             f"DOCUMENT SANITIZATION REQUEST\n\n"
             f"Process and clean the following resume text:\n\n{content_preview}\n\n"
@@ -66,7 +73,7 @@ def generate_optimization_workflow(
     sanitized_content: str,
     target_position: str,
     position_requirements: str
-) -> Task:
+) -> "Task":
     """
     Create an ATS optimization task
     
@@ -91,7 +98,7 @@ def generate_optimization_workflow(
         else position_requirements
     )
     
-    return Task(
+    return crewai.Task(
         description=(
             f"ATS OPTIMIZATION REQUEST\n\n"
             f"TARGET POSITION: {target_position}\n\n"
@@ -137,27 +144,26 @@ def generate_optimization_workflow(
     )
 
 
-def generate_enhancement_workflow(agent, optimized_content: str) -> Task:
+def generate_enhancement_workflow(agent, bullet_fragment: str) -> "Task":
     """
     Create an achievement enhancement task
     
+    Only the summary and experience bullets are sent, one tagged item per
+    line (see core.resume_model.bullet_fragment); the rewritten items are
+    merged back into the optimized resume.
+    
     Args:
         agent: AI agent to execute the task
-        optimized_content: ATS-optimized resume
+        bullet_fragment: Tagged summary and bullet items of the optimized resume
         
     Returns:
         Task: Configured enhancement task
     """
-    content_preview = (
-        optimized_content[:700] + "..." 
-        if len(optimized_content) > 700 
-        else optimized_content
-    )
-    
-    return Task(
+    return crewai.Task(
         description=(
             f"ACHIEVEMENT ENHANCEMENT REQUEST\n\n"
-            f"RESUME TO ENHANCE:\n{content_preview}\n\n"
+            f"ITEMS TO ENHANCE ([S] is the summary, [role.bullet] an experience bullet, "
+            f"'#' lines name the role and are context only):\n{bullet_fragment}\n\n"
             f"ENHANCEMENT OBJECTIVES:\n"
             f"1. Transform weak bullets into powerful achievement statements\n"
             f"2. Add quantified metrics (percentages, dollar amounts, time saved)\n"
@@ -168,34 +174,15 @@ def generate_enhancement_workflow(agent, optimized_content: str) -> Task:
             f"7. Ensure consistent parallel structure\n"
             f"8. Maintain 2-3 lines per bullet maximum\n\n"
             f"EXAMPLE TRANSFORMATION:\n"
-            f"BEFORE: 'Worked on machine learning projects'\n"
-            f"AFTER: 'Architected 5 production ML models processing 10M+ daily transactions, "
+            f"BEFORE: '[1.1] Worked on machine learning projects'\n"
+            f"AFTER: '[1.1] Architected 5 production ML models processing 10M+ daily transactions, "
             f"reducing prediction latency by 40% and generating $2M annual cost savings'\n\n"
-            f"MAINTAIN EXACT FORMAT:\n"
-            f"**Full Name**\n"
-            f"email@example.com\n"
-            f"+Country_Code Phone_Number\n"
-            f"City, State/Region\n\n"
-            f"---\n\n"
-            f"**SUMMARY**\n"
-            f"Enhanced professional summary...\n\n"
-            f"---\n\n"
-            f"**SKILLS**\n\n"
-            f"**Category:**\n"
-            f"- Skills listed clearly\n\n"
-            f"---\n\n"
-            f"**PROFESSIONAL EXPERIENCE**\n\n"
-            f"**Job Title**\n"
-            f"**Company Name, Location**\n"
-            f"**Date - Date**\n"
-            f"- Enhanced achievement bullet with quantified metrics and business impact\n"
-            f"- Another enhanced bullet with specific numbers, percentages, and outcomes\n\n"
-            f"CRITICAL: Maintain the exact formatting with bold section headers, proper spacing, "
-            f"and horizontal dividers (---) between sections.\n\n"
-            f"DELIVERABLE: Resume with polished, high-impact achievement statements in the specified format."
+            f"CRITICAL: Return one line per item, starting with its tag in square brackets. "
+            f"Keep every tag unchanged, do not add, merge or split items and omit the '#' lines.\n\n"
+            f"DELIVERABLE: The tagged items rewritten as polished, high-impact achievement statements."
         ),
         agent=agent,
-        expected_output="Enhanced resume with quantified, impactful achievement statements and proper formatting."
+        expected_output="Tagged summary and bullet items, one per line, rewritten with quantified impact."
     )
 
 
@@ -203,8 +190,9 @@ def generate_evaluation_workflow(
     agent,
     final_content: str,
     target_position: str,
-    position_requirements: str
-) -> Task:
+    position_requirements: str,
+    format_issues: Optional[List[str]] = None
+) -> "Task":
     """
     Create a compatibility evaluation task
     
@@ -213,6 +201,8 @@ def generate_evaluation_workflow(
         final_content: Final optimized resume
         target_position: Target job title
         position_requirements: Job requirements
+        format_issues: Template issues found in the parsed resume; when
+            given, format is scored from them rather than from the text
         
     Returns:
         Task: Configured evaluation task
@@ -227,12 +217,16 @@ def generate_evaluation_workflow(
         if len(position_requirements) > 150 
         else position_requirements
     )
+    format_check = ""
+    if format_issues is not None:
+        format_check = f"FORMAT CHECK: {'; '.join(format_issues) or 'follows the resume template'}\n\n"
     
-    return Task(
+    return crewai.Task(
         description=(
             f"Score this resume for {target_position}.\n\n"
             f"JOB REQUIREMENTS: {requirements_preview}\n\n"
             f"RESUME: {resume_preview}\n\n"
+            f"{format_check}"
             f"Rate 1-5 on: keyword_match, section_structure, quantified_metrics, action_verbs, format_quality.\n"
             f"Calculate overall_score (0-100).\n\n"
             f"Output ONLY valid JSON (no markdown, no extra text):\n"
@@ -254,7 +248,7 @@ def generate_career_guidance_workflow(
     resume_content: str,
     target_position: str,
     position_requirements: str
-) -> Task:
+) -> "Task":
     """
     Create a career guidance task
     
@@ -270,7 +264,7 @@ def generate_career_guidance_workflow(
     resume_preview = resume_content[:800] + "..." if len(resume_content) > 800 else resume_content
     requirements_preview = position_requirements[:300] + "..." if len(position_requirements) > 300 else position_requirements
     
-    return Task(
+    return crewai.Task(
         description=(
             f"CAREER NAVIGATION REQUEST\n\n"
             f"TARGET ROLE: {target_position}\n\n"
@@ -309,7 +303,7 @@ def generate_quality_scoring_workflow(
     agent,
     resume_content: str,
     target_position: str
-) -> Task:
+) -> "Task":
     """
     Create a comprehensive quality scoring task
     
@@ -323,7 +317,7 @@ def generate_quality_scoring_workflow(
     """
     content_preview = resume_content[:800] + "..." if len(resume_content) > 800 else resume_content
     
-    return Task(
+    return crewai.Task(
         description=(
             f"RESUME QUALITY ASSESSMENT REQUEST\n\n"
             f"TARGET POSITION: {target_position}\n\n"
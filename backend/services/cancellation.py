@@ -0,0 +1,69 @@
+"""
+Cooperative Cancellation
+Lets request handlers stop pipeline work whose client has gone away
+"""
+
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+
+
+class OperationCancelled(BaseException):
+    """
+    Raised inside work whose cancellation token was cancelled
+
+    Derives from BaseException, like asyncio.CancelledError, so the retry
+    loops in crewai and the LLM SDK (which catch Exception) let it through
+    instead of retrying cancelled work.
+    """
+
+    def __init__(self, reason: str = "cancelled"):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationToken:
+    """Thread-safe flag shared between a request handler and its worker thread"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds, returning early (True) on cancellation"""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """Raise OperationCancelled once cancel() has been called"""
+        if self._event.is_set():
+            raise OperationCancelled(self.reason or "cancelled")
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Token of the work running in this context, if any"""
+    return _current_token.get()
+
+
+@contextmanager
+def activate(token: Optional[CancellationToken]):
+    """Make a token current for the enclosed block (and threads that copy the context)"""
+    context_token = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(context_token)
@@ -0,0 +1,107 @@
+"""
+Checkpoint Store Service
+Durable per-stage pipeline outputs so interrupted runs resume where they failed
+"""
+
+import os
+import time
+from typing import Optional
+
+from .sqlite_store import SQLiteStore, DATA_DIR
+
+# Store Configuration
+CHECKPOINT_STORE_PATH = os.getenv("CHECKPOINT_STORE_PATH", os.path.join(DATA_DIR, "checkpoints.sqlite3"))
+CHECKPOINT_TTL_SECONDS = int(os.getenv("CHECKPOINT_TTL_SECONDS", 3600))
+PURGE_INTERVAL_SECONDS = 600
+
+
+class CheckpointStore(SQLiteStore):
+    """Stores completed stage outputs keyed by run ID and stage name"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            run_id TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            output TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            PRIMARY KEY (run_id, stage)
+        );
+        CREATE INDEX IF NOT EXISTS checkpoints_age ON checkpoints (created_at);
+    """
+
+    def __init__(self, path: str = CHECKPOINT_STORE_PATH, ttl_seconds: int = CHECKPOINT_TTL_SECONDS):
+        """
+        Initialize the checkpoint store
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: How long completed stages remain reusable
+        """
+        self.ttl_seconds = ttl_seconds
+        self._last_purge = 0.0
+        super().__init__(path)
+
+    def load(self, run_id: str, stage_name: str) -> Optional[str]:
+        """
+        Fetch a completed stage output
+
+        Args:
+            run_id: Pipeline run identifier
+            stage_name: Stage identifier
+
+        Returns:
+            Optional[str]: Stage output, or None if the stage has not completed
+        """
+        row = self._connection().execute(
+            "SELECT output FROM checkpoints WHERE run_id = ? AND stage = ? AND created_at > ?",
+            (run_id, stage_name, time.time() - self.ttl_seconds)
+        ).fetchone()
+        return row[0] if row else None
+
+    def save(self, run_id: str, stage_name: str, output: str):
+        """
+        Record a completed stage output
+
+        Args:
+            run_id: Pipeline run identifier
+            stage_name: Stage identifier
+            output: Stage output text
+        """
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (run_id, stage, output, created_at) VALUES (?, ?, ?, ?)",
+                (run_id, stage_name, output, now)
+            )
+        if now - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self.purge_expired()
+
+    def clear(self, run_id: str):
+        """
+        Drop all checkpoints of a run
+
+        Args:
+            run_id: Pipeline run identifier
+        """
+        with self._connection() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE run_id = ?", (run_id,))
+
+    def purge_expired(self) -> int:
+        """
+        Delete checkpoints older than the TTL
+
+        Returns:
+            int: Number of checkpoints removed
+        """
+        now = time.time()
+        with self._connection() as conn:
+            removed = conn.execute(
+                "DELETE FROM checkpoints WHERE created_at <= ?",
+                (now - self.ttl_seconds,)
+            ).rowcount
+        self._last_purge = now
+        return removed
+
+
+# Process-wide store used by the API
+checkpoint_store = CheckpointStore()
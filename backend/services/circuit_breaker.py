@@ -0,0 +1,163 @@
+"""
+Circuit Breaker
+Stops sending work to a failing dependency and probes it until it recovers
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from typing import Dict
+
+from .metrics import REGISTRY, Counter, CallbackMetric
+
+# Breaker Configuration (a call is bad if it fails or takes longer than the slow threshold)
+BREAKER_ENABLED = os.getenv("BREAKER_ENABLED", "true").lower() in ("1", "true", "yes")
+BREAKER_WINDOW = int(os.getenv("BREAKER_WINDOW", 20))
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", 5))
+BREAKER_FAILURE_RATIO = float(os.getenv("BREAKER_FAILURE_RATIO", 0.5))
+BREAKER_SLOW_SECONDS = float(os.getenv("BREAKER_SLOW_SECONDS", 45))
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", 30))
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+BREAKER_TRANSITIONS = REGISTRY.register(Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes",
+    ("breaker", "state")
+))
+
+
+class CircuitOpenError(Exception):
+    """Raised for work that needs a dependency whose circuit is open and has no fallback"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"The {name} service is temporarily unavailable, retry in {retry_after:.0f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker over a rolling window of call outcomes
+
+    The circuit opens once at least min_calls of the last window calls are
+    recorded and the share of failed or slow ones reaches failure_ratio.
+    After open_seconds it half-opens and lets a single probe through: a
+    good probe closes it, a bad one opens it again. A probe that never
+    reports back (for example, because it was cancelled) is replaced after
+    another open_seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failure_ratio: float = BREAKER_FAILURE_RATIO,
+        slow_seconds: float = BREAKER_SLOW_SECONDS,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        enabled: bool = BREAKER_ENABLED
+    ):
+        self.name = name
+        self.enabled = enabled
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_seconds = slow_seconds
+        self.open_seconds = open_seconds
+        self._outcomes = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_started = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._half_open_if_due()
+            return self._state
+
+    def _transition(self, state: str):
+        self._state = state
+        BREAKER_TRANSITIONS.inc(breaker=self.name, state=state)
+
+    def _half_open_if_due(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN)
+            self._probe_started = None
+
+    def _open(self):
+        self._transition(OPEN)
+        self._opened_at = time.monotonic()
+        self._probe_started = None
+
+    def allow(self) -> bool:
+        """Whether a call may go to the dependency now (half-open admits one probe)"""
+        if not self.enabled:
+            return True
+        with self._lock:
+            self._half_open_if_due()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN:
+                now = time.monotonic()
+                if self._probe_started is None or now - self._probe_started >= self.open_seconds:
+                    self._probe_started = now
+                    return True
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit half-opens"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def record(self, duration: float, ok: bool = True):
+        """
+        Record the outcome of an allowed call
+
+        Args:
+            duration: Seconds the call took
+            ok: False if the call failed
+        """
+        if not self.enabled:
+            return
+        bad = not ok or duration > self.slow_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if bad:
+                    self._open()
+                else:
+                    self._outcomes.clear()
+                    self._transition(CLOSED)
+                return
+            if self._state == OPEN:
+                return
+            self._outcomes.append(bad)
+            if len(self._outcomes) >= self.min_calls and sum(self._outcomes) / len(self._outcomes) >= self.failure_ratio:
+                self._outcomes.clear()
+                self._open()
+
+    def stats(self) -> Dict[str, object]:
+        """Current state and the outcomes in the window"""
+        with self._lock:
+            self._half_open_if_due()
+            return {
+                "state": self._state,
+                "window_calls": len(self._outcomes),
+                "window_failures": sum(self._outcomes),
+            }
+
+
+# Guards every LLM stage; the provider is shared, so one breaker covers them all
+llm_breaker = CircuitBreaker("llm")
+
+REGISTRY.register(CallbackMetric(
+    "circuit_breaker_state",
+    "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+    ("breaker",),
+    "gauge",
+    lambda: [((llm_breaker.name,), _STATE_VALUES[llm_breaker.state])]
+))
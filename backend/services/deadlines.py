@@ -0,0 +1,170 @@
+"""
+Request Deadlines
+Time budgets for pipeline runs and the stage latency estimates they are scheduled by
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+from .cancellation import CancellationToken, OperationCancelled
+from .metrics import REGISTRY, CallbackMetric
+
+# Deadline Configuration (0 disables the default; clients can still send deadline_seconds)
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("DEFAULT_DEADLINE_SECONDS", 0))
+DEADLINE_RESERVE_SECONDS = float(os.getenv("DEADLINE_RESERVE_SECONDS", 1.0))
+DEADLINE_QUANTILE = float(os.getenv("DEADLINE_QUANTILE", 0.75))
+DEADLINE_MIN_SAMPLES = int(os.getenv("DEADLINE_MIN_SAMPLES", 5))
+DEADLINE_WINDOW = int(os.getenv("DEADLINE_WINDOW", 100))
+
+# Seconds assumed for a stage until it has DEADLINE_MIN_SAMPLES successful
+# runs. The four optimization stages add up to 23 s, so on a fresh process
+# a 28 s deadline (27 s after the reserve) still runs every stage on the
+# LLM; the observed latencies take over once they are known
+STAGE_LATENCY_PRIORS = {
+    "sanitization": 4.0,
+    "optimization": 8.0,
+    "enhancement": 6.0,
+    "evaluation": 5.0,
+    "career_guidance": 8.0,
+    "quality_scoring": 5.0,
+}
+DEFAULT_STAGE_LATENCY = 8.0
+
+# Order in which stages keep their LLM run when not all of them fit; the
+# rest are answered locally or pass their input through
+STAGE_PRIORITY = ("optimization", "evaluation", "enhancement", "sanitization")
+
+
+class Deadline:
+    """
+    Point in time by which a pipeline run has to return
+
+    DEADLINE_RESERVE_SECONDS are kept back for local fallbacks, parsing,
+    storing the result and sending the response.
+    """
+
+    def __init__(self, seconds: float, reserve: float = DEADLINE_RESERVE_SECONDS):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds - reserve
+
+    @classmethod
+    def start(cls, seconds: Optional[float] = None) -> Optional["Deadline"]:
+        """Deadline of seconds from now, DEFAULT_DEADLINE_SECONDS if omitted, or None without either"""
+        if seconds is None:
+            seconds = DEFAULT_DEADLINE_SECONDS or None
+        return cls(seconds) if seconds is not None else None
+
+    def remaining(self) -> float:
+        """Seconds left for stage work"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+class DeadlineToken(CancellationToken):
+    """
+    Cancellation token that also trips when a deadline passes
+
+    Activated around a stage's LLM calls, it stops the stage from sending
+    further requests once its time is up while leaving the request's own
+    token (the parent) untouched, so the pipeline can still answer.
+    """
+
+    def __init__(self, deadline: Deadline, parent: Optional[CancellationToken] = None):
+        super().__init__()
+        self.deadline = deadline
+        self.parent = parent
+
+    @property
+    def cancelled(self) -> bool:
+        parent_cancelled = self.parent is not None and self.parent.cancelled
+        return parent_cancelled or super().cancelled or self.deadline.expired
+
+    def wait(self, timeout: float) -> bool:
+        timeout = min(timeout, self.deadline.remaining())
+        woken = self.parent.wait(timeout) if self.parent is not None else super().wait(timeout)
+        return woken or self.deadline.expired
+
+    def raise_if_cancelled(self):
+        if self.parent is not None:
+            self.parent.raise_if_cancelled()
+        super().raise_if_cancelled()
+        if self.deadline.expired:
+            raise OperationCancelled("deadline")
+
+
+class StageLatencies:
+    """Rolling window of successful stage durations per stage"""
+
+    def __init__(self, window: int = DEADLINE_WINDOW):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage_name: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(stage_name, deque(maxlen=self.window)).append(seconds)
+
+    def estimate(self, stage_name: str) -> float:
+        """
+        Seconds a run of the stage should be budgeted
+
+        Returns:
+            float: DEADLINE_QUANTILE of recent durations, or the stage's
+                prior until DEADLINE_MIN_SAMPLES runs were observed
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(stage_name, ()))
+        if len(samples) < DEADLINE_MIN_SAMPLES:
+            return STAGE_LATENCY_PRIORS.get(stage_name, DEFAULT_STAGE_LATENCY)
+        return samples[min(len(samples) - 1, int(len(samples) * DEADLINE_QUANTILE))]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            stages = list(self._samples)
+        return {stage: {"estimate_seconds": round(self.estimate(stage), 3)} for stage in stages}
+
+
+def priority(stage_name: str) -> int:
+    """Rank of a stage in STAGE_PRIORITY (unlisted stages rank last)"""
+    return STAGE_PRIORITY.index(stage_name) if stage_name in STAGE_PRIORITY else len(STAGE_PRIORITY)
+
+
+def fits(stage_name: str, later_costs: Dict[str, float], cost: float, remaining: float) -> bool:
+    """
+    Whether a stage can run without starving more important later stages
+
+    Time is first set aside, greedily by priority, for the later stages
+    that outrank this one and fit; the stage runs if its own budget fits
+    in what is left.
+
+    Args:
+        stage_name: Stage about to run
+        later_costs: Budgeted seconds of the stages still to come
+        cost: Budgeted seconds of this stage
+        remaining: Seconds left before the deadline
+    """
+    reserved = 0.0
+    for later in sorted(later_costs, key=priority):
+        if priority(later) >= priority(stage_name):
+            break
+        if reserved + later_costs[later] <= remaining:
+            reserved += later_costs[later]
+    return cost <= remaining - reserved
+
+
+# Process-wide latency history the scheduler budgets stages by
+stage_latencies = StageLatencies()
+
+REGISTRY.register(CallbackMetric(
+    "pipeline_stage_budget_seconds",
+    "Seconds budgeted for each stage when scheduling against a deadline",
+    ("stage",),
+    "gauge",
+    lambda: [((stage,), stats["estimate_seconds"]) for stage, stats in stage_latencies.stats().items()]
+))
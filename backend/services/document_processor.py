@@ -4,20 +4,93 @@ Handles file parsing, text extraction, and format conversion
 """
 
 import io
+from functools import lru_cache
 from typing import Tuple
-from pypdf import PdfReader
-from docx import Document
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.enums import TA_LEFT
+from .docx_writer import render_docx
+from .lazy_imports import lazy_import
+from .tracing import traced
+
+# Parsing and rendering libraries load on first use, not at API startup
+pypdf = lazy_import("pypdf")
+docx = lazy_import("docx")
+pagesizes = lazy_import("reportlab.lib.pagesizes")
+styles_module = lazy_import("reportlab.lib.styles")
+units = lazy_import("reportlab.lib.units")
+platypus = lazy_import("reportlab.platypus")
+enums = lazy_import("reportlab.lib.enums")
+
+# Imported by process pool workers at startup (see services/executors.py)
+DOCUMENT_LIBRARIES = (
+    "pypdf",
+    "docx",
+    "reportlab.lib.pagesizes",
+    "reportlab.lib.styles",
+    "reportlab.lib.units",
+    "reportlab.platypus",
+    "reportlab.lib.enums",
+)
+
+
+@lru_cache(maxsize=None)
+def _build_pdf_styles() -> dict:
+    """
+    Build the ReportLab paragraph styles used for resume PDFs
+    
+    Styles are immutable during rendering, so they are built once per
+    process, on the first render.
+    
+    Returns:
+        dict: Paragraph styles keyed by role (title, heading, normal, bullet)
+    """
+    styles = styles_module.getSampleStyleSheet()
+    ParagraphStyle = styles_module.ParagraphStyle
+    TA_LEFT = enums.TA_LEFT
+    
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            textColor='#1a1a1a',
+            spaceAfter=6,
+            alignment=TA_LEFT,
+            fontName='Helvetica-Bold'
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=12,
+            textColor='#2c3e50',
+            spaceAfter=6,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        ),
+        'normal': ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor='#333333',
+            spaceAfter=4,
+            alignment=TA_LEFT,
+            fontName='Helvetica'
+        ),
+        'bullet': ParagraphStyle(
+            'CustomBullet',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor='#333333',
+            spaceAfter=4,
+            leftIndent=20,
+            fontName='Helvetica'
+        ),
+    }
 
 
 class DocumentExtractor:
     """Extracts text content from various document formats"""
     
     @staticmethod
+    @traced("extract.pdf")
     def extract_from_pdf(file_bytes: bytes) -> str:
         """
         Extract text from PDF file
@@ -29,7 +102,7 @@ class DocumentExtractor:
             str: Extracted text content
         """
         try:
-            reader = PdfReader(io.BytesIO(file_bytes))
+            reader = pypdf.PdfReader(io.BytesIO(file_bytes))
             text_segments = []
             
             for page in reader.pages:
@@ -42,6 +115,7 @@ class DocumentExtractor:
             raise ValueError(f"PDF extraction failed: {str(e)}")
     
     @staticmethod
+    @traced("extract.docx")
     def extract_from_docx(file_bytes: bytes) -> str:
         """
         Extract text from DOCX file
@@ -54,7 +128,7 @@ class DocumentExtractor:
         """
         try:
             document_stream = io.BytesIO(file_bytes)
-            doc = Document(document_stream)
+            doc = docx.Document(document_stream)
             
             text_segments = []
             for paragraph in doc.paragraphs:
@@ -66,6 +140,7 @@ class DocumentExtractor:
             raise ValueError(f"DOCX extraction failed: {str(e)}")
     
     @staticmethod
+    @traced("extract.text")
     def extract_from_text(file_bytes: bytes) -> str:
         """
         Extract text from plain text file
@@ -110,9 +185,26 @@ class DocumentGenerator:
     """Generates documents in various formats"""
     
     @staticmethod
+    @traced("render.docx")
     def text_to_docx_bytes(text: str) -> bytes:
         """
-        Convert plain text to DOCX format
+        Convert resume text to DOCX format with headings, bold runs and bullet lists
+        
+        Args:
+            text: Text content to convert
+            
+        Returns:
+            bytes: DOCX file as bytes
+        """
+        return render_docx(text)
+    
+    @staticmethod
+    def text_to_docx_bytes_python_docx(text: str) -> bytes:
+        """
+        Convert plain text to DOCX format through python-docx
+        
+        Slower reference implementation kept for benchmarking against the
+        direct OOXML writer.
         
         Args:
             text: Text content to convert
@@ -120,7 +212,7 @@ class DocumentGenerator:
         Returns:
             bytes: DOCX file as bytes
         """
-        doc = Document()
+        doc = docx.Document()
         
         # Add each line as a paragraph
         for line in text.splitlines():
@@ -137,6 +229,7 @@ class DocumentGenerator:
         return output_stream.getvalue()
     
     @staticmethod
+    @traced("render.pdf")
     def text_to_pdf_bytes(text: str, title: str = "Resume") -> bytes:
         """
         Convert plain text to professionally formatted PDF
@@ -149,11 +242,14 @@ class DocumentGenerator:
             bytes: PDF file as bytes
         """
         buffer = io.BytesIO()
+        inch = units.inch
+        Paragraph = platypus.Paragraph
+        Spacer = platypus.Spacer
         
         # Create PDF document
-        doc = SimpleDocTemplate(
+        doc = platypus.SimpleDocTemplate(
             buffer,
-            pagesize=letter,
+            pagesize=pagesizes.letter,
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
             topMargin=0.75*inch,
@@ -163,49 +259,12 @@ class DocumentGenerator:
         # Container for the 'Flowable' objects
         elements = []
         
-        # Define styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles for resume
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor='#1a1a1a',
-            spaceAfter=6,
-            alignment=TA_LEFT,
-            fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor='#2c3e50',
-            spaceAfter=6,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor='#333333',
-            spaceAfter=4,
-            alignment=TA_LEFT,
-            fontName='Helvetica'
-        )
-        
-        bullet_style = ParagraphStyle(
-            'CustomBullet',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor='#333333',
-            spaceAfter=4,
-            leftIndent=20,
-            fontName='Helvetica'
-        )
+        # Precompiled resume styles
+        pdf_styles = _build_pdf_styles()
+        title_style = pdf_styles['title']
+        heading_style = pdf_styles['heading']
+        normal_style = pdf_styles['normal']
+        bullet_style = pdf_styles['bullet']
         
         # Parse and format the resume text
         lines = text.split('\n')
@@ -0,0 +1,274 @@
+"""
+Fast DOCX Writer
+Generates WordprocessingML directly from resume text using a prebuilt template package
+"""
+
+import io
+import re
+import zipfile
+from typing import List
+
+# Page layout (twentieths of a point): US Letter with 0.75 inch margins
+PAGE_WIDTH = 12240
+PAGE_HEIGHT = 15840
+PAGE_MARGIN = 1080
+
+# Bullet list numbering instance defined in numbering.xml
+BULLET_NUM_ID = 1
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '<Override PartName="/word/settings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+    '</Types>'
+)
+
+_PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_DOC_REL}/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_DOC_REL}/styles" Target="styles.xml"/>'
+    f'<Relationship Id="rId2" Type="{_DOC_REL}/numbering" Target="numbering.xml"/>'
+    f'<Relationship Id="rId3" Type="{_DOC_REL}/settings" Target="settings.xml"/>'
+    '</Relationships>'
+)
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:styles xmlns:w="{_W_NS}">'
+    '<w:docDefaults>'
+    '<w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:eastAsia="Calibri" w:cs="Calibri"/>'
+    '<w:color w:val="333333"/><w:sz w:val="21"/><w:szCs w:val="21"/>'
+    '</w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="60" w:line="259" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+    '<w:name w:val="Normal"/><w:qFormat/>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title">'
+    '<w:name w:val="Title"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:spacing w:after="80"/></w:pPr>'
+    '<w:rPr><w:b/><w:color w:val="1A1A1A"/><w:sz w:val="32"/><w:szCs w:val="32"/></w:rPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1">'
+    '<w:name w:val="heading 1"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:spacing w:before="240" w:after="80"/><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:b/><w:color w:val="2C3E50"/><w:sz w:val="24"/><w:szCs w:val="24"/></w:rPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading2">'
+    '<w:name w:val="heading 2"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:spacing w:before="120" w:after="20"/><w:outlineLvl w:val="1"/></w:pPr>'
+    '<w:rPr><w:b/><w:color w:val="1A1A1A"/><w:sz w:val="21"/><w:szCs w:val="21"/></w:rPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="ListBullet">'
+    '<w:name w:val="List Bullet"/><w:basedOn w:val="Normal"/><w:qFormat/>'
+    f'<w:pPr><w:numPr><w:numId w:val="{BULLET_NUM_ID}"/></w:numPr>'
+    '<w:spacing w:after="40"/><w:ind w:left="360" w:hanging="360"/></w:pPr>'
+    '</w:style>'
+    '<w:style w:type="paragraph" w:styleId="Divider">'
+    '<w:name w:val="Divider"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="BFBFBF"/></w:pBdr>'
+    '<w:spacing w:after="120"/></w:pPr>'
+    '<w:rPr><w:sz w:val="8"/><w:szCs w:val="8"/></w:rPr>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+_NUMBERING_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:numbering xmlns:w="{_W_NS}">'
+    '<w:abstractNum w:abstractNumId="0">'
+    '<w:multiLevelType w:val="singleLevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/>'
+    '<w:lvlText w:val="•"/><w:lvlJc w:val="left"/>'
+    '<w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr>'
+    '</w:lvl>'
+    '</w:abstractNum>'
+    f'<w:num w:numId="{BULLET_NUM_ID}"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+_SETTINGS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:settings xmlns:w="{_W_NS}">'
+    '<w:defaultTabStop w:val="720"/>'
+    '<w:characterSpacingControl w:val="doNotCompress"/>'
+    '<w:compat><w:compatSetting w:name="compatibilityMode" '
+    'w:uri="http://schemas.microsoft.com/office/word" w:val="15"/></w:compat>'
+    '</w:settings>'
+)
+
+_DOCUMENT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:document xmlns:w="{_W_NS}" xmlns:r="{_R_NS}"><w:body>'
+)
+
+_DOCUMENT_TAIL = (
+    '<w:sectPr>'
+    f'<w:pgSz w:w="{PAGE_WIDTH}" w:h="{PAGE_HEIGHT}"/>'
+    f'<w:pgMar w:top="{PAGE_MARGIN}" w:right="{PAGE_MARGIN}" w:bottom="{PAGE_MARGIN}" '
+    f'w:left="{PAGE_MARGIN}" w:header="720" w:footer="720" w:gutter="0"/>'
+    '</w:sectPr></w:body></w:document>'
+)
+
+_DIVIDER_PARAGRAPH = '<w:p><w:pPr><w:pStyle w:val="Divider"/></w:pPr></w:p>'
+_EMPTY_PARAGRAPH = '<w:p/>'
+
+# XML escaping plus removal of control characters that are invalid in XML 1.0
+_XML_ESCAPES = {ord("&"): "&amp;", ord("<"): "&lt;", ord(">"): "&gt;"}
+_XML_ESCAPES.update({code: None for code in range(32) if code not in (9, 10, 13)})
+
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _build_template_package() -> bytes:
+    """
+    Zip the static package parts once so each document only adds document.xml
+
+    Returns:
+        bytes: Zip archive containing every part except word/document.xml
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        package.writestr("_rels/.rels", _PACKAGE_RELS_XML)
+        package.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS_XML)
+        package.writestr("word/styles.xml", _STYLES_XML)
+        package.writestr("word/numbering.xml", _NUMBERING_XML)
+        package.writestr("word/settings.xml", _SETTINGS_XML)
+    return buffer.getvalue()
+
+
+_TEMPLATE_PACKAGE = _build_template_package()
+
+
+def _runs(text: str, bold: bool = False) -> str:
+    """
+    Convert inline text with **bold** markers into WordprocessingML runs
+
+    Args:
+        text: Line content
+        bold: Render the whole line in bold
+
+    Returns:
+        str: Serialized w:r elements
+    """
+    if bold or "**" not in text:
+        escaped = text.replace("**", "").translate(_XML_ESCAPES)
+        run_props = "<w:rPr><w:b/></w:rPr>" if bold else ""
+        return f'<w:r>{run_props}<w:t xml:space="preserve">{escaped}</w:t></w:r>'
+
+    parts = []
+    position = 0
+    for match in _BOLD_PATTERN.finditer(text):
+        if match.start() > position:
+            plain = text[position:match.start()].translate(_XML_ESCAPES)
+            parts.append(f'<w:r><w:t xml:space="preserve">{plain}</w:t></w:r>')
+        strong = match.group(1).translate(_XML_ESCAPES)
+        parts.append(f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{strong}</w:t></w:r>')
+        position = match.end()
+    if position < len(text):
+        plain = text[position:].replace("**", "").translate(_XML_ESCAPES)
+        parts.append(f'<w:r><w:t xml:space="preserve">{plain}</w:t></w:r>')
+    return "".join(parts)
+
+
+def _paragraph(style: str, runs: str) -> str:
+    """Wrap runs in a paragraph with the given style"""
+    return f'<w:p><w:pPr><w:pStyle w:val="{style}"/></w:pPr>{runs}</w:p>'
+
+
+def build_document_xml(text: str) -> str:
+    """
+    Generate word/document.xml from resume text
+
+    Follows the conventions of RESUME_FORMAT_TEMPLATE: first line is the name,
+    bold all-caps lines are section headings, other bold lines are entry
+    headings, '-' lines are bullets and '---' lines are dividers.
+
+    Args:
+        text: Resume text content
+
+    Returns:
+        str: Serialized main document part
+    """
+    paragraphs: List[str] = [_DOCUMENT_HEAD]
+    seen_content = False
+    previous_blank = False
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+
+        if not line:
+            # Collapse runs of blank lines into a single spacer
+            if seen_content and not previous_blank:
+                paragraphs.append(_EMPTY_PARAGRAPH)
+            previous_blank = True
+            continue
+        previous_blank = False
+
+        if line == "---" or line == "___":
+            # The divider carries its own spacing, so drop the spacer before it
+            if paragraphs[-1] is _EMPTY_PARAGRAPH:
+                paragraphs.pop()
+            paragraphs.append(_DIVIDER_PARAGRAPH)
+            previous_blank = True
+            continue
+
+        fully_bold = line.startswith("**") and line.endswith("**") and len(line) > 4
+        plain = line.replace("**", "").strip()
+
+        if not seen_content:
+            paragraphs.append(_paragraph("Title", _runs(plain)))
+        elif line.startswith(("-", "•", "* ")):
+            paragraphs.append(_paragraph("ListBullet", _runs(line[1:].strip())))
+        elif plain.isupper() and len(plain) < 50:
+            paragraphs.append(_paragraph("Heading1", _runs(plain)))
+        elif fully_bold:
+            paragraphs.append(_paragraph("Heading2", _runs(plain)))
+        else:
+            paragraphs.append(f"<w:p>{_runs(line)}</w:p>")
+        seen_content = True
+
+    if paragraphs[-1] is _EMPTY_PARAGRAPH:
+        paragraphs.pop()
+    paragraphs.append(_DOCUMENT_TAIL)
+    return "".join(paragraphs)
+
+
+def render_docx(text: str) -> bytes:
+    """
+    Render resume text as a DOCX package
+
+    Args:
+        text: Resume text content
+
+    Returns:
+        bytes: DOCX file as bytes
+    """
+    buffer = io.BytesIO(_TEMPLATE_PACKAGE)
+    buffer.seek(0, io.SEEK_END)
+    with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED, compresslevel=1) as package:
+        package.writestr("word/document.xml", build_document_xml(text))
+    return buffer.getvalue()
@@ -0,0 +1,233 @@
+"""
+Bulkheaded Executors
+Named, separately sized worker pools so one workload class cannot stall another
+"""
+
+import os
+import asyncio
+import importlib
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cancellation import OperationCancelled
+from .document_processor import DOCUMENT_LIBRARIES
+from .metrics import REGISTRY, CallbackMetric
+from .tracing import current_trace, bind_to_thread, run_in_child_trace
+
+# Start method for process pools ("spawn" avoids forking a threaded server)
+EXECUTOR_START_METHOD = os.getenv("EXECUTOR_START_METHOD", "spawn")
+
+# Seconds clients should wait before retrying a saturated workload
+EXECUTOR_RETRY_AFTER_SECONDS = int(os.getenv("EXECUTOR_RETRY_AFTER_SECONDS", 5))
+
+
+def _preload_modules(module_names: Tuple[str, ...]):
+    """Process pool initializer importing heavy modules before the first task"""
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a workload's queue is full"""
+
+    def __init__(self, name: str, queued: int):
+        super().__init__(f"The {name} workload is saturated ({queued} requests waiting), retry shortly")
+        self.name = name
+        self.queued = queued
+
+
+class BoundedExecutor:
+    """
+    Worker pool with an admission queue and saturation counters
+
+    Work waits in a bounded asyncio queue for one of max_workers slots and
+    is only handed to the underlying pool once a slot is free, so queue
+    depth and in-flight counts are observable for thread and process pools.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        max_workers: int,
+        max_queue: int,
+        preload: Tuple[str, ...] = ()
+    ):
+        """
+        Initialize the executor (the pool itself is created on first use)
+
+        Args:
+            name: Workload name used in errors and metrics
+            kind: "thread" or "process"
+            max_workers: Concurrent tasks
+            max_queue: Tasks allowed to wait for a free worker
+            preload: Modules each worker process imports at startup
+        """
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.preload = preload
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cancelled = 0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(EXECUTOR_START_METHOD),
+                    initializer=_preload_modules,
+                    initargs=(self.preload,)
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name
+                )
+        return self._pool
+
+    async def run(self, fn: Callable, *args, reject_when_full: bool = True) -> Any:
+        """
+        Execute a function on this workload's pool
+
+        Args:
+            fn: Function to call (must be picklable for process pools)
+            *args: Positional arguments for fn
+            reject_when_full: Raise instead of waiting when the queue is full
+
+        Returns:
+            Any: The function's return value
+
+        Raises:
+            ExecutorSaturatedError: If the admission queue is full
+        """
+        # Slots belong to the running event loop
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+
+        if reject_when_full and self._slots.locked() and self.queued >= self.max_queue:
+            self.rejected += 1
+            raise ExecutorSaturatedError(self.name, self.queued)
+
+        self.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            trace = current_trace()
+            if self.kind == "process" and trace is not None:
+                # Spans recorded in the worker process are shipped back
+                result, started, spans = await loop.run_in_executor(
+                    self._get_pool(), run_in_child_trace, trace.trace_id, fn, *args
+                )
+                trace.merge_spans(spans, started)
+            elif self.kind == "process":
+                result = await loop.run_in_executor(self._get_pool(), fn, *args)
+            else:
+                result = await loop.run_in_executor(self._get_pool(), bind_to_thread(fn, *args))
+            self.completed += 1
+            return result
+        except OperationCancelled:
+            self.cancelled += 1
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def warm(self):
+        """Start worker processes in the background so the first request does not pay for it"""
+        if self.kind == "process":
+            pool = self._get_pool()
+            for _ in range(self.max_workers):
+                pool.submit(os.getpid)
+
+    def stats(self) -> dict:
+        """Current saturation counters"""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+        }
+
+    def shutdown(self):
+        """Release the underlying pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# LLM-bound pipeline stages: I/O heavy, so threads
+llm_executor = BoundedExecutor(
+    "llm",
+    "thread",
+    max_workers=int(os.getenv("LLM_WORKERS", 8)),
+    max_queue=int(os.getenv("LLM_QUEUE_MAX", 32))
+)
+
+# PDF/DOCX text extraction: CPU bound, so processes
+extraction_executor = BoundedExecutor(
+    "extraction",
+    "process",
+    max_workers=int(os.getenv("EXTRACTION_WORKERS", 2)),
+    max_queue=int(os.getenv("EXTRACTION_QUEUE_MAX", 16)),
+    preload=("services.document_processor",) + DOCUMENT_LIBRARIES
+)
+
+# PDF/DOCX rendering: CPU bound, so processes
+render_executor = BoundedExecutor(
+    "render",
+    "process",
+    max_workers=int(os.getenv("RENDER_WORKERS", 2)),
+    max_queue=int(os.getenv("RENDER_QUEUE_MAX", 32)),
+    preload=("services.exporter",) + DOCUMENT_LIBRARIES
+)
+
+EXECUTORS: Dict[str, BoundedExecutor] = {
+    executor.name: executor
+    for executor in (llm_executor, extraction_executor, render_executor)
+}
+
+
+def _executor_samples(field: str):
+    """Read one stats() field from every executor for /metrics"""
+    return lambda: [((name,), executor.stats()[field]) for name, executor in EXECUTORS.items()]
+
+
+for _field, _type, _help in (
+    ("queued", "gauge", "Tasks waiting for a free worker"),
+    ("in_flight", "gauge", "Tasks currently running"),
+    ("completed", "counter", "Tasks finished successfully"),
+    ("failed", "counter", "Tasks that raised an exception"),
+    ("rejected", "counter", "Tasks shed because the queue was full"),
+    ("cancelled", "counter", "Tasks stopped because their client went away"),
+):
+    REGISTRY.register(CallbackMetric(
+        f"executor_{_field}" + ("_total" if _type == "counter" else ""),
+        _help,
+        ("executor",),
+        _type,
+        _executor_samples(_field)
+    ))
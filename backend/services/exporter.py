@@ -0,0 +1,172 @@
+"""
+Resume Export Service
+Renders a resume into any supported download format and packages bundles
+"""
+
+import json
+import zipfile
+from typing import List
+
+from .document_processor import DocumentGenerator
+
+# Supported export formats with their response media type and render options
+EXPORT_FORMATS = {
+    "pdf": {
+        "media_type": "application/pdf",
+        "options": {"title": "Professional Resume"}
+    },
+    "docx": {
+        "media_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "options": {}
+    },
+    "txt": {
+        "media_type": "text/plain; charset=utf-8",
+        "options": {}
+    },
+    "json": {
+        "media_type": "application/json",
+        "options": {}
+    },
+}
+
+
+def resume_to_dict(text: str) -> dict:
+    """
+    Split resume text into its header and titled sections
+
+    Args:
+        text: Resume text following RESUME_FORMAT_TEMPLATE conventions
+
+    Returns:
+        dict: Name, contact lines and a list of sections with their lines
+    """
+    name = ""
+    contact = []
+    sections = []
+    current = None
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line in ("---", "___"):
+            continue
+
+        plain = line.replace("**", "").strip()
+        if not name:
+            name = plain
+        elif plain.isupper() and len(plain) < 50 and not line.startswith("-"):
+            current = {"title": plain, "lines": []}
+            sections.append(current)
+        elif current is None:
+            contact.append(plain)
+        else:
+            current["lines"].append(line)
+
+    return {"name": name, "contact": contact, "sections": sections}
+
+
+def render_document(doc_format: str, text: str) -> bytes:
+    """
+    Render resume text in the requested export format
+
+    Args:
+        doc_format: One of EXPORT_FORMATS
+        text: Resume content
+
+    Returns:
+        bytes: Rendered document
+    """
+    options = EXPORT_FORMATS[doc_format]["options"]
+
+    if doc_format == "pdf":
+        return DocumentGenerator.text_to_pdf_bytes(text, **options)
+    if doc_format == "docx":
+        return DocumentGenerator.text_to_docx_bytes(text)
+    if doc_format == "txt":
+        return text.encode("utf-8")
+    if doc_format == "json":
+        return json.dumps(resume_to_dict(text), ensure_ascii=False).encode("utf-8")
+
+    raise ValueError(f"Unsupported export format: {doc_format}")
+
+
+def validate_formats(formats: List[str]) -> List[str]:
+    """
+    Normalize and validate a list of requested export formats
+
+    Args:
+        formats: Requested format names
+
+    Returns:
+        List[str]: Lower-cased formats in request order without duplicates
+
+    Raises:
+        ValueError: If the list is empty or contains an unsupported format
+    """
+    normalized = []
+    for doc_format in formats:
+        doc_format = doc_format.strip().lower()
+        if doc_format not in EXPORT_FORMATS:
+            supported = ", ".join(EXPORT_FORMATS)
+            raise ValueError(f"Unsupported export format '{doc_format}' (supported: {supported})")
+        if doc_format not in normalized:
+            normalized.append(doc_format)
+
+    if not normalized:
+        raise ValueError("At least one export format is required")
+    return normalized
+
+
+class _ChunkSink:
+    """Write-only file object collecting zip output until it is drained"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStream:
+    """
+    Incrementally built zip archive
+
+    The sink is not seekable, so zipfile writes data descriptors and each
+    entry can be sent to the client as soon as it is added.
+    """
+
+    def __init__(self):
+        self._sink = _ChunkSink()
+        self._archive = zipfile.ZipFile(self._sink, "w", zipfile.ZIP_DEFLATED)
+
+    def add(self, name: str, data: bytes) -> bytes:
+        """
+        Append a file to the archive
+
+        Args:
+            name: Path of the entry inside the archive
+            data: Entry content
+
+        Returns:
+            bytes: Archive bytes produced so far and not yet returned
+        """
+        self._archive.writestr(name, data)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """
+        Finish the archive
+
+        Returns:
+            bytes: Remaining archive bytes including the central directory
+        """
+        self._archive.close()
+        return self._sink.drain()
@@ -0,0 +1,206 @@
+"""
+Job Queue Store
+SQLite-backed job queue shared by the API and standalone workers
+"""
+
+import os
+import json
+import time
+import uuid
+from typing import Optional, Tuple
+
+from .sqlite_store import SQLiteStore, DATA_DIR
+
+# Queue Configuration
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", os.path.join(DATA_DIR, "jobs.sqlite3"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", 100))
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", 24 * 3600))
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", 900))
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """Raised when the queue already holds JOB_QUEUE_MAX pending jobs"""
+
+
+class JobStore(SQLiteStore):
+    """Durable FIFO job queue with status tracking"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL,
+            result TEXT,
+            error TEXT,
+            worker TEXT,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+    """
+
+    def __init__(self, path: str = JOB_STORE_PATH, max_queued: int = JOB_QUEUE_MAX):
+        """
+        Initialize the job store
+
+        Args:
+            path: SQLite database file
+            max_queued: Pending jobs accepted before enqueue is refused
+        """
+        self.max_queued = max_queued
+        super().__init__(path)
+
+    def enqueue(self, kind: str, payload: dict) -> str:
+        """
+        Add a job to the queue
+
+        Args:
+            kind: Operation name
+            payload: JSON-compatible operation arguments
+
+        Returns:
+            str: New job ID
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        job_id = uuid.uuid4().hex
+        with self._connection() as conn:
+            # Check and insert in one write transaction so concurrent API
+            # workers cannot overshoot the limit
+            conn.execute("BEGIN IMMEDIATE")
+            queued = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (JOB_QUEUED,)
+            ).fetchone()[0]
+            if queued >= self.max_queued:
+                raise QueueFullError(f"Job queue is full ({queued} pending)")
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, payload, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), JOB_QUEUED, time.time())
+            )
+        return job_id
+
+    def claim(self, worker: str) -> Optional[Tuple[str, str, dict]]:
+        """
+        Atomically take the oldest queued job
+
+        Args:
+            worker: Identifier of the claiming worker
+
+        Returns:
+            Optional[Tuple[str, str, dict]]: (job_id, kind, payload) or None if idle
+        """
+        with self._connection() as conn:
+            row = conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, started_at = ? "
+                "WHERE job_id = (SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1) "
+                "AND status = ? RETURNING job_id, kind, payload",
+                (JOB_RUNNING, worker, time.time(), JOB_QUEUED, JOB_QUEUED)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def complete(self, job_id: str, result: dict, worker: Optional[str] = None):
+        """Mark a job as succeeded with its result (only if worker still holds it, when given)"""
+        self._finish(job_id, worker, "result", JOB_SUCCEEDED, result)
+
+    def fail(self, job_id: str, error: dict, worker: Optional[str] = None):
+        """Mark a job as failed with an error description (only if worker still holds it, when given)"""
+        self._finish(job_id, worker, "error", JOB_FAILED, error)
+
+    def _finish(self, job_id: str, worker: Optional[str], column: str, status: str, outcome: dict):
+        query = f"UPDATE jobs SET status = ?, {column} = ?, finished_at = ? WHERE job_id = ?"
+        parameters = [status, json.dumps(outcome), time.time(), job_id]
+        if worker is not None:
+            # A job released by its worker (see release) may have been claimed again
+            query += " AND status = ? AND worker = ?"
+            parameters += [JOB_RUNNING, worker]
+        with self._connection() as conn:
+            conn.execute(query, parameters)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        Look up a job
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Optional[dict]: Job status record, or None if unknown
+        """
+        row = self._connection().execute(
+            "SELECT job_id, kind, status, result, error, created_at, started_at, finished_at, "
+            "(SELECT COUNT(*) FROM jobs AS ahead WHERE ahead.status = ? AND ahead.created_at < jobs.created_at) "
+            "FROM jobs WHERE job_id = ?",
+            (JOB_QUEUED, job_id)
+        ).fetchone()
+        if row is None:
+            return None
+
+        job = {
+            "job_id": row[0],
+            "kind": row[1],
+            "status": row[2],
+            "result": json.loads(row[3]) if row[3] else None,
+            "error": json.loads(row[4]) if row[4] else None,
+            "created_at": row[5],
+            "started_at": row[6],
+            "finished_at": row[7],
+        }
+        if row[2] == JOB_QUEUED:
+            job["queue_position"] = row[8] + 1
+        return job
+
+    def queued_count(self) -> int:
+        """Number of jobs waiting to be claimed"""
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = ?", (JOB_QUEUED,)
+        ).fetchone()[0]
+
+    def release(self, worker_prefix: str) -> int:
+        """
+        Requeue the running jobs of workers named "<worker_prefix>:<n>"
+
+        Used by in-process workers when they stop or restart, so their
+        jobs run again without waiting for JOB_STALE_SECONDS.
+
+        Args:
+            worker_prefix: Worker name prefix (host and process id)
+
+        Returns:
+            int: Number of jobs put back on the queue
+        """
+        with self._connection() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, started_at = NULL "
+                "WHERE status = ? AND substr(worker, 1, ?) = ?",
+                (JOB_QUEUED, JOB_RUNNING, len(worker_prefix) + 1, f"{worker_prefix}:")
+            ).rowcount
+
+    def recover(self) -> int:
+        """
+        Requeue jobs abandoned by crashed workers and drop old finished jobs
+
+        Returns:
+            int: Number of jobs put back on the queue
+        """
+        now = time.time()
+        with self._connection() as conn:
+            requeued = conn.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, started_at = NULL "
+                "WHERE status = ? AND started_at < ?",
+                (JOB_QUEUED, JOB_RUNNING, now - JOB_STALE_SECONDS)
+            ).rowcount
+            conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (JOB_SUCCEEDED, JOB_FAILED, now - JOB_TTL_SECONDS)
+            )
+        return requeued
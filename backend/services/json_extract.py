@@ -0,0 +1,158 @@
+"""
+Tolerant JSON Extraction
+Single-pass recovery of a JSON object from LLM output with formatting noise
+"""
+
+import re
+import json
+from typing import Any
+
+# Bare words normalized outside strings
+_LITERALS = {
+    "true": "true", "false": "false", "null": "null",
+    "True": "true", "False": "false", "None": "null",
+}
+_CLOSERS = {"{": "}", "[": "]"}
+_STRING_TERMINATORS = ",:}]"
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+
+
+class JSONExtractionError(ValueError):
+    """Raised when no JSON value can be recovered from the text"""
+
+
+def _next_significant(text: str, index: int) -> str:
+    """First non-whitespace character at or after index ("" at the end)"""
+    length = len(text)
+    while index < length and text[index] in " \t\r\n":
+        index += 1
+    return text[index] if index < length else ""
+
+
+def _drop_trailing_comma(out: list):
+    """Remove a comma (and whitespace after it) at the end of the output"""
+    index = len(out) - 1
+    while index >= 0 and out[index] in (" ", "\t", "\r", "\n"):
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index:]
+
+
+def extract_json(text: str) -> Any:
+    """
+    Extract the first JSON object or array from text in a single pass
+
+    Handles markdown fences and surrounding prose, single-quoted strings,
+    apostrophes and unescaped quotes inside strings, trailing commas,
+    Python literals, bare keys, raw newlines in strings and output that
+    was cut off before the closing brackets.
+
+    Args:
+        text: Raw LLM output
+
+    Returns:
+        Any: Parsed JSON value
+
+    Raises:
+        JSONExtractionError: If no JSON value could be recovered
+    """
+    if not text:
+        raise JSONExtractionError("Empty output")
+
+    # Reports are objects, so an object wins over a bracket in leading prose
+    index = text.find("{")
+    if index == -1:
+        index = text.find("[")
+    if index == -1:
+        raise JSONExtractionError("No JSON object found")
+
+    out = []
+    stack = []
+    quote = None
+    length = len(text)
+
+    while index < length:
+        char = text[index]
+
+        if quote is not None:
+            if char == "\\" and index + 1 < length:
+                escaped = text[index + 1]
+                # \' is not a valid JSON escape
+                out.append("'" if escaped == "'" else char + escaped)
+                index += 2
+                continue
+            if char == quote:
+                # A quote only closes the string when structure follows it
+                following = _next_significant(text, index + 1)
+                if following == "" or following in _STRING_TERMINATORS:
+                    out.append('"')
+                    quote = None
+                else:
+                    out.append('\\"' if char == '"' else char)
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            elif char == "\r":
+                pass
+            elif char == "\t":
+                out.append("\\t")
+            else:
+                out.append(char)
+            index += 1
+            continue
+
+        if char in "\"'":
+            quote = char
+            out.append('"')
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+            out.append(char)
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if stack:
+                stack.pop()
+            out.append(char)
+            if not stack:
+                break
+        elif char.isdigit() or char == "-":
+            # Numbers are copied whole, so an exponent is not read as a bare word
+            number = _NUMBER.match(text, index)
+            out.append(number.group() if number else char)
+            index = number.end() if number else index + 1
+            continue
+        elif char.isalpha() or char == "_":
+            end = index
+            while end < length and (text[end].isalnum() or text[end] in "_-"):
+                end += 1
+            word = text[index:end]
+            if word in _LITERALS:
+                out.append(_LITERALS[word])
+            elif _next_significant(text, end) == ":":
+                out.append(json.dumps(word))
+            else:
+                raise JSONExtractionError(f"Unexpected token '{word}'")
+            index = end
+            continue
+        elif char == "/" and text.startswith("//", index):
+            newline = text.find("\n", index)
+            index = length if newline == -1 else newline
+            continue
+        else:
+            out.append(char)
+        index += 1
+
+    # Output cut off mid-value: close the open string and brackets
+    if quote is not None:
+        out.append('"')
+    if stack:
+        _drop_trailing_comma(out)
+        if out and out[-1] == ":":
+            out.append("null")
+        out.extend(reversed(stack))
+
+    candidate = "".join(out)
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError as e:
+        raise JSONExtractionError(f"Unrecoverable JSON: {e}") from e
@@ -0,0 +1,76 @@
+"""
+Lazy Module Loading
+Defers heavy third-party imports until one of their attributes is first used
+"""
+
+import time
+import threading
+import importlib
+from types import ModuleType
+from typing import Dict, Optional
+
+from .metrics import REGISTRY, CallbackMetric
+
+# Seconds each deferred module took to import, keyed by module name
+LAZY_IMPORT_SECONDS: Dict[str, float] = {}
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access
+
+    Lets modules keep a module-level reference such as
+    `pypdf = lazy_import("pypdf")` while the import cost moves from
+    process start to the first request that actually needs the library.
+    """
+
+    def __init__(self, name: str, package: Optional[str] = None):
+        self._name = name
+        self._package = package
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ModuleType:
+        """Import the module if needed and return it"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self._name, self._package)
+                    LAZY_IMPORT_SECONDS[module.__name__] = time.perf_counter() - started
+                    self._module = module
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attribute: str):
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str, package: Optional[str] = None) -> LazyModule:
+    """
+    Reference a module without importing it yet
+
+    Args:
+        name: Module name (relative names need package, as in importlib)
+        package: Anchor package for relative names, usually __package__
+
+    Returns:
+        LazyModule: Proxy that imports the module on first attribute access
+    """
+    return LazyModule(name, package)
+
+
+REGISTRY.register(CallbackMetric(
+    "lazy_import_seconds",
+    "Time spent importing each deferred module on first use",
+    ("module",),
+    "gauge",
+    lambda: [((name,), seconds) for name, seconds in list(LAZY_IMPORT_SECONDS.items())]
+))
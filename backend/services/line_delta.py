@@ -0,0 +1,53 @@
+"""
+Line Deltas
+Compact line-level diffs for sending near-identical resume versions once
+"""
+
+import difflib
+from typing import List, Union
+
+# One hunk: [start, end, replacement_lines] replaces base lines [start:end)
+Hunk = List[Union[int, List[str]]]
+
+
+def line_delta(base: str, target: str) -> List[Hunk]:
+    """
+    Describe target as edits to base
+
+    Args:
+        base: Text both sides have (the final resume)
+        target: Text to encode (an intermediate version)
+
+    Returns:
+        List[Hunk]: Hunks in ascending order; empty if the texts are equal
+    """
+    base_lines = base.split("\n")
+    target_lines = target.split("\n")
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+    return [
+        [i1, i2, target_lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_line_delta(base: str, hunks: List[Hunk]) -> str:
+    """
+    Rebuild a text from base and the hunks line_delta produced
+
+    Args:
+        base: The base text the delta was computed against
+        hunks: Output of line_delta
+
+    Returns:
+        str: The encoded target text
+    """
+    base_lines = base.split("\n")
+    lines = []
+    position = 0
+    for start, end, replacement in hunks:
+        lines.extend(base_lines[position:start])
+        lines.extend(replacement)
+        position = end
+    lines.extend(base_lines[position:])
+    return "\n".join(lines)
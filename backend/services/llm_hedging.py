@@ -0,0 +1,214 @@
+"""
+Hedged LLM Requests
+Duplicates LLM calls of opted-in stages that outlive the stage's observed p95 and keeps the first answer
+"""
+
+import os
+import time
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from .metrics import REGISTRY, CallbackMetric
+
+# Hedging Configuration (opt-in; only list stages whose agents run at temperature 0)
+LLM_HEDGE_STAGES = frozenset(
+    stage.strip() for stage in os.getenv("LLM_HEDGE_STAGES", "").split(",") if stage.strip()
+)
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", 0.95))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", 20))
+LLM_HEDGE_WINDOW = int(os.getenv("LLM_HEDGE_WINDOW", 200))
+LLM_HEDGE_MAX_RATIO = float(os.getenv("LLM_HEDGE_MAX_RATIO", 0.1))
+LLM_HEDGE_BURST = float(os.getenv("LLM_HEDGE_BURST", 5))
+LLM_HEDGE_THREADS = int(os.getenv("LLM_HEDGE_THREADS", 32))
+
+_current_stage: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("llm_stage", default=None)
+
+
+def current_stage() -> Optional[str]:
+    """Pipeline stage whose LLM calls run in this context, if any"""
+    return _current_stage.get()
+
+
+@contextmanager
+def llm_stage(stage_name: str):
+    """Attribute the LLM calls of the enclosed block to a pipeline stage"""
+    context_token = _current_stage.set(stage_name)
+    try:
+        yield stage_name
+    finally:
+        _current_stage.reset(context_token)
+
+
+def _discarder(discard: Callable[[Any], None]) -> Callable[[Future], None]:
+    """Done callback releasing a losing copy's response"""
+    def callback(future: Future):
+        if future.exception() is None:
+            discard(future.result())
+    return callback
+
+
+class StageHedging:
+    """Latency window, hedge budget and counters of one stage"""
+
+    def __init__(self, window: int):
+        self.latencies = deque(maxlen=window)
+        self.budget = LLM_HEDGE_BURST
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.throttled = 0
+
+
+class LLMHedger:
+    """
+    Issues a duplicate of a slow LLM call and returns whichever copy finishes first
+
+    The hedge delay is the stage's LLM_HEDGE_QUANTILE latency over its last
+    LLM_HEDGE_WINDOW calls, so only the slowest few percent of calls are
+    duplicated. Every call earns LLM_HEDGE_MAX_RATIO of a hedge (up to
+    LLM_HEDGE_BURST saved), which caps the extra load even when the
+    provider slows down across the board. The losing copy is left to
+    finish and its response is discarded.
+    """
+
+    def __init__(self, stages: frozenset = LLM_HEDGE_STAGES):
+        self.stages = stages
+        self._stages: Dict[str, StageHedging] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def enabled(self, stage_name: Optional[str]) -> bool:
+        return stage_name is not None and stage_name in self.stages
+
+    def _stage(self, stage_name: str) -> StageHedging:
+        state = self._stages.get(stage_name)
+        if state is None:
+            with self._lock:
+                state = self._stages.setdefault(stage_name, StageHedging(LLM_HEDGE_WINDOW))
+        return state
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=LLM_HEDGE_THREADS, thread_name_prefix="llm-hedge")
+        return self._pool
+
+    def hedge_delay(self, stage_name: str) -> Optional[float]:
+        """Seconds after which a call of this stage is hedged (None until enough samples)"""
+        state = self._stage(stage_name)
+        with self._lock:
+            samples = sorted(state.latencies)
+        if len(samples) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * LLM_HEDGE_QUANTILE))]
+
+    def _timed(self, stage_name: str, send: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        response = send()
+        state = self._stage(stage_name)
+        with self._lock:
+            state.latencies.append(time.perf_counter() - started)
+        return response
+
+    def _submit(self, stage_name: str, send: Callable[[], Any]) -> Future:
+        # Copy the context so cancellation and tracing follow the call
+        context = contextvars.copy_context()
+        return self._get_pool().submit(context.run, self._timed, stage_name, send)
+
+    def _take_budget(self, state: StageHedging) -> bool:
+        with self._lock:
+            if state.budget >= 1:
+                state.budget -= 1
+                state.hedged += 1
+                return True
+            state.throttled += 1
+            return False
+
+    def send(self, stage_name: str, send: Callable[[], Any], discard: Callable[[Any], None]) -> Any:
+        """
+        Run a call, hedging it if it outlives the stage's hedge delay
+
+        Args:
+            stage_name: Stage the call belongs to
+            send: Performs the call and returns its complete response
+            discard: Releases the response of a losing copy
+
+        Returns:
+            Any: The first successful response
+        """
+        state = self._stage(stage_name)
+        with self._lock:
+            state.calls += 1
+            state.budget = min(state.budget + LLM_HEDGE_MAX_RATIO, LLM_HEDGE_BURST)
+
+        delay = self.hedge_delay(stage_name)
+        if delay is None:
+            return self._timed(stage_name, send)
+
+        primary = self._submit(stage_name, send)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not self._take_budget(state):
+            return primary.result()
+
+        hedge = self._submit(stage_name, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is not None:
+                if winner is hedge:
+                    with self._lock:
+                        state.hedge_wins += 1
+                for loser in pending:
+                    loser.add_done_callback(_discarder(discard))
+                return winner.result()
+        return primary.result()
+
+    def stats(self) -> Dict[str, dict]:
+        """Hedge counters and current delay per stage"""
+        stats = {}
+        for stage_name, state in list(self._stages.items()):
+            delay = self.hedge_delay(stage_name)
+            stats[stage_name] = {
+                "calls": state.calls,
+                "hedged": state.hedged,
+                "hedge_wins": state.hedge_wins,
+                "throttled": state.throttled,
+                "hedge_rate": round(state.hedged / state.calls, 4) if state.calls else 0.0,
+                "win_rate": round(state.hedge_wins / state.hedged, 4) if state.hedged else 0.0,
+                "hedge_delay_seconds": delay,
+            }
+        return stats
+
+
+llm_hedger = LLMHedger()
+
+
+def _hedge_samples(field: str):
+    """Read one stats() field per stage for /metrics"""
+    return lambda: [
+        ((stage_name,), stats[field])
+        for stage_name, stats in llm_hedger.stats().items()
+        if stats[field] is not None
+    ]
+
+
+for _field, _name, _type, _help in (
+    ("calls", "llm_hedge_eligible_calls_total", "counter", "LLM calls made by stages with hedging enabled"),
+    ("hedged", "llm_hedges_total", "counter", "Duplicate LLM calls issued"),
+    ("hedge_wins", "llm_hedge_wins_total", "counter", "Hedged calls answered first by the duplicate"),
+    ("throttled", "llm_hedges_throttled_total", "counter", "Hedges skipped because the load cap was reached"),
+    ("hedge_rate", "llm_hedge_rate", "gauge", "Fraction of calls that were hedged"),
+    ("win_rate", "llm_hedge_win_rate", "gauge", "Fraction of hedges whose duplicate answered first"),
+    ("hedge_delay_seconds", "llm_hedge_delay_seconds", "gauge", "Current hedge delay (observed latency quantile)"),
+):
+    REGISTRY.register(CallbackMetric(_name, _help, ("stage",), _type, _hedge_samples(_field)))
@@ -0,0 +1,177 @@
+"""
+Shared LLM HTTP Client
+Process-wide connection pool for LLM API traffic with keep-alive, HTTP/2 and per-host limits
+"""
+
+import os
+import logging
+import threading
+import importlib.util
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from .cancellation import OperationCancelled, current_token
+from .llm_hedging import current_stage, llm_hedger
+from .metrics import REGISTRY, LLM_REQUESTS_CANCELLED, CallbackMetric
+
+logger = logging.getLogger(__name__)
+
+# Pool Configuration (limits apply to each LLM host separately)
+LLM_HTTP_SHARED = os.getenv("LLM_HTTP_SHARED", "true").lower() in ("1", "true", "yes")
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", 32))
+LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", 16))
+LLM_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", 60))
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() in ("1", "true", "yes")
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class PerHostTransport(httpx.BaseTransport):
+    """
+    Transport keeping a separate connection pool per scheme, host and port
+
+    httpx limits apply to a whole pool, so one busy provider could take
+    every connection; a pool per host gives each its own limits. Requests
+    made under a cancelled token are refused before they are sent, which
+    also stops SDK retries and further agent iterations. Calls of stages
+    with hedging enabled go through llm_hedger.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool = False):
+        self.limits = limits
+        self.http2 = http2
+        self._transports: Dict[Tuple[str, str, Optional[int]], httpx.HTTPTransport] = {}
+        self._lock = threading.Lock()
+
+    def _transport_for(self, url: httpx.URL) -> httpx.HTTPTransport:
+        key = (url.scheme, url.host, url.port)
+        transport = self._transports.get(key)
+        if transport is None:
+            with self._lock:
+                transport = self._transports.get(key)
+                if transport is None:
+                    transport = httpx.HTTPTransport(limits=self.limits, http2=self.http2)
+                    self._transports[key] = transport
+        return transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        token = current_token()
+        if token is not None and token.cancelled:
+            LLM_REQUESTS_CANCELLED.inc(host=request.url.host)
+            token.raise_if_cancelled()
+        deadline = getattr(token, "deadline", None)
+        if deadline is not None:
+            # A call may not outlive the deadline of the stage sending it
+            remaining = deadline.remaining()
+            timeout = request.extensions.get("timeout") or {}
+            request.extensions["timeout"] = {
+                phase: remaining if timeout.get(phase) is None else min(timeout[phase], remaining)
+                for phase in ("connect", "read", "write", "pool")
+            }
+        transport = self._transport_for(request.url)
+        stage_name = current_stage()
+        try:
+            if not llm_hedger.enabled(stage_name):
+                return transport.handle_request(request)
+            return llm_hedger.send(stage_name, lambda: _read(transport.handle_request(request)), _close)
+        except httpx.TimeoutException:
+            # Cut off by the deadline: stop instead of letting the SDK retry
+            if deadline is not None and deadline.expired:
+                LLM_REQUESTS_CANCELLED.inc(host=request.url.host)
+                raise OperationCancelled("deadline")
+            raise
+
+    def connections(self) -> Dict[str, int]:
+        """Open connections per host"""
+        return {
+            f"{scheme}://{host}" + (f":{port}" if port else ""): _open_connections(transport)
+            for (scheme, host, port), transport in list(self._transports.items())
+        }
+
+    def close(self):
+        with self._lock:
+            for transport in self._transports.values():
+                transport.close()
+            self._transports.clear()
+
+
+def _open_connections(transport: httpx.HTTPTransport) -> int:
+    """Connections in a transport's httpcore pool (0 if the pool is not readable in this httpx version)"""
+    try:
+        return len(getattr(getattr(transport, "_pool", None), "connections", ()))
+    except TypeError:
+        return 0
+
+
+def _read(response: httpx.Response) -> httpx.Response:
+    """Load the body so a hedged call counts as finished only once it is complete"""
+    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+        response.read()
+    return response
+
+
+def _close(response: httpx.Response):
+    response.close()
+
+
+_client: Optional[httpx.Client] = None
+_transport: Optional[PerHostTransport] = None
+_client_lock = threading.Lock()
+
+
+def llm_http_client() -> httpx.Client:
+    """
+    The process-wide HTTP client for LLM calls
+
+    Created on first use so each worker process (including spawned pool
+    workers) gets its own pool. The client is thread-safe and is shared
+    by every agent's LLM, whose requests run on the llm executor threads.
+
+    Returns:
+        httpx.Client: Shared client
+    """
+    global _client, _transport
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http2 = LLM_HTTP2 and http2_available()
+                if LLM_HTTP2 and not http2:
+                    logger.warning("LLM_HTTP2 is enabled but the h2 package is missing; using HTTP/1.1")
+                limits = httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY
+                )
+                _transport = PerHostTransport(limits, http2=http2)
+                _client = httpx.Client(transport=_transport)
+    return _client
+
+
+def close_llm_http_client():
+    """Close pooled connections (on shutdown)"""
+    global _client, _transport
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            _transport = None
+
+
+def _connection_samples():
+    transport = _transport
+    if transport is None:
+        return []
+    return [((host,), count) for host, count in transport.connections().items()]
+
+
+REGISTRY.register(CallbackMetric(
+    "llm_http_connections",
+    "Open pooled connections to each LLM host",
+    ("host",),
+    "gauge",
+    _connection_samples
+))
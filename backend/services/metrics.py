@@ -0,0 +1,271 @@
+"""
+Metrics Service
+Low-overhead in-process counters and histograms in Prometheus text format
+"""
+
+import abc
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Latency buckets in seconds, from fast downloads to slow LLM stages
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+# Token count buckets for LLM prompts and completions
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+
+def _format_labels(label_names: Tuple[str, ...], label_values: Tuple[str, ...], extra: str = "") -> str:
+    """Render a Prometheus label set"""
+    pairs = [
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in zip(label_names, label_values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(abc.ABC):
+    """Base class holding per-label-set values behind a lock"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self._samples())
+        return lines
+
+    @abc.abstractmethod
+    def _samples(self) -> List[str]:
+        """Sample lines of the metric in Prometheus text format"""
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        """Consistent copy of the values, keyed by label values"""
+        with self._lock:
+            return dict(self._values)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {value}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {value}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution with sum and count"""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            bucket_counts = state[0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    bucket_counts[index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, (list(state[0]), state[1], state[2])) for key, state in self._values.items()]
+
+        lines = []
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {count}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """Metric whose samples are read from another component at scrape time"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...],
+        metric_type: str,
+        collect: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]
+    ):
+        super().__init__(name, documentation, label_names)
+        self.metric_type = metric_type
+        self._collect = collect
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {value}"
+            for key, value in self._collect()
+        ]
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for /metrics"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition body
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by endpoint",
+    ("method", "route", "status")
+))
+
+STAGE_DURATION = REGISTRY.register(Histogram(
+    "pipeline_stage_duration_seconds",
+    "Pipeline stage execution time",
+    ("stage", "outcome")
+))
+
+LLM_TOKENS = REGISTRY.register(Histogram(
+    "llm_stage_tokens",
+    "LLM tokens per stage execution",
+    ("stage", "direction"),
+    buckets=TOKEN_BUCKETS
+))
+
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result",
+    ("cache", "result")
+))
+
+REPORT_PARSES = REGISTRY.register(Counter(
+    "report_parses_total",
+    "LLM report parses by method (direct, local_repair, llm_repair, failed)",
+    ("report", "method")
+))
+
+JSON_PARSE_FALLBACKS = REGISTRY.register(Counter(
+    "json_parse_fallbacks_total",
+    "LLM reports that could not be parsed as JSON",
+    ("report",)
+))
+
+REQUESTS_CANCELLED = REGISTRY.register(Counter(
+    "http_requests_cancelled_total",
+    "Requests whose client disconnected before the response was ready",
+    ("route",)
+))
+
+STAGES_CANCELLED = REGISTRY.register(Counter(
+    "pipeline_stages_cancelled_total",
+    "Pipeline stages abandoned after cancellation (skipped before starting, or interrupted)",
+    ("stage", "state")
+))
+
+LLM_REQUESTS_CANCELLED = REGISTRY.register(Counter(
+    "llm_requests_cancelled_total",
+    "LLM HTTP requests not sent because their work was cancelled",
+    ("host",)
+))
+
+DEGRADED_STAGES = REGISTRY.register(Counter(
+    "pipeline_stages_degraded_total",
+    "Pipeline stages answered by a local fallback (LLM circuit open or deadline too close)",
+    ("stage", "reason")
+))
+
+
+def _cache_hit_ratios():
+    """Hit ratio per cache derived from CACHE_REQUESTS"""
+    totals = {}
+    for (cache, result), value in CACHE_REQUESTS.snapshot().items():
+        hits, lookups = totals.get(cache, (0, 0))
+        totals[cache] = (hits + (value if result == "hit" else 0), lookups + value)
+    return [((cache,), hits / lookups) for cache, (hits, lookups) in totals.items() if lookups]
+
+
+REGISTRY.register(CallbackMetric(
+    "cache_hit_ratio",
+    "Fraction of cache lookups that were hits",
+    ("cache",),
+    "gauge",
+    _cache_hit_ratios
+))
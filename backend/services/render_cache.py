@@ -0,0 +1,107 @@
+"""
+Render Cache Service
+LRU cache of generated document bytes keyed by content hash and render options
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+# Cache Configuration
+RENDER_CACHE_MAX_ENTRIES = int(os.getenv("RENDER_CACHE_MAX_ENTRIES", 128))
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+class RenderCache:
+    """Thread-safe LRU cache for rendered documents"""
+
+    def __init__(self, max_entries: int = RENDER_CACHE_MAX_ENTRIES, max_bytes: int = RENDER_CACHE_MAX_BYTES):
+        """
+        Initialize the render cache
+
+        Args:
+            max_entries: Maximum number of documents kept in memory
+            max_bytes: Maximum total size of cached documents
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(doc_format: str, text: str, **options) -> str:
+        """
+        Build a cache key from the document content and render options
+
+        Args:
+            doc_format: Output format identifier (e.g. "pdf", "docx")
+            text: Resume content being rendered
+            **options: Additional render options that affect the output
+
+        Returns:
+            str: Hex digest identifying this rendering
+        """
+        digest = hashlib.sha256()
+        digest.update(doc_format.encode("utf-8"))
+        for name in sorted(options):
+            digest.update(f"\x00{name}={options[name]}".encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve rendered bytes and mark them as recently used
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[bytes]: Cached document or None on a miss
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes):
+        """
+        Store rendered bytes, evicting least recently used entries as needed
+
+        Args:
+            key: Cache key from make_key
+            data: Rendered document bytes
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = data
+            self._size += len(data)
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        """Remove all cached documents"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Process-wide cache shared by all download endpoints
+render_cache = RenderCache()
@@ -0,0 +1,260 @@
+"""
+Result Store Service
+Persists optimization results and derived artifacts under a result ID
+"""
+
+import os
+import json
+import time
+import uuid
+import zlib
+from typing import Any, Dict, List, Optional, Sequence
+
+from .sqlite_store import SQLiteStore, DATA_DIR
+
+# Store Configuration
+RESULT_STORE_PATH = os.getenv("RESULT_STORE_PATH", os.path.join(DATA_DIR, "results.sqlite3"))
+RESULT_TTL_SECONDS = int(os.getenv("RESULT_TTL_SECONDS", 7 * 24 * 3600))
+PURGE_INTERVAL_SECONDS = 600
+
+# Dimensions usage can be aggregated by
+USAGE_DIMENSIONS = ("endpoint", "stage", "model", "outcome")
+
+
+def _pack(value: Any) -> bytes:
+    """Serialize a JSON-compatible value or raw bytes into a compressed blob"""
+    if isinstance(value, bytes):
+        return b"B" + zlib.compress(value, 6)
+    return b"J" + zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"), 6)
+
+
+def _unpack(blob: bytes) -> Any:
+    """Restore a value written by _pack"""
+    kind, data = blob[:1], zlib.decompress(blob[1:])
+    if kind == b"B":
+        return data
+    return json.loads(data)
+
+
+class ResultStore(SQLiteStore):
+    """Stores optimization results with TTL expiry, per-result artifacts and LLM usage records"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS results (
+            result_id TEXT PRIMARY KEY,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            payload BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS results_expiry ON results (expires_at);
+        CREATE TABLE IF NOT EXISTS artifacts (
+            result_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            PRIMARY KEY (result_id, name)
+        );
+        CREATE TABLE IF NOT EXISTS usage (
+            recorded_at REAL NOT NULL,
+            endpoint TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            model TEXT,
+            outcome TEXT NOT NULL,
+            attempts INTEGER NOT NULL,
+            prompt_tokens INTEGER NOT NULL,
+            completion_tokens INTEGER NOT NULL,
+            latency_seconds REAL NOT NULL,
+            cost_usd REAL,
+            run_id TEXT
+        );
+        CREATE INDEX IF NOT EXISTS usage_time ON usage (recorded_at);
+    """
+
+    def __init__(self, path: str = RESULT_STORE_PATH, ttl_seconds: int = RESULT_TTL_SECONDS):
+        """
+        Initialize the result store
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Lifetime of stored results
+        """
+        self.ttl_seconds = ttl_seconds
+        self._last_purge = 0.0
+        super().__init__(path)
+
+    def save_result(self, result: dict) -> str:
+        """
+        Store an optimization result
+
+        Args:
+            result: JSON-compatible result payload
+
+        Returns:
+            str: Newly assigned result ID
+        """
+        result_id = uuid.uuid4().hex
+        now = time.time()
+
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO results (result_id, created_at, expires_at, payload) VALUES (?, ?, ?, ?)",
+                (result_id, now, now + self.ttl_seconds, _pack(result))
+            )
+
+        self._purge_if_due(now)
+        return result_id
+
+    def get_result(self, result_id: str) -> Optional[dict]:
+        """
+        Load a stored result
+
+        Args:
+            result_id: ID returned by save_result
+
+        Returns:
+            Optional[dict]: Result payload, or None if unknown or expired
+        """
+        row = self._connection().execute(
+            "SELECT payload FROM results WHERE result_id = ? AND expires_at > ?",
+            (result_id, time.time())
+        ).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def save_artifact(self, result_id: str, name: str, value: Any):
+        """
+        Attach a derived artifact (rendered file, report, parsed form) to a result
+
+        Args:
+            result_id: Owning result
+            name: Artifact name, unique per result
+            value: JSON-compatible value or raw bytes
+        """
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts (result_id, name, payload) VALUES (?, ?, ?)",
+                (result_id, name, _pack(value))
+            )
+
+    def get_artifact(self, result_id: str, name: str) -> Optional[Any]:
+        """
+        Load a stored artifact
+
+        Args:
+            result_id: Owning result
+            name: Artifact name
+
+        Returns:
+            Optional[Any]: Stored value, or None if missing
+        """
+        row = self._connection().execute(
+            "SELECT payload FROM artifacts WHERE result_id = ? AND name = ?",
+            (result_id, name)
+        ).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def record_usage(self, endpoint: str, records: List[Dict[str, Any]], run_id: Optional[str] = None):
+        """
+        Append the stage usage records of one request
+
+        Args:
+            endpoint: Operation that ran the stages (optimize, quality_score, ...)
+            records: Records built by services.usage.stage_record
+            run_id: Pipeline run the stages belong to, if any
+        """
+        now = time.time()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO usage (recorded_at, endpoint, stage, model, outcome, attempts, prompt_tokens, "
+                "completion_tokens, latency_seconds, cost_usd, run_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        now, endpoint, record["stage"], record["model"], record["outcome"], record["attempts"],
+                        record["prompt_tokens"], record["completion_tokens"], record["latency_seconds"],
+                        record["cost_usd"], run_id
+                    )
+                    for record in records
+                ]
+            )
+
+    def usage_summary(
+        self,
+        since: float,
+        until: Optional[float] = None,
+        group_by: Sequence[str] = ("stage",),
+        window_seconds: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate recorded usage
+
+        Args:
+            since: Start of the period (epoch seconds)
+            until: End of the period (defaults to now)
+            group_by: Dimensions from USAGE_DIMENSIONS to break totals down by
+            window_seconds: Also break totals down into windows of this length
+
+        Returns:
+            List[Dict[str, Any]]: One row per group with call, token, cost and
+                latency totals, ordered by window and then by cost
+        """
+        unknown = [dimension for dimension in group_by if dimension not in USAGE_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown usage dimension(s): {', '.join(unknown)}")
+        columns = list(group_by)
+        if window_seconds:
+            columns.insert(0, f"CAST(recorded_at / {int(window_seconds)} AS INTEGER) * {int(window_seconds)}")
+        names = (["window_start"] if window_seconds else []) + list(group_by)
+        selected = "".join(f"{column}, " for column in columns)
+        grouping = f" GROUP BY {', '.join(columns)}" if columns else ""
+        ordering = "1, " if window_seconds else ""
+        rows = self._connection().execute(
+            f"SELECT {selected}COUNT(*), SUM(attempts), SUM(prompt_tokens), SUM(completion_tokens), "
+            "SUM(cost_usd), SUM(cost_usd IS NULL AND prompt_tokens + completion_tokens > 0), "
+            "AVG(latency_seconds), MAX(latency_seconds) "
+            f"FROM usage WHERE recorded_at >= ? AND recorded_at < ?{grouping} "
+            f"ORDER BY {ordering}SUM(cost_usd) DESC",
+            (since, until if until is not None else time.time())
+        ).fetchall()
+
+        summary = []
+        for row in rows:
+            keys, totals = row[:len(names)], row[len(names):]
+            calls, attempts, prompt_tokens, completion_tokens, cost, unpriced, mean_latency, max_latency = totals
+            summary.append(dict(
+                zip(names, keys),
+                stage_runs=calls,
+                llm_attempts=attempts or 0,
+                prompt_tokens=prompt_tokens or 0,
+                completion_tokens=completion_tokens or 0,
+                cost_usd=round(cost or 0.0, 6),
+                unpriced_runs=unpriced or 0,
+                mean_latency_seconds=round(mean_latency or 0.0, 4),
+                max_latency_seconds=round(max_latency or 0.0, 4)
+            ))
+        return summary
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired results, their artifacts and usage records older than the TTL
+
+        Returns:
+            int: Number of results removed
+        """
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM artifacts WHERE result_id IN "
+                "(SELECT result_id FROM results WHERE expires_at <= ?)",
+                (now,)
+            )
+            removed = conn.execute("DELETE FROM results WHERE expires_at <= ?", (now,)).rowcount
+            conn.execute("DELETE FROM usage WHERE recorded_at <= ?", (now - self.ttl_seconds,))
+        self._last_purge = now
+        return removed
+
+    def _purge_if_due(self, now: float):
+        """Run expiry at most once per PURGE_INTERVAL_SECONDS"""
+        if now - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self.purge_expired()
+
+
+# Process-wide store used by the API
+result_store = ResultStore()
@@ -0,0 +1,54 @@
+"""
+SQLite Storage Foundation
+Shared connection handling for the local durable stores
+"""
+
+import os
+import sqlite3
+import threading
+
+# Directory holding the local SQLite databases
+DATA_DIR = os.getenv("RESUMEFORGE_DATA_DIR", "data")
+
+
+class SQLiteStore:
+    """
+    Base class for small SQLite-backed stores
+
+    Each thread gets its own connection. Databases run in WAL mode so API
+    workers and background processes can read while another writes.
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, path: str):
+        """
+        Initialize the store and create its schema
+
+        Args:
+            path: Database file path (":memory:" is not supported)
+        """
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use
+
+        Returns:
+            sqlite3.Connection: Connection usable as a transaction context manager
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,264 @@
+"""
+Request Tracing
+Lightweight per-request spans and opt-in cProfile/tracemalloc capture
+"""
+
+import os
+import re
+import time
+import uuid
+import pstats
+import cProfile
+import functools
+import threading
+import contextvars
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+from .sqlite_store import DATA_DIR
+
+# Finished traces kept in memory for GET /api/traces/{trace_id}
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", 256))
+
+# The X-Debug-Profile request header is ignored unless this is enabled
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(DATA_DIR, "profiles"))
+PROFILE_MODES = ("cprofile", "tracemalloc")
+
+_TRACE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("trace", default=None)
+
+
+class Trace:
+    """Spans recorded while handling one request"""
+
+    def __init__(self, trace_id: Optional[str] = None, profile_mode: Optional[str] = None):
+        """
+        Initialize a trace
+
+        Args:
+            trace_id: Client-supplied ID (a new one is generated when invalid)
+            profile_mode: "cprofile", "tracemalloc" or None
+        """
+        self.trace_id = trace_id if trace_id and _TRACE_ID_PATTERN.match(trace_id) else uuid.uuid4().hex
+        self.profile_mode = profile_mode
+        self.started = time.time()
+        self.spans: List[dict] = []
+        self.profilers: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def add_span(self, name: str, started: float, duration: float, attrs: dict):
+        """Record a finished span (started is a wall-clock timestamp)"""
+        span_record = {
+            "name": name,
+            "start_ms": round((started - self.started) * 1000, 3),
+            "duration_ms": round(duration * 1000, 3),
+        }
+        if attrs:
+            span_record["attrs"] = attrs
+        with self._lock:
+            self.spans.append(span_record)
+
+    def merge_spans(self, spans: List[dict], started: float):
+        """Add spans recorded by a child trace that started at the given time"""
+        offset = round((started - self.started) * 1000, 3)
+        with self._lock:
+            for span_record in spans:
+                self.spans.append(dict(span_record, start_ms=round(span_record["start_ms"] + offset, 3)))
+
+    def profile_call(self, fn: Callable, *args) -> Any:
+        """Run fn under a cProfile profiler attached to this trace"""
+        profiler = cProfile.Profile()
+        with self._lock:
+            self.profilers.append(profiler)
+        return profiler.runcall(fn, *args)
+
+    def server_timing(self) -> str:
+        """Summarize span durations as a Server-Timing header value"""
+        totals = OrderedDict()
+        with self._lock:
+            for span_record in self.spans:
+                totals[span_record["name"]] = totals.get(span_record["name"], 0) + span_record["duration_ms"]
+        return ", ".join(f"{name};dur={duration:.1f}" for name, duration in totals.items())
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span_record: span_record["start_ms"])
+        return {
+            "trace_id": self.trace_id,
+            "started": self.started,
+            "spans": spans
+        }
+
+
+def current_trace() -> Optional[Trace]:
+    """Trace of the request being handled, if any"""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Time a block as a span of the current trace
+
+    Outside a traced request this only costs a context variable lookup.
+
+    Args:
+        name: Span name (a Server-Timing token, e.g. "stage.sanitization")
+        **attrs: Extra attributes stored with the span
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.time()
+    start_counter = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, started, time.perf_counter() - start_counter, attrs)
+
+
+def traced(name: str) -> Callable:
+    """Decorator recording each call of a function as a span"""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def activate(trace: Trace):
+    """Make a trace current for the enclosed block"""
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def bind_to_thread(fn: Callable, *args) -> Callable:
+    """
+    Wrap a call so it runs in a worker thread under the caller's trace
+
+    run_in_executor does not carry context variables into the pool, so
+    the current context is copied; profiled requests also get a profiler
+    for the worker thread.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return functools.partial(fn, *args)
+    context = contextvars.copy_context()
+    if trace.profile_mode == "cprofile":
+        return functools.partial(context.run, trace.profile_call, fn, *args)
+    return functools.partial(context.run, fn, *args)
+
+
+def run_in_child_trace(trace_id: str, fn: Callable, *args) -> tuple:
+    """
+    Run fn in a worker process under a fresh trace
+
+    Returns:
+        tuple: (result, started, spans) for Trace.merge_spans in the parent
+    """
+    trace = Trace(trace_id)
+    with activate(trace):
+        result = fn(*args)
+    return result, trace.started, trace.spans
+
+
+class RecentTraces:
+    """Bounded in-memory buffer of finished traces"""
+
+    def __init__(self, max_entries: int = TRACE_BUFFER_SIZE):
+        self.max_entries = max_entries
+        self._traces = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, trace: Trace, **summary):
+        """Keep a trace; spans added later (e.g. by streamed bodies) still show up"""
+        with self._lock:
+            self._traces[trace.trace_id] = (trace, summary)
+            self._traces.move_to_end(trace.trace_id)
+            while len(self._traces) > self.max_entries:
+                self._traces.popitem(last=False)
+
+    def get(self, trace_id: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._traces.get(trace_id)
+        if entry is None:
+            return None
+        trace, summary = entry
+        return dict(trace.to_dict(), **summary)
+
+
+recent_traces = RecentTraces()
+
+
+class RequestProfiler:
+    """
+    Captures a cProfile or tracemalloc snapshot for one request
+
+    Only one request is profiled at a time; concurrent profile requests
+    are served normally without a capture.
+    """
+
+    _busy = threading.Lock()
+
+    def __init__(self, trace: Trace):
+        self.trace = trace
+        self.mode = trace.profile_mode
+        self.active = False
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+
+    def start(self) -> bool:
+        """Begin capturing; returns False when another request holds the profiler"""
+        if not RequestProfiler._busy.acquire(blocking=False):
+            self.trace.profile_mode = None
+            return False
+        self.active = True
+        if self.mode == "cprofile":
+            # Event loop thread; worker threads get their own via bind_to_thread
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            self._started_tracemalloc = True
+        return True
+
+    def stop(self) -> Optional[str]:
+        """
+        Stop capturing and write the result under PROFILE_DIR
+
+        Returns:
+            Optional[str]: Name of the written file
+        """
+        if not self.active:
+            return None
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            if self.mode == "cprofile":
+                self._profiler.disable()
+                filename = f"{self.trace.trace_id}.prof"
+                stats = pstats.Stats(self._profiler)
+                for profiler in self.trace.profilers:
+                    stats.add(profiler)
+                stats.dump_stats(os.path.join(PROFILE_DIR, filename))
+            else:
+                filename = f"{self.trace.trace_id}.tracemalloc"
+                tracemalloc.take_snapshot().dump(os.path.join(PROFILE_DIR, filename))
+                if self._started_tracemalloc:
+                    tracemalloc.stop()
+            return filename
+        finally:
+            self.active = False
+            RequestProfiler._busy.release()
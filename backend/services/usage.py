@@ -0,0 +1,117 @@
+"""
+LLM Usage Accounting
+Token, latency and estimated cost records for pipeline stages
+"""
+
+import os
+import json
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import REGISTRY, Counter
+
+# Prices in USD per million (input, output) tokens; LLM_PRICES adds or overrides
+# models as JSON, e.g. {"gpt-4o-mini": [0.15, 0.6]}
+DEFAULT_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+LLM_PRICES = dict(DEFAULT_PRICES, **{
+    model: tuple(prices) for model, prices in json.loads(os.getenv("LLM_PRICES", "{}")).items()
+})
+
+LLM_COST = REGISTRY.register(Counter(
+    "llm_cost_usd_total",
+    "Estimated LLM spend in USD",
+    ("stage", "model")
+))
+
+
+def model_price(model: Optional[str]) -> Optional[Tuple[float, float]]:
+    """Per-million-token prices of a model, ignoring provider prefixes such as "openai/" """
+    if not model:
+        return None
+    return LLM_PRICES.get(model) or LLM_PRICES.get(model.rsplit("/", 1)[-1])
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """
+    Estimate the cost of a model call
+
+    Args:
+        model: Model name
+        prompt_tokens: Input tokens
+        completion_tokens: Output tokens
+
+    Returns:
+        Optional[float]: USD, or None if the model has no known price
+    """
+    prices = model_price(model)
+    if prices is None:
+        return None
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+def stage_record(
+    stage: str,
+    outcome: str,
+    latency_seconds: float,
+    model: Optional[str] = None,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    attempts: int = 0
+) -> Dict[str, object]:
+    """
+    Build the usage record of one stage run and count its cost
+
+    Args:
+        stage: Pipeline stage name
+        outcome: Stage outcome (success, checkpoint, degraded, error, ...)
+        latency_seconds: Wall time of the stage including retries
+        model: Model the stage's agents use
+        prompt_tokens: Input tokens over all attempts
+        completion_tokens: Output tokens over all attempts
+        attempts: LLM attempts made (0 when none were needed)
+
+    Returns:
+        Dict[str, object]: JSON-compatible usage record
+    """
+    cost = estimate_cost(model, prompt_tokens, completion_tokens)
+    if cost:
+        LLM_COST.inc(cost, stage=stage, model=model)
+    return {
+        "stage": stage,
+        "model": model,
+        "outcome": outcome,
+        "attempts": attempts,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "latency_seconds": round(latency_seconds, 4),
+        "cost_usd": round(cost, 6) if cost is not None else None,
+    }
+
+
+def summarize_usage(records: List[Dict[str, object]]) -> Dict[str, object]:
+    """
+    Roll stage records up into a response usage block
+
+    Args:
+        records: Output of stage_record for each stage of a request
+
+    Returns:
+        Dict[str, object]: Token, latency and cost totals plus the stage records
+    """
+    prompt_tokens = sum(record["prompt_tokens"] for record in records)
+    completion_tokens = sum(record["completion_tokens"] for record in records)
+    costs = [record["cost_usd"] for record in records if record["prompt_tokens"] or record["completion_tokens"]]
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "latency_seconds": round(sum(record["latency_seconds"] for record in records), 4),
+        # Unknown when any stage that used tokens runs a model without a price
+        "cost_usd": round(sum(costs), 6) if None not in costs else None,
+        "stages": records,
+    }
@@ -11,7 +11,7 @@ import {
   Target
 } from 'lucide-react'
 import toast from 'react-hot-toast'
-import { downloadPDF, downloadDOCX } from '../services/api'
+import { downloadPDF, downloadDOCX, exportResume } from '../services/api'
 
 export default function ResultsSection({ results, onReset }) {
   const [activeTab, setActiveTab] = useState('enhanced')
@@ -26,7 +26,7 @@ export default function ResultsSection({ results, onReset }) {
   const handleDownloadPDF = async () => {
     const toastId = toast.loading('Generating PDF...')
     try {
-      await downloadPDF(results.enhanced)
+      await downloadPDF(results.enhanced, 'resume.pdf', results.result_id)
       toast.success('PDF downloaded successfully!', { id: toastId })
     } catch (error) {
       toast.error('Failed to download PDF', { id: toastId })
@@ -36,13 +36,23 @@ export default function ResultsSection({ results, onReset }) {
   const handleDownloadDOCX = async () => {
     const toastId = toast.loading('Generating DOCX...')
     try {
-      await downloadDOCX(results.enhanced)
+      await downloadDOCX(results.enhanced, 'resume.docx', results.result_id)
       toast.success('DOCX downloaded successfully!', { id: toastId })
     } catch (error) {
       toast.error('Failed to download DOCX', { id: toastId })
     }
   }
 
+  const handleDownloadAll = async () => {
+    const toastId = toast.loading('Generating PDF and DOCX...')
+    try {
+      await exportResume(results.enhanced, ['pdf', 'docx'], 'resume', results.result_id)
+      toast.success('Resume bundle downloaded successfully!', { id: toastId })
+    } catch (error) {
+      toast.error('Failed to download resume bundle', { id: toastId })
+    }
+  }
+
   const renderEvaluationContent = () => {
     const evaluation = results.evaluation
 
@@ -175,6 +185,10 @@ export default function ResultsSection({ results, onReset }) {
             <Download className="w-4 h-4" />
             Download DOCX
           </button>
+          <button onClick={handleDownloadAll} className="btn-secondary flex items-center gap-2">
+            <Download className="w-4 h-4" />
+            Download All (ZIP)
+          </button>
           <button onClick={onReset} className="btn-secondary flex items-center gap-2">
             <RefreshCw className="w-4 h-4" />
             New Resume
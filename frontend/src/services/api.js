@@ -66,18 +66,40 @@ export const getQualityScore = async (resumeText, jobTitle) => {
 }
 
 /**
- * Download resume as PDF
+ * Send a request for a stored result, or for the resume text without one
+ *
+ * A stored result avoids re-uploading the whole resume. Results expire
+ * (RESULT_TTL), so a 404 for the result ID is retried with the resume text.
  */
-export const downloadPDF = async (resumeText, filename = 'resume.pdf') => {
-  const formData = new FormData()
-  formData.append('resume_text', resumeText)
-  formData.append('filename', filename)
+const withStoredResult = async (resumeText, resultId, send) => {
+  if (!resultId) {
+    return send({ resume_text: resumeText })
+  }
+  try {
+    return await send({ result_id: resultId })
+  } catch (error) {
+    if (error.response?.status !== 404 || !resumeText) {
+      throw error
+    }
+    return send({ resume_text: resumeText })
+  }
+}
 
-  const response = await apiClient.post('/api/download/pdf', formData, {
-    responseType: 'blob',
-    headers: {
-      'Content-Type': 'multipart/form-data',
-    },
+/**
+ * Download resume as PDF
+ */
+export const downloadPDF = async (resumeText, filename = 'resume.pdf', resultId = null) => {
+  const response = await withStoredResult(resumeText, resultId, (source) => {
+    const formData = new FormData()
+    Object.entries(source).forEach(([field, value]) => formData.append(field, value))
+    formData.append('filename', filename)
+
+    return apiClient.post('/api/download/pdf', formData, {
+      responseType: 'blob',
+      headers: {
+        'Content-Type': 'multipart/form-data',
+      },
+    })
   })
 
   // Create download link
@@ -94,16 +116,18 @@ export const downloadPDF = async (resumeText, filename = 'resume.pdf') => {
 /**
  * Download resume as DOCX
  */
-export const downloadDOCX = async (resumeText, filename = 'resume.docx') => {
-  const formData = new FormData()
-  formData.append('resume_text', resumeText)
-  formData.append('filename', filename)
-
-  const response = await apiClient.post('/api/download/docx', formData, {
-    responseType: 'blob',
-    headers: {
-      'Content-Type': 'multipart/form-data',
-    },
+export const downloadDOCX = async (resumeText, filename = 'resume.docx', resultId = null) => {
+  const response = await withStoredResult(resumeText, resultId, (source) => {
+    const formData = new FormData()
+    Object.entries(source).forEach(([field, value]) => formData.append(field, value))
+    formData.append('filename', filename)
+
+    return apiClient.post('/api/download/docx', formData, {
+      responseType: 'blob',
+      headers: {
+        'Content-Type': 'multipart/form-data',
+      },
+    })
   })
 
   // Create download link
@@ -117,4 +141,31 @@ export const downloadDOCX = async (resumeText, filename = 'resume.docx') => {
   window.URL.revokeObjectURL(url)
 }
 
+/**
+ * Export resume in one or more formats (zip bundle when several are requested)
+ */
+export const exportResume = async (resumeText, formats = ['pdf', 'docx'], filename = 'resume', resultId = null) => {
+  const response = await withStoredResult(resumeText, resultId, (source) => (
+    apiClient.post('/api/export', {
+      ...source,
+      formats,
+      filename,
+    }, {
+      responseType: 'blob',
+    })
+  ))
+
+  const downloadName = formats.length === 1 ? `${filename}.${formats[0]}` : `${filename}.zip`
+
+  // Create download link
+  const url = window.URL.createObjectURL(new Blob([response.data]))
+  const link = document.createElement('a')
+  link.href = url
+  link.setAttribute('download', downloadName)
+  document.body.appendChild(link)
+  link.click()
+  link.remove()
+  window.URL.revokeObjectURL(url)
+}
+
 export default apiClient